@@ -1,17 +1,31 @@
 import logging
 import traceback
 import discord
-import aiohttp
 import asyncio
 import io
-import undetected_chromedriver as uc
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from discord.ext import commands, bridge
+import os
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from discord.ext import commands, bridge, tasks
 from discord import Option
 
-from config import ALLOWED_GUILD_IDS, API_TIMEOUT, MINECRAFT_WIKI_BASE
+from config import (
+    ALLOWED_GUILD_IDS,
+    MINECRAFT_WIKI_BASE,
+    DYNMAP_URL,
+    DYNMAP_BACKEND,
+    DYNMAP_MAX_ZOOM,
+    MC_STATUS_POLL_INTERVAL,
+)
 from utils.embed_builder import EmbedBuilder
+from utils.dynmap import DynmapBrowser
+from utils.dynmap_tiles import DynmapTileRenderer
+from utils.mc_wiki import WikiClient
+from utils.mc_registry import MinecraftRegistry, render_recipe, prettify, strip_namespace
+from utils.mojang import ProfileCache
+from utils.mc_status import ServerStatusPoller, flatten_motd, render_status_graph
+from utils.workers import run_in_process
 
 logger = logging.getLogger(__name__)
 class MinecraftCog(commands.Cog):
@@ -19,7 +33,19 @@ class MinecraftCog(commands.Cog):
         self.bot = bot
         self.session = bot.session
         self.wiki_base_url = MINECRAFT_WIKI_BASE
+        self.dynmap_browser = DynmapBrowser()
+        self.dynmap_tiles = DynmapTileRenderer(bot.session)
+        self.wiki = WikiClient(bot.session)
+        self.registry = MinecraftRegistry().load()
+        self.server_status = ServerStatusPoller()
+        self.profiles = ProfileCache(bot.session)
+        self.poll_server_status.start()
         super().__init__()
+
+    def cog_unload(self) -> None:
+        self.poll_server_status.cancel()
+        self.bot.loop.create_task(self.dynmap_browser.close())
+
     @bridge.bridge_group(name="mc", description="Minecraft commands")
     async def mc(self, ctx: discord.ApplicationContext):
         if ctx.invoked_subcommand is None:
@@ -45,22 +71,26 @@ class MinecraftCog(commands.Cog):
     @mc.command(name="recipe", description="Get crafting recipe from Minecraft Wiki")
     async def mc_recipe(self, ctx: discord.ApplicationContext, item: str = Option(str, "The item to get recipe for")):
         await ctx.defer()
+        recipes = self.registry.find_recipes(item)
+        if recipes:
+            try:
+                embed, file = await self.create_recipe_embed(recipes[0], len(recipes))
+                await ctx.followup.send(embed=embed, file=file)
+                return
+            except Exception as e:
+                logger.error(f"Error rendering recipe {recipes[0]['id']}: {e}", exc_info=True)
+
         item_name = item.replace(" ", "_").title()
-        wiki_url = f"{self.wiki_base_url}/{item_name}"
+        wiki_url = self.wiki.page_url(item_name)
 
-        recipe_image_url = None
         try:
-            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(wiki_url) as resp:
-                    if resp.status != 200:
-                        await ctx.followup.send(f"❌ Could not fetch wiki page for `{item}`.")
-                        return
-                    html = await resp.text()
-                    soup = BeautifulSoup(html, "html.parser")
-                    recipe_image_url = self._find_recipe_image(soup)
-        except Exception:
-            recipe_image_url = None
+            found, recipe_image_url = await self.wiki.get_recipe_image(item_name)
+        except Exception as e:
+            logger.error(f"Error looking up recipe for {item}: {e}", exc_info=True)
+            found, recipe_image_url = True, None
+        if not found:
+            await ctx.followup.send(f"❌ Could not fetch wiki page for `{item}`.")
+            return
 
         embed = discord.Embed(
             title=f"Crafting Recipe for {item.title()}",
@@ -80,6 +110,10 @@ class MinecraftCog(commands.Cog):
         ctx: discord.ApplicationContext,
         name: str = Option(str, "Advancement name")
     ):
+        entry = self.registry.find("advancement", name)
+        if entry:
+            await ctx.respond(embed=self.create_advancement_embed(entry))
+            return
         url = f"https://minecraft.wiki/w/{name.replace(' ', '_')}"
         embed = discord.Embed(
             title=f"🏆 Info on advancement {name.title()}",
@@ -94,6 +128,10 @@ class MinecraftCog(commands.Cog):
         ctx: discord.ApplicationContext,
         name: str = Option(str, "Enchantment name")
     ):
+        entry = self.registry.find("enchantment", name)
+        if entry:
+            await ctx.respond(embed=self.create_enchant_embed(entry))
+            return
         url = f"https://minecraft.wiki/w/{name.replace(' ', '_')}"
         embed = discord.Embed(
             title=f"✨ Enchantment {name.title()} details",
@@ -108,6 +146,10 @@ class MinecraftCog(commands.Cog):
         ctx: discord.ApplicationContext,
         name: str = Option(str, "Biome name")
     ):
+        entry = self.registry.find("biome", name)
+        if entry:
+            await ctx.respond(embed=self.create_biome_embed(entry))
+            return
         url = f"https://minecraft.wiki/w/{name.replace(' ', '_')}"
         embed = discord.Embed(
             title=f"🌲 Biome {name.title()} info",
@@ -122,6 +164,10 @@ class MinecraftCog(commands.Cog):
         ctx: discord.ApplicationContext,
         name: str = Option(str, "Structure name")
     ):
+        entry = self.registry.find("structure", name)
+        if entry:
+            await ctx.respond(embed=self.create_structure_embed(entry))
+            return
         url = f"https://minecraft.wiki/w/{name.replace(' ', '_')}"
         embed = discord.Embed(
             title=f"🏛️ Structure {name.title()}",
@@ -138,15 +184,12 @@ class MinecraftCog(commands.Cog):
     ):
         await ctx.defer()
         try:
-            headers = {"User-Agent": "Mozilla/5.0"}
-            async with self.session.get(
-                f"https://api.mojang.com/users/profiles/minecraft/{username}", headers=headers
-            ) as resp:
-                if resp.status != 200:
-                    await ctx.followup.send("❌ Could not find that player.")
-                    return
-                data = await resp.json()
-                uuid = data["id"]
+            profile = await self.profiles.resolve(username)
+            if not profile:
+                await ctx.followup.send("❌ Could not find that player.")
+                return
+            uuid = profile["id"]
+            username = profile["name"]
 
             head_url = f"https://minotar.net/helm/{uuid}/128.png"
             skin_url = f"https://visage.surgeplay.com/full/512/{uuid}.png"
@@ -164,7 +207,13 @@ class MinecraftCog(commands.Cog):
     
     @mc.command(name="dynmap", description="Get the VDSMP dynmap")
     @commands.cooldown(1, 30, commands.BucketType.guild)
-    async def dynmap (self, ctx: discord.ApplicationContext):
+    async def dynmap(
+        self,
+        ctx: discord.ApplicationContext,
+        x: int = Option(int, "Block X to center on", required=False, default=0),
+        z: int = Option(int, "Block Z to center on", required=False, default=0),
+        zoom: int = Option(int, f"Zoom-out level (0-{DYNMAP_MAX_ZOOM})", required=False, default=0, min_value=0, max_value=DYNMAP_MAX_ZOOM)
+    ):
         if ctx.guild and ctx.guild.id not in ALLOWED_GUILD_IDS:
             await ctx.respond(
                 "❌ This command is not available in this server.",
@@ -173,13 +222,20 @@ class MinecraftCog(commands.Cog):
             return
         await ctx.defer()
         try:
-            file = await self.get_dynmap_screenshot()
+            file = None
+            if DYNMAP_BACKEND == "tiles":
+                file = await self.get_dynmap_render(x, z, zoom)
+            rendered = file is not None
+            if file is None:
+                file = await self.get_dynmap_screenshot()
             embed = discord.Embed(
                 title="🌍 VDSMP Dynmap",
-                description="[LIVE DYNMAP](http://vdsmp.mc.gg:8809/)",
+                description=f"[LIVE DYNMAP]({DYNMAP_URL})",
                 color=0x8B0000
             )
-            embed.set_image(url="attachment://dynmap.png")
+            embed.set_image(url="attachment://dynmap.jpg")
+            if rendered:
+                embed.set_footer(text=f"Centered on {x}, {z} • zoom {zoom}")
             await ctx.respond(embed=embed, file=file)
         except Exception as e:
             tb = traceback.format_exc()
@@ -193,7 +249,11 @@ class MinecraftCog(commands.Cog):
             await ctx.respond(f"⚠️ Error: {error}")
 
     @mc.command(name="serverstatus", description="Get the status of the VDSMP")
-    async def mc_serverstatus(self, ctx: discord.ApplicationContext):
+    async def mc_serverstatus(
+        self,
+        ctx: discord.ApplicationContext,
+        graph: bool = Option(bool, "Show an uptime and players graph", required=False, default=False)
+    ):
         if ctx.guild and ctx.guild.id not in ALLOWED_GUILD_IDS:
             await ctx.respond(
                 "❌ This command is not available in this server.",
@@ -201,52 +261,63 @@ class MinecraftCog(commands.Cog):
             )
             return
 
-        await ctx.defer()
-
-        server_ip = "vdsmp.mc.gg"
+        history = self.server_status.history
+        latest = history.latest()
+        stale = latest is None or time.time() - latest[0] > MC_STATUS_POLL_INTERVAL * 2
+        if stale or graph:
+            await ctx.defer()
 
         try:
-            async with self.session.get(f"https://api.mcsrvstat.us/2/{server_ip}") as resp:
-                if resp.status != 200:
-                    await ctx.followup.send("❌ Error contacting the status API.")
-                    return
-                data = await resp.json()
-
-            if not data.get("online", False):
-                await ctx.followup.send("❌ The server is currently **offline**.")
-                return
-
-            # MOTD
-            motd = "No MOTD"
-            motd_data = data.get("motd", {})
-            if motd_data:
-                motd_clean = motd_data.get("clean")
-                if motd_clean and isinstance(motd_clean, list):
-                    motd = " ".join(motd_clean)
+            if stale:
+                # poller hasn't produced a sample yet (or died), take one now
+                await self.server_status.poll()
+            timestamp, players, latency = history.latest()
 
-            players = data.get("players", {})
-            online = players.get("online", 0)
-            max_players = players.get("max", 0)
-            version = data.get("version", "Unknown")
+            file = None
+            if graph:
+                image = await run_in_process(render_status_graph, history.samples())
+                file = discord.File(fp=io.BytesIO(image), filename="status.png")
 
-            embed = discord.Embed(
-                title="🌐 VDSMP Server Status",
-                description="VDSMP is **online** ✅",
-                color=0x00cc66
-            )
-            embed.add_field(name="📃 Description", value=motd, inline=False)
-            embed.add_field(name="👥 Players", value=f"{online}/{max_players}", inline=True)
-            embed.add_field(name="🛠 Version", value=version, inline=True)
+            if players < 0:
+                embed = discord.Embed(
+                    title="🌐 VDSMP Server Status",
+                    description="The server is currently **offline** ❌",
+                    color=0xcc3333
+                )
+                if history.last_online:
+                    embed.add_field(name="Last Seen Online", value=f"<t:{int(history.last_online)}:R>", inline=True)
+            else:
+                status = history.last_status
+                motd = flatten_motd(status.get("description")).strip() or "No MOTD"
+                max_players = status.get("players", {}).get("max", 0)
+                version = status.get("version", {}).get("name", "Unknown")
 
-            icon = data.get("icon")
-            if icon and not icon.startswith("data:image"):
-                embed.set_thumbnail(url=icon)
+                embed = discord.Embed(
+                    title="🌐 VDSMP Server Status",
+                    description="VDSMP is **online** ✅",
+                    color=0x00cc66
+                )
+                embed.add_field(name="📃 Description", value=motd, inline=False)
+                embed.add_field(name="👥 Players", value=f"{players}/{max_players}", inline=True)
+                embed.add_field(name="🛠 Version", value=version, inline=True)
+                embed.add_field(name="📶 Latency", value=f"{latency:.0f} ms", inline=True)
 
-            await ctx.followup.send(embed=embed)
+            embed.add_field(name="⏱ Uptime", value=f"{history.uptime() * 100:.1f}% of last {history.size} checks", inline=True)
+            embed.set_footer(text="Last checked")
+            embed.timestamp = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+            if file:
+                embed.set_image(url="attachment://status.png")
+                await ctx.respond(embed=embed, file=file)
+            else:
+                await ctx.respond(embed=embed)
 
         except Exception as e:
             tb = traceback.format_exc()
-            await ctx.followup.send(f"❌ Error in mcserverstatus:\n```\n{tb}\n```")
+            await ctx.respond(f"❌ Error in mcserverstatus:\n```\n{tb}\n```")
+
+    @tasks.loop(seconds=MC_STATUS_POLL_INTERVAL)
+    async def poll_server_status(self):
+        await self.server_status.poll()
 
     async def create_wiki_embed(self, title: str, page: str) -> discord.Embed:
         url = f"{self.wiki_base_url}/{page}"
@@ -256,47 +327,117 @@ class MinecraftCog(commands.Cog):
             color=0x55a630
         )
 
-    async def _find_recipe_image(self, soup: BeautifulSoup) -> str:
-        for selector in [("table", "crafting-table"), ("div", "crafting"), ("img", None)]:
-            tag, class_name = selector
-            element = soup.find(tag, class_=class_name) if class_name else soup.find(tag)
-            if element:
-                img = element.find("img") if tag != "img" else element
-                if img and img.has_attr("src"):
-                    src = img["src"]
-                    if src.startswith("//"):
-                        return f"https:{src}"
-                    elif src.startswith("/"):
-                        return f"{self.wiki_base_url}{src}"
-                    return src
-        return None
+    def _wiki_link(self, name: str) -> str:
+        return f"[View on wiki]({self.wiki.page_url(name.replace(' ', '_'))})"
+
+    async def create_recipe_embed(self, recipe: dict, total: int):
+        data = recipe["data"]
+        path = self.registry.render_path(recipe["id"])
+        if not os.path.exists(path):
+            await run_in_process(render_recipe, data, path)
+
+        embed = discord.Embed(
+            title=f"Crafting Recipe for {recipe['name']}",
+            description=self._wiki_link(recipe["name"]),
+            color=0x55a630
+        )
+        embed.set_image(url="attachment://recipe.png")
+        embed.add_field(name="Type", value=prettify(data.get("type", "unknown")), inline=True)
+        result = data.get("result")
+        if isinstance(result, dict):
+            embed.add_field(name="Makes", value=str(result.get("count", 1)), inline=True)
+        if "experience" in data:
+            embed.add_field(name="XP", value=str(data["experience"]), inline=True)
+        if "cookingtime" in data:
+            embed.add_field(name="Cook Time", value=f"{data['cookingtime'] / 20:g}s", inline=True)
+        if total > 1:
+            embed.set_footer(text=f"1 of {total} recipes for this item")
+        return embed, discord.File(path, filename="recipe.png")
+
+    def create_enchant_embed(self, entry: dict) -> discord.Embed:
+        data = entry["data"]
+        embed = discord.Embed(
+            title=f"✨ Enchantment {entry['name']}",
+            description=self._wiki_link(entry["name"]),
+            color=0x55a630
+        )
+        embed.add_field(name="Max Level", value=str(data.get("max_level", "—")), inline=True)
+        embed.add_field(name="Weight", value=str(data.get("weight", "—")), inline=True)
+        embed.add_field(name="Anvil Cost", value=str(data.get("anvil_cost", "—")), inline=True)
+        embed.add_field(name="Slots", value=", ".join(data.get("slots", [])) or "—", inline=True)
+        supported = data.get("supported_items")
+        if supported:
+            embed.add_field(name="Applies To", value=self.registry.item_name(supported) if isinstance(supported, str) else ", ".join(map(self.registry.item_name, supported)), inline=True)
+        exclusive = data.get("exclusive_set")
+        if exclusive:
+            value = prettify(exclusive.lstrip("#")) if isinstance(exclusive, str) else ", ".join(map(prettify, exclusive))
+            embed.add_field(name="Incompatible With", value=value, inline=True)
+        return embed
+
+    def create_biome_embed(self, entry: dict) -> discord.Embed:
+        data = entry["data"]
+        effects = data.get("effects", {})
+        embed = discord.Embed(
+            title=f"🌲 Biome {entry['name']}",
+            description=self._wiki_link(entry["name"]),
+            color=effects.get("sky_color", 0x55a630)
+        )
+        embed.add_field(name="Temperature", value=str(data.get("temperature", "—")), inline=True)
+        embed.add_field(name="Downfall", value=str(data.get("downfall", "—")), inline=True)
+        embed.add_field(name="Precipitation", value="Yes" if data.get("has_precipitation") else "No", inline=True)
+        colors = [f"{key.replace('_color', '').replace('_', ' ').title()}: `#{value:06x}`" for key, value in effects.items() if key.endswith("_color") and isinstance(value, int)]
+        if colors:
+            embed.add_field(name="Colors", value="\n".join(colors), inline=False)
+        return embed
+
+    def create_structure_embed(self, entry: dict) -> discord.Embed:
+        data = entry["data"]
+        embed = discord.Embed(
+            title=f"🏛️ Structure {entry['name']}",
+            description=self._wiki_link(entry["name"]),
+            color=0x55a630
+        )
+        embed.add_field(name="Type", value=prettify(data.get("type", "unknown")), inline=True)
+        embed.add_field(name="Generation Step", value=prettify(data.get("step", "unknown")), inline=True)
+        biomes = data.get("biomes")
+        if isinstance(biomes, str):
+            embed.add_field(name="Biomes", value=prettify(biomes.lstrip("#")), inline=True)
+        elif isinstance(biomes, list):
+            embed.add_field(name="Biomes", value=", ".join(map(prettify, biomes)), inline=True)
+        if data.get("terrain_adaptation"):
+            embed.add_field(name="Terrain Adaptation", value=prettify(data["terrain_adaptation"]), inline=True)
+        return embed
+
+    def create_advancement_embed(self, entry: dict) -> discord.Embed:
+        data = entry["data"]
+        display = data.get("display", {})
+        description = self.registry.translate((display.get("description") or {}).get("translate")) or ""
+        embed = discord.Embed(
+            title=f"🏆 Advancement {entry['name']}",
+            description=f"{description}\n{self._wiki_link(entry['name'])}".strip(),
+            color=0x55a630
+        )
+        embed.add_field(name="Category", value=prettify(entry["id"].split("/")[0]), inline=True)
+        embed.add_field(name="Frame", value=display.get("frame", "task").title(), inline=True)
+        parent = data.get("parent")
+        if parent:
+            parent_entry = self.registry.entries["advancement"].get(strip_namespace(parent))
+            embed.add_field(name="Parent", value=parent_entry["name"] if parent_entry else prettify(parent), inline=True)
+        return embed
+
+    async def get_dynmap_render(self, x: int, z: int, zoom: int) -> Optional[discord.File]:
+        try:
+            image = await self.dynmap_tiles.render(x, z, max(0, min(zoom, DYNMAP_MAX_ZOOM)))
+        except Exception as e:
+            logger.error(f"Dynmap tile render failed: {e}", exc_info=True)
+            return None
+        if image is None:
+            return None
+        return discord.File(fp=io.BytesIO(image), filename="dynmap.jpg")
 
     async def get_dynmap_screenshot(self) -> discord.File:
-        def capture():
-            options = uc.ChromeOptions()
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--window-size=1920,1080")
-
-            driver = uc.Chrome(
-                browser_executable_path="/usr/bin/chromium-browser",
-                driver_executable_path="/usr/bin/chromedriver",
-                options=options,
-                use_subprocess=True
-            )
-            try:
-                driver.get("http://vdsmp.mc.gg:8809/")
-                driver.implicitly_wait(10)
-                return driver.get_screenshot_as_png()
-            finally:
-                driver.quit()
-
-        loop = asyncio.get_event_loop()
-        screenshot = await loop.run_in_executor(None, capture)
-        image = io.BytesIO(screenshot)
-        image.seek(0)
-        return discord.File(fp=image, filename="dynmap.png")
+        screenshot = await self.dynmap_browser.get_screenshot()
+        return discord.File(fp=io.BytesIO(screenshot), filename="dynmap.jpg")
 def setup(bot: commands.Bot):
     cog = MinecraftCog(bot)
     bot.add_cog(cog)
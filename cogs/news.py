@@ -0,0 +1,132 @@
+import discord
+import logging
+from discord import Option
+from discord.ext import commands, bridge, tasks
+from config import (
+    R6_STEAM_APPID,
+    UK_STEAM_APPID,
+    STEAM_NEWS_COUNT,
+    NEWS_POLL_INTERVAL,
+    NEWS_SUBSCRIPTIONS_FILE,
+)
+from utils.subscriptions import ChannelSubscriptions
+
+logger = logging.getLogger(__name__)
+
+# Steam-backed sources; Warframe registers its own from WarframeCog
+STEAM_SOURCES = {
+    "r6": ("Rainbow Six Siege", R6_STEAM_APPID, 0x8B0000),
+    "ultrakill": ("Ultrakill", UK_STEAM_APPID, 0x8B0000),
+}
+SOURCE_CHOICES = ["all", "r6", "ultrakill", "warframe"]
+
+
+class NewsCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.subscriptions = ChannelSubscriptions(NEWS_SUBSCRIPTIONS_FILE)
+        for name, (label, appid, color) in STEAM_SOURCES.items():
+            self.bot.news.register(name, self.steam_source(appid), label, color)
+        self.poll_news.start()
+        super().__init__()
+
+    def cog_unload(self) -> None:
+        self.poll_news.cancel()
+
+    def steam_source(self, appid: int):
+        async def fetch():
+            items = await self.bot.steam_news.get(appid, STEAM_NEWS_COUNT)
+            if items is None:
+                return None
+            return [dict(item, id=item.get("gid")) for item in items]
+        return fetch
+
+    @tasks.loop(seconds=NEWS_POLL_INTERVAL)
+    async def poll_news(self):
+        for source, item in await self.bot.news.poll():
+            await self.push(source, item)
+
+    @poll_news.before_loop
+    async def before_poll_news(self):
+        await self.bot.wait_until_ready()
+
+    async def push(self, source: str, item: dict):
+        channel_ids = self.subscriptions.channels_for(source)
+        if not channel_ids:
+            return
+        info = self.bot.news.sources[source]
+        embed = discord.Embed(
+            title=item.get("title", "News"),
+            url=item.get("link"),
+            description=item.get("summary") or None,
+            color=info["color"]
+        )
+        embed.set_author(name=f"{info['label']} News")
+        if item.get("image"):
+            embed.set_image(url=item["image"])
+        if item.get("published"):
+            embed.set_footer(text=item["published"])
+        for channel_id in channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            try:
+                await channel.send(embed=embed)
+            except discord.HTTPException as e:
+                logger.warning(f"Could not post {source} news in {channel_id}: {e}")
+
+    @bridge.bridge_group(name="news", description="Game news feeds")
+    async def news(self, ctx: discord.ApplicationContext):
+        if ctx.invoked_subcommand is None:
+            embed = discord.Embed(
+                title="News Commands",
+                description="Post R6, Ultrakill and Warframe news to a channel as it's published.",
+                color=0x8B0000
+            )
+            embed.add_field(name="Available Commands", value="`subscribe`, `unsubscribe`, `list`", inline=False)
+            await ctx.respond(embed=embed)
+
+    @news.command(name="subscribe", description="Post new game news in a channel")
+    async def subscribe(
+        self,
+        ctx: discord.ApplicationContext,
+        channel: discord.TextChannel = Option(discord.TextChannel, "Channel to post news in"),
+        source: str = Option(str, "News source", choices=SOURCE_CHOICES, default="all")
+    ):
+        if ctx.guild is None or not ctx.author.guild_permissions.manage_guild:
+            await ctx.respond("You need the Manage Server permission to do that.", ephemeral=True)
+            return
+        topics = SOURCE_CHOICES[1:] if source == "all" else [source]
+        self.subscriptions.subscribe(ctx.guild.id, topics, channel.id)
+        await ctx.respond(f"{', '.join(topics)} news will be posted in {channel.mention}.")
+
+    @news.command(name="unsubscribe", description="Stop posting game news")
+    async def unsubscribe(
+        self,
+        ctx: discord.ApplicationContext,
+        source: str = Option(str, "News source", choices=SOURCE_CHOICES, default="all")
+    ):
+        if ctx.guild is None or not ctx.author.guild_permissions.manage_guild:
+            await ctx.respond("You need the Manage Server permission to do that.", ephemeral=True)
+            return
+        removed = self.subscriptions.unsubscribe(ctx.guild.id, None if source == "all" else [source])
+        if not removed:
+            await ctx.respond("Nothing to unsubscribe from.", ephemeral=True)
+            return
+        await ctx.respond(f"Removed {removed} news subscription(s).")
+
+    @news.command(name="list", description="Show where news is posted in this server")
+    async def list_subscriptions(self, ctx: discord.ApplicationContext):
+        if ctx.guild is None:
+            await ctx.respond("This only works in a server.", ephemeral=True)
+            return
+        topics = self.subscriptions.topics_for(ctx.guild.id)
+        if not topics:
+            await ctx.respond("No news subscriptions in this server.", ephemeral=True)
+            return
+        lines = [f"**{topic}** → <#{channel_id}>" for topic, channel_id in sorted(topics.items())]
+        await ctx.respond("\n".join(lines), ephemeral=True)
+
+
+def setup(bot: commands.Bot):
+    bot.add_cog(NewsCog(bot))
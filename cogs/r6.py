@@ -1,24 +1,34 @@
 import discord
-import random
-import aiohttp
+import asyncio
+import io
+import time
 import json
 import os
-import feedparser
 import logging
+import zlib
 from discord import Option
 from typing import Dict, Any, List
-from discord.ext import bridge, commands
-from datetime import datetime
+from discord.ext import bridge, commands, tasks
 from pathlib import Path
 
 from utils.views import PaginationView
-from utils.helpers import DataHelper
+from utils.helpers import DataHelper, FileHelper
+from utils.r6_card import card_format, render_stats_card
+from utils.r6_facets import OperatorFacets
+from utils.r6_history import StatsHistory, render_trend
+from utils.r6_links import LinkedAccounts
+from utils.r6_op_images import OpImageCache, image_key
+from utils.r6_stats import NOT_FOUND, OK, R6StatsClient, normalize_platform
+from utils.workers import run_in_process
 from config import (
-    TRACKER_API_KEY,
-    R6_API_BASE,
-    R6_STEAM_RSS,
+    STEAM_NEWS_COUNT,
     R6_VIEW_TIMEOUT,
-    CACHE_DURATION,
+    R6_COMPARE_MAX_PLAYERS,
+    R6_COMPARE_TIMEOUT,
+    R6_REFRESH_INTERVAL,
+    R6_REFRESH_TICK,
+    R6_REFRESH_BATCH,
+    R6_WEAPON_CLASSES_FILE,
 )
 
 logger = logging.getLogger(__name__)
@@ -64,6 +74,17 @@ class MapFloorView(PaginationView):
 async def platform_autocomplete(ctx: discord.AutocompleteContext):
         return ["uplay", "psn", "xbl"]
 
+SQUAD_CHOICES = ["Viperstrike", "Redhammer", "Wolfguard", "Ghosteyes", "Nighthaven", "KERES Legion"]
+GADGET_CHOICES = [
+    "Barbed Wire", "Bulletproof Camera", "C4", "Claymores", "Deployable Shield", "Flashbangs", "Frag Grenades",
+    "Hard Breach Charges", "Impact EMPs", "Impact Grenades", "Observation Blockers", "Proximity Alarms",
+    "Smoke Grenades", "Soft Breach Charges",
+]
+WEAPON_CHOICES = [
+    "assault rifle", "marksman rifle", "light machine gun", "submachine gun", "shotgun",
+    "machine pistol", "handgun", "hand cannon", "shield",
+]
+
 class R6Cog(commands.Cog):
     def __init__(self, bot):
         super().__init__()
@@ -77,10 +98,44 @@ class R6Cog(commands.Cog):
         self._map_aliases: Dict[str, str] = {}
         self.maps = bot.maps
         self.operators = bot.operators
-        self._news_cache = {
-            "data": None,
-            "timestamp": None,
-        }
+        self.facets = OperatorFacets(self.operators, FileHelper.load_json_file(R6_WEAPON_CLASSES_FILE))
+        self.history = StatsHistory()
+        self.stats_client = R6StatsClient(bot.session, history=self.history)
+        self.links = LinkedAccounts()
+        self.op_images = OpImageCache()
+        self.refresh_linked.start()
+        self.warm_op_thumbnails.start()
+
+    def cog_unload(self) -> None:
+        self.refresh_linked.cancel()
+        self.warm_op_thumbnails.cancel()
+
+    @tasks.loop(count=1)
+    async def warm_op_thumbnails(self):
+        await self.op_images.warm(
+            (image_key(op.get("name", key)), DataHelper.resolve_asset(op.get("icon_url"))) for key, op in self.operators.items()
+        )
+
+    @tasks.loop(seconds=R6_REFRESH_TICK)
+    async def refresh_linked(self):
+        # a couple of the stalest accounts per tick keeps the refresher well under the API quota
+        due = self.links.due(R6_REFRESH_INTERVAL, R6_REFRESH_BATCH)
+        for user_id in due:
+            # an earlier lookup in this batch awaited; the user may have unlinked meanwhile
+            account = self.links.accounts.get(user_id)
+            if account is None:
+                continue
+            status, profile = await self.stats_client.get(account["platform"], account["username"])
+            if status == NOT_FOUND:
+                logger.info(f"Linked R6 account {account['username']} for {user_id} no longer resolves")
+            self.links.update(user_id, account["platform"], account["username"], profile)
+        if due:
+            self.links.save()
+
+    @refresh_linked.before_loop
+    async def before_refresh_linked(self):
+        await self.bot.wait_until_ready()
+
     def load_json(self, path):
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -92,61 +147,218 @@ class R6Cog(commands.Cog):
                 description="Use `/r6 <command>` to get help on a specific command.",
                 color=0x8B0000
             )
-            embed.add_field(name="Available Commands", value="`stats`, `op`, `oplist`, `oprandom`, `map`, `maplist`, `news`", inline=False)
+            embed.add_field(name="Available Commands", value="`stats`, `trend`, `compare`, `link`, `unlink`, `leaderboard`, `op`, `oplist`, `oprandom`, `map`, `maplist`, `news`", inline=False)
             await ctx.respond(embed=embed)
     
     @r6.command(name="stats", description="Look up R6 player stats")
     @discord.option("platform", str, description="uplay / psn / xbl", autocomplete=platform_autocomplete)
     @discord.option("username", str, description="Player username")
+    @discord.option("card", bool, description="Send a rendered stats card instead of an embed", default=False)
+    @discord.option("operator", str, description="Operator for the card background", default=None)
     async def stats(
         self,
         ctx: discord.ApplicationContext,
         platform: str,
-        username: str
+        username: str,
+        card: bool = False,
+        operator: str = None
     ):
         await ctx.defer()
-        url = f"{R6_API_BASE}/profile/{platform}/{username}"
-        headers = {
-            "TRN-Api-Key": TRACKER_API_KEY,
-            "Accept": "application/json"
-        }
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as resp:
-                    if resp.status != 200:
-                        await ctx.followup.send(f"❌ Could not find stats for `{username}` on `{platform}`.")
-                        return
-                    data = await resp.json()
-
-            stats = data["data"]["segments"][0]["stats"]
-            metadata = data["data"]["segments"][0]["metadata"]
-
-            rp = stats.get("rankedPoints", {}).get("displayValue", "—")
-            kd = stats.get("kd", {}).get("displayValue", "—")
-            wl = stats.get("wlPercentage", {}).get("displayValue", "—")
-            avg_kills = stats.get("killsPerMatch", {}).get("displayValue") or stats.get("averageKills", {}).get(
-            "displayValue", "—")
-            headshot_pct = stats.get("headshotPct", {}).get("displayValue") or stats.get("headshotPercentage", {}).get(
-            "displayValue", "—")
-            rank_icon = metadata.get("rankImageUrl") or metadata.get("iconUrl")
+        status, profile = await self.stats_client.get(platform, username)
+        if status == NOT_FOUND:
+            await ctx.followup.send(f"❌ Could not find stats for `{username}` on `{platform}`.")
+            return
+        if status != OK:
+            await ctx.followup.send("Error fetching stats.")
+            return
+        if not card:
+            await ctx.followup.send(embed=self.create_stats_embed(profile))
+            return
 
-            embed = discord.Embed(
-                title=f"📊 {username}'s R6 Stats ({platform.upper()})",
-                color=0x8B0000
+        icon = await self.stats_client.rank_icon(profile["rank_icon"])
+        background = self.card_background(profile["username"], operator)
+        try:
+            image = await run_in_process(
+                render_stats_card, profile["username"], profile["platform"], profile["display"], background, icon
             )
-            embed.set_thumbnail(url=rank_icon)
-            embed.add_field(name="Ranked Points (RP)", value=rp, inline=True)
-            embed.add_field(name="K/D Ratio", value=kd, inline=True)
-            embed.add_field(name="Win %", value=wl, inline=True)
-            embed.add_field(name="Avg Kills/Match", value=avg_kills, inline=True)
-            embed.add_field(name="Headshot %", value=headshot_pct, inline=True)
-            embed.set_footer(text="Data provided by Tracker Network")
+        except Exception as e:
+            logger.error(f"Error rendering R6 stats card: {e}")
+            await ctx.followup.send(embed=self.create_stats_embed(profile))
+            return
+        _, ext = card_format()
+        await ctx.followup.send(file=discord.File(io.BytesIO(image), filename=f"r6_stats.{ext}"))
+
+    def card_background(self, username: str, operator: str = None):
+        op_data = DataHelper.find_match(self.operators, operator) if operator else None
+        if op_data is None and self.operators:
+            # no pick: same operator for the same player every time
+            names = sorted(self.operators)
+            op_data = self.operators[names[zlib.crc32(username.lower().encode("utf-8")) % len(names)]]
+        return DataHelper.resolve_asset(op_data.get("image_url")) if op_data else None
+    @r6.command(name="trend", description="Chart how a player's R6 stats changed over time")
+    @discord.option("stat", str, description="Stat to chart", choices=["rp", "kd", "wl", "headshot_pct"], default="rp")
+    @discord.option("days", int, description="How far back to go", choices=[7, 30, 90, 365], default=30)
+    @discord.option("username", str, description="Player username (defaults to your linked account)", default=None)
+    @discord.option("platform", str, description="uplay / psn / xbl", autocomplete=platform_autocomplete, default=None)
+    async def trend(
+        self,
+        ctx: discord.ApplicationContext,
+        stat: str = "rp",
+        days: int = 30,
+        username: str = None,
+        platform: str = None
+    ):
+        if username is None:
+            account = self.links.accounts.get(str(ctx.author.id))
+            if account is None:
+                await ctx.respond("❌ Give a username or link your account with `/r6 link` first.", ephemeral=True)
+                return
+            platform, username = account["platform"], account["username"]
+        platform = normalize_platform(platform or "uplay")
+        if platform is None:
+            await ctx.respond("❌ Platform must be uplay, psn or xbl.", ephemeral=True)
+            return
+        await ctx.defer()
+        # a lookup also records a fresh snapshot if the cached one has expired
+        status, profile = await self.stats_client.get(platform, username)
+        if status == NOT_FOUND:
+            await ctx.followup.send(f"❌ Could not find stats for `{username}` on `{platform}`.")
+            return
+        if profile is not None:
+            username = profile["username"]
+        # a file read plus a bisect over it, kept off the loop
+        records = await asyncio.to_thread(self.history.series, platform, username, time.time() - days * 86400)
+        if len(records) < 2:
+            await ctx.followup.send(
+                f"Not enough history for `{username}` yet. Snapshots are taken whenever their stats are looked up "
+                f"and every few hours for linked accounts."
+            )
+            return
 
-            await ctx.followup.send(embed=embed)
+        label = {"rp": "Ranked Points", "kd": "K/D Ratio", "wl": "Win %", "headshot_pct": "Headshot %"}[stat]
+        image = await run_in_process(render_trend, records, stat, f"{username} – {label} – last {days} days")
+        embed = discord.Embed(title=f"📈 {username} – {label}", color=0x8B0000)
+        embed.set_image(url="attachment://trend.png")
+        embed.set_footer(text=f"{len(records)} snapshots • Data provided by Tracker Network")
+        await ctx.followup.send(embed=embed, file=discord.File(io.BytesIO(image), filename="trend.png"))
+
+    @r6.command(name="compare", description="Compare R6 stats of up to 5 players")
+    @discord.option("platform", str, description="uplay / psn / xbl", autocomplete=platform_autocomplete)
+    @discord.option("players", str, description="Comma-separated usernames")
+    async def compare(
+        self,
+        ctx: discord.ApplicationContext,
+        platform: str,
+        players: str
+    ):
+        usernames = list(dict.fromkeys(name.strip() for name in players.split(",") if name.strip()))
+        if len(usernames) < 2 or len(usernames) > R6_COMPARE_MAX_PLAYERS:
+            await ctx.respond(f"❌ Give between 2 and {R6_COMPARE_MAX_PLAYERS} usernames, separated by commas.", ephemeral=True)
+            return
+        await ctx.defer()
+
+        async def lookup(username):
+            # the fetch itself keeps running for the cache if we stop waiting on it
+            try:
+                return await asyncio.wait_for(self.stats_client.get(platform, username), R6_COMPARE_TIMEOUT)
+            except asyncio.TimeoutError:
+                return "timeout", None
+
+        results = await asyncio.gather(*(lookup(name) for name in usernames))
+        await ctx.followup.send(embed=self.create_compare_embed(platform, usernames, results))
+
+    @staticmethod
+    def create_compare_embed(platform: str, usernames: List[str], results: List[tuple]) -> discord.Embed:
+        found = [profile for status, profile in results if status == OK]
+        # best value per stat gets a marker, higher is better for all of them
+        best = {}
+        for key in ("rp", "kd", "wl", "avg_kills", "headshot_pct"):
+            values = [p["values"][key] for p in found if p["values"].get(key) is not None]
+            if len(values) > 1:
+                best[key] = max(values)
+
+        def line(profile, key, label):
+            value = profile["values"].get(key)
+            mark = " 🏆" if key in best and value == best[key] else ""
+            return f"{label}: **{profile['display'][key]}**{mark}"
+
+        embed = discord.Embed(title=f"📊 R6 Stats Comparison ({platform.upper()})", color=0x8B0000)
+        for username, (status, profile) in zip(usernames, results):
+            if status == OK:
+                value = "\n".join([
+                    line(profile, "rp", "RP"),
+                    line(profile, "kd", "K/D"),
+                    line(profile, "wl", "Win %"),
+                    line(profile, "avg_kills", "Kills/Match"),
+                    line(profile, "headshot_pct", "HS %"),
+                ])
+                embed.add_field(name=profile["username"], value=value, inline=True)
+            else:
+                reason = {NOT_FOUND: "Not found", "timeout": "Timed out"}.get(status, "Lookup failed")
+                embed.add_field(name=username, value=f"❌ {reason}", inline=True)
+        embed.set_footer(text="Data provided by Tracker Network")
+        return embed
+
+    @r6.command(name="link", description="Link your R6 account for the server leaderboard")
+    @discord.option("platform", str, description="uplay / psn / xbl", autocomplete=platform_autocomplete)
+    @discord.option("username", str, description="Your username")
+    async def link(
+        self,
+        ctx: discord.ApplicationContext,
+        platform: str,
+        username: str
+    ):
+        if ctx.guild is None:
+            await ctx.respond("❌ Link your account from inside a server.", ephemeral=True)
+            return
+        await ctx.defer(ephemeral=True)
+        status, profile = await self.stats_client.get(platform, username)
+        if status == NOT_FOUND:
+            await ctx.followup.send(f"❌ Could not find `{username}` on `{platform}`.", ephemeral=True)
+            return
+        if status != OK:
+            await ctx.followup.send("Error fetching stats, try again later.", ephemeral=True)
+            return
+        self.links.link(ctx.author.id, ctx.guild.id, profile)
+        await ctx.followup.send(
+            f"✅ Linked **{profile['username']}** ({profile['platform'].upper()}). "
+            f"You'll show up on `/r6 leaderboard` here.",
+            ephemeral=True
+        )
+
+    @r6.command(name="unlink", description="Unlink your R6 account")
+    async def unlink(self, ctx: discord.ApplicationContext):
+        if not self.links.unlink(ctx.author.id):
+            await ctx.respond("You don't have a linked account.", ephemeral=True)
+            return
+        await ctx.respond("✅ Your R6 account was unlinked.", ephemeral=True)
+
+    @r6.command(name="leaderboard", description="Server leaderboard of linked R6 accounts")
+    @discord.option("stat", str, description="Stat to rank by", choices=["rp", "kd", "wl"], default="rp")
+    async def leaderboard(self, ctx: discord.ApplicationContext, stat: str = "rp"):
+        if ctx.guild is None:
+            await ctx.respond("❌ Leaderboards only exist inside a server.", ephemeral=True)
+            return
+        self.links.join_guild(ctx.author.id, ctx.guild.id)
+        top = self.links.top(ctx.guild.id, stat, 10)
+        if not top:
+            await ctx.respond("Nobody here has linked an account yet. Use `/r6 link` to be the first!", ephemeral=True)
+            return
+
+        label = {"rp": "Ranked Points", "kd": "K/D Ratio", "wl": "Win %"}[stat]
+        medals = ["🥇", "🥈", "🥉"]
+        lines = []
+        for i, (user_id, account) in enumerate(top):
+            prefix = medals[i] if i < len(medals) else f"`{i + 1}.`"
+            lines.append(f"{prefix} <@{user_id}> – {account['username']} – **{account['display'][stat]}**")
+        embed = discord.Embed(title=f"🏆 {ctx.guild.name} R6 Leaderboard – {label}", description="\n".join(lines), color=0x8B0000)
+        rank = self.links.rank(ctx.guild.id, stat, ctx.author.id)
+        if rank is not None and rank > len(top):
+            embed.set_footer(text=f"You are #{rank} of {self.links.size(ctx.guild.id, stat)}")
+        else:
+            embed.set_footer(text="Stats refresh every few hours")
+        await ctx.respond(embed=embed)
 
-        except Exception as e:
-            logger.error(f"Error fetching R6 stats for {username}: {e}")
-            await ctx.followup.send("Error fetching stats.")
     @r6.command(name="map", description="Look up map information")
     @discord.option(
         "name",
@@ -200,39 +412,97 @@ class R6Cog(commands.Cog):
         if not op_data:
             await ctx.followup.send(f"Operator `{name}` not found.", ephemeral=True)
             return
-        embed, files = self.create_op_embed(op_data)
+        await self.send_op(ctx, op_data)
+
+    async def send_op(self, ctx: discord.ApplicationContext, op_data: dict):
+        # text + small thumbnail go out first; the multi-MB art is edited in afterwards
+        embed = self.create_op_embed(op_data)
+        key = image_key(op_data.get("name", "op"))
+        thumb_name = f"{key}_thumb.webp"
+        files = []
+
+        icon = op_data.get("icon_url") or ""
+        thumb_url = icon if icon.startswith(("http://", "https://")) else self.op_images.url(key, "thumb")
+        if thumb_url is None:
+            thumb = await self.op_images.thumbnail(key, DataHelper.resolve_asset(op_data.get("icon_url")))
+            if thumb:
+                files.append(discord.File(thumb, filename=thumb_name))
+                thumb_url = f"attachment://{thumb_name}"
+        if thumb_url:
+            embed.set_thumbnail(url=thumb_url)
+
+        image = op_data.get("image_url") or ""
+        image_path = None
+        image_url = image if image.startswith(("http://", "https://")) else self.op_images.url(key, "image")
+        if image_url:
+            embed.set_image(url=image_url)
+        else:
+            image_path = DataHelper.resolve_asset(image)
+
         if files:
-            await ctx.followup.send(embed=embed, files=files)
+            message = await ctx.followup.send(embed=embed, files=files)
         else:
-            await ctx.followup.send(embed=embed)
+            message = await ctx.followup.send(embed=embed)
+        self.remember_op_urls(key, message, {thumb_name: "thumb"})
+        if not image_path:
+            return
+
+        image_name = f"{key}_{os.path.basename(image_path)}"
+        embed.set_image(url=f"attachment://{image_name}")
+        try:
+            message = await message.edit(
+                embed=embed, file=discord.File(image_path, filename=image_name), attachments=message.attachments
+            )
+        except discord.HTTPException as e:
+            logger.warning(f"Could not attach full art for {key}: {e}")
+            return
+        self.remember_op_urls(key, message, {image_name: "image"})
+
+    def remember_op_urls(self, key: str, message: discord.Message, kinds: Dict[str, str]):
+        # the next lookup of this operator reuses the CDN copy instead of uploading again
+        for attachment in message.attachments:
+            kind = kinds.get(attachment.filename)
+            if kind:
+                self.op_images.remember(key, kind, attachment.url)
 
     @r6.command(name="oprandom", description="Get a random operator")
     async def oprandom(
         self,
         ctx: discord.ApplicationContext,
-        role: str = Option(str, "Attacker or Defender", required=False)
+        role: str = Option(str, "Attacker or Defender", choices=["Attacker", "Defender"], required=False),
+        squad: str = Option(str, "Squad", choices=SQUAD_CHOICES, required=False),
+        health: str = Option(str, "Health (1-3)", choices=["1", "2", "3"], required=False),
+        speed: str = Option(str, "Speed (1-3)", choices=["1", "2", "3"], required=False),
+        gadget: str = Option(str, "Secondary gadget", choices=GADGET_CHOICES, required=False),
+        weapon: str = Option(str, "Weapon class in the loadout", choices=WEAPON_CHOICES, required=False)
     ):
         
         await ctx.defer()
-        role_val = role.lower() if role else None
-        filtered = [op for op in self.operators.values() if not role_val or op["role"].lower() == role_val]
-        if not filtered:
-            await ctx.followup.send("❌ No operators found.")
+        selected = self.facets.select(role=role, squad=squad, health=health, speed=speed, gadget=gadget, weapon=weapon)
+        key = self.facets.random_key(selected)
+        if key is None:
+            await ctx.followup.send("❌ No operators match those filters.")
             return
-        op_data = random.choice(filtered)
-        embed, files = self.create_op_embed(op_data)
-        if files:
-            await ctx.followup.send(embed=embed, files=files)
-        else:
-            await ctx.followup.send(embed=embed)
+        op_data = self.operators[key]
+        await self.send_op(ctx, op_data)
 
     @r6.command(name="oplist", description="List all operators")
-    async def oplist(self, ctx: discord.ApplicationContext):
-        attackers = sorted([op["name"] for op in self.operators.values() if op["role"].lower() == "attacker"])
-        defenders = sorted([op["name"] for op in self.operators.values() if op["role"].lower() == "defender"])
+    async def oplist(
+        self,
+        ctx: discord.ApplicationContext,
+        squad: str = Option(str, "Squad", choices=SQUAD_CHOICES, required=False),
+        health: str = Option(str, "Health (1-3)", choices=["1", "2", "3"], required=False),
+        speed: str = Option(str, "Speed (1-3)", choices=["1", "2", "3"], required=False),
+        gadget: str = Option(str, "Secondary gadget", choices=GADGET_CHOICES, required=False),
+        weapon: str = Option(str, "Weapon class in the loadout", choices=WEAPON_CHOICES, required=False)
+    ):
+        selected = self.facets.select(squad=squad, health=health, speed=speed, gadget=gadget, weapon=weapon)
+        attackers = self.facets.names_for(selected & self.facets.select(role="attacker"))
+        defenders = self.facets.names_for(selected & self.facets.select(role="defender"))
+        filters = [value for value in (squad, health and f"health {health}", speed and f"speed {speed}", gadget, weapon) if value]
 
         embed = discord.Embed(
-            title="Operators by Role",
+            title="Operators by Role" + (f" ({', '.join(filters)})" if filters else ""),
             description="Use `/r6 op [name]` to view detailed info or /r6 oprandom for a random operator.",
             color=0x8B0000
         )
@@ -256,42 +526,12 @@ class R6Cog(commands.Cog):
 
     @r6.command(name="news", description="Get latest R6 news")
     async def news(self, ctx: discord.ApplicationContext):
-        await ctx.defer()
-
-        now = datetime.now()
-        cache_data = self._news_cache.get("data")
-        cache_time = self._news_cache.get("timestamp")
-
-        if cache_data and cache_time and (now - cache_time).total_seconds() < CACHE_DURATION:
-            embed = self._build_news_embed(cache_data)
-            await ctx.followup.send(embed=embed)
+        # served from the news aggregator's buffer, never from the network
+        news_data = self.bot.news.latest("r6", STEAM_NEWS_COUNT)
+        if not news_data:
+            await ctx.respond("❌ R6 news hasn't been fetched yet, try again shortly.", ephemeral=True)
             return
-
-        try:
-            feed = feedparser.parse(R6_STEAM_RSS)
-            if not feed.entries:
-                await ctx.followup.send("❌ Could not fetch R6 news.", ephemeral=True)
-                return
-
-            news_data = []
-            for entry in feed.entries[:3]:
-                summary = entry.summary[:200] + "..." if len(entry.summary) > 200 else entry.summary
-                news_data.append({
-                    "title": entry.title,
-                    "published": entry.published,
-                    "summary": summary,
-                    "link": entry.link,
-                })
-
-            self._news_cache["data"] = news_data
-            self._news_cache["timestamp"] = now
-
-            embed = self._build_news_embed(news_data)
-            await ctx.followup.send(embed=embed)
-
-        except Exception as e:
-            logger.error(f"Error fetching R6 news: {e}")
-            await ctx.followup.send("❌ Error fetching news. Please try again later.", ephemeral=True)
+        await ctx.respond(embed=self._build_news_embed(news_data))
         
     logger.info("R6Cog loaded and slash commands registered")
 
@@ -354,45 +594,12 @@ class R6Cog(commands.Cog):
         return results[:25]
 
     @staticmethod
-    def create_op_embed(op_data: dict):
+    def create_op_embed(op_data: dict) -> discord.Embed:
         embed = discord.Embed(
             title=f"Operator: {op_data['name']}",
             description=op_data.get("bio", ""),
             color=0x8B0000
         )
-        files_to_attach = []
-
-        def process_image(path_or_url: str, is_thumbnail=False):
-            nonlocal files_to_attach
-            if not path_or_url:
-                return None
-            if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
-                return path_or_url
-            # Normalize path and attempt to resolve relative to project root if needed
-            path_or_url = path_or_url.replace("\\", "/")
-            candidate = Path(path_or_url)
-            if not candidate.exists():
-                # Try resolving relative to repository root (two levels up from this file)
-                repo_root = Path(__file__).resolve().parents[1]
-                candidate = (repo_root / path_or_url).resolve()
-
-            if candidate.exists():
-                # Make filename unique per operator to avoid clashes
-                base_name = candidate.name
-                safe_prefix = op_data.get("name", "op").lower().replace(" ", "_")
-                filename = f"{safe_prefix}_{base_name}"
-                files_to_attach.append(discord.File(str(candidate), filename=filename))
-                return f"attachment://{filename}"
-            return None
-
-        thumb_url = process_image(op_data.get("icon_url"), is_thumbnail=True)
-        img_url = process_image(op_data.get("image_url"))
-
-        if thumb_url:
-            embed.set_thumbnail(url=thumb_url)
-        if img_url:
-            embed.set_image(url=img_url)
-
         embed.add_field(name="Role", value=op_data.get('role', 'Unknown'), inline=True)
         embed.add_field(name="Squad", value=op_data.get('squad', '—'), inline=True)
         embed.add_field(name="Stats", value=f"Health: {op_data.get('health', '—')}\nSpeed: {op_data.get('speed', '—')}", inline=True)
@@ -400,7 +607,23 @@ class R6Cog(commands.Cog):
         embed.add_field(name="Secondary Weapons", value="\n".join(op_data.get('secondary_weapons', [])) or "—", inline=False)
         embed.add_field(name="Primary Gadget", value=op_data.get('primary_gadget', "—") or "—", inline=False)
         embed.add_field(name="Secondary Gadgets", value="\n".join(op_data.get('secondary_gadgets', [])) or "—", inline=False)
-        return embed, files_to_attach
+        return embed
+
+    @staticmethod
+    def create_stats_embed(profile: dict) -> discord.Embed:
+        display = profile["display"]
+        embed = discord.Embed(
+            title=f"📊 {profile['username']}'s R6 Stats ({profile['platform'].upper()})",
+            color=0x8B0000
+        )
+        embed.set_thumbnail(url=profile["rank_icon"])
+        embed.add_field(name="Ranked Points (RP)", value=display["rp"], inline=True)
+        embed.add_field(name="K/D Ratio", value=display["kd"], inline=True)
+        embed.add_field(name="Win %", value=display["wl"], inline=True)
+        embed.add_field(name="Avg Kills/Match", value=display["avg_kills"], inline=True)
+        embed.add_field(name="Headshot %", value=display["headshot_pct"], inline=True)
+        embed.set_footer(text="Data provided by Tracker Network")
+        return embed
 
     @staticmethod
     def _build_news_embed(news_data):
@@ -0,0 +1,53 @@
+import discord
+import logging
+import time
+from discord import Option
+from discord.ext import commands, bridge
+
+from config import SEARCH_RESULT_LIMIT
+from utils.search import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+KINDS = {
+    "operator": ("🛡️", "R6 operator", "/r6 op"),
+    "map": ("🗺️", "R6 map", "/r6 map"),
+    "weapon": ("🔫", "Ultrakill weapon", "/ultrakill weapon"),
+    "plane": ("✈️", "WW1 plane", None),
+}
+
+
+class SearchCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        # the data is static json loaded once at startup, so the index is too
+        self.index = SearchIndex.build(bot.operators, bot.maps, bot.ukweapons, bot.planes)
+        super().__init__()
+
+    @bridge.bridge_command(name="search", description="Search operators, maps, weapons and planes")
+    async def search(
+        self,
+        ctx: discord.ApplicationContext,
+        query: str = Option(str, "Words to look for; use OR between alternatives"),
+        category: str = Option(str, "Only search one category", choices=["all", *KINDS], default="all")
+    ):
+        started = time.perf_counter()
+        total, hits = self.index.search(query, None if category == "all" else category, SEARCH_RESULT_LIMIT)
+        elapsed = (time.perf_counter() - started) * 1000
+        if not hits:
+            await ctx.respond(f"No results for `{query}`.", ephemeral=True)
+            return
+
+        lines = []
+        for _, (kind, _, name) in hits:
+            emoji, label, command = KINDS[kind]
+            hint = f" – `{command} {name}`" if command else ""
+            lines.append(f"{emoji} **{name}** ({label}){hint}")
+        embed = discord.Embed(title=f"🔎 Results for \"{query}\"", description="\n".join(lines), color=0x8B0000)
+        shown = f"top {len(hits)} of {total}" if total > len(hits) else f"{total}"
+        embed.set_footer(text=f"{shown} matches • {elapsed:.2f} ms")
+        await ctx.respond(embed=embed)
+
+
+def setup(bot: commands.Bot):
+    bot.add_cog(SearchCog(bot))
@@ -1,12 +1,10 @@
 import discord
-import feedparser
 import config
 import os
 import logging
 import utils.helpers
 from discord.ext import bridge, commands
 from utils.embed_builder import EmbedBuilder
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +14,6 @@ class Ultracog(commands.Cog):
         self.session = None
         self.ukranks = bot.ukranks
         self.ukweapons = bot.ukweapons
-        self._news_cache = {
-            "data": None,
-            "timestamp": None,
-        }
         super().__init__()
 
     @bridge.bridge_group(name='ultrakill', description="Ultrakill commands")
@@ -88,42 +82,12 @@ class Ultracog(commands.Cog):
     
     @ultrakill.command(name='news', description="Latest Ultrakill news")
     async def news(self, ctx: discord.ApplicationContext):
-        await ctx.defer()
-
-        now = datetime.now()
-        cache_data = self._news_cache.get("data")
-        cache_time = self._news_cache.get("timestamp")
-
-        if cache_data and cache_time and (now - cache_time).total_seconds() < config.CACHE_DURATION:
-            embed = self._build_news_embed(cache_data)
-            await ctx.followup.send(embed=embed)
+        # served from the news aggregator's buffer, never from the network
+        news_data = self.bot.news.latest("ultrakill", config.STEAM_NEWS_COUNT)
+        if not news_data:
+            await ctx.respond("❌ Ultrakill news hasn't been fetched yet, try again shortly.", ephemeral=True)
             return
-
-        try:
-            feed = feedparser.parse(config.UK_STEAM_RSS)
-            if not feed.entries:
-                await ctx.followup.send("❌ Could not fetch Ultrakill news.", ephemeral=True)
-                return
-
-            news_data = []
-            for entry in feed.entries[:3]:
-                summary = entry.summary[:200] + "..." if len(entry.summary) > 200 else entry.summary
-                news_data.append({
-                    "title": entry.title,
-                    "published": entry.published,
-                    "summary": summary,
-                    "link": entry.link,
-                })
-
-            self._news_cache["data"] = news_data
-            self._news_cache["timestamp"] = now
-
-            embed = self._build_news_embed(news_data)
-            await ctx.followup.send(embed=embed)
-
-        except Exception as e:
-            logger.error(f"Error fetching Ultrakill news: {e}")
-            await ctx.followup.send("❌ Error fetching news. Please try again later.", ephemeral=True)
+        await ctx.respond(embed=self._build_news_embed(news_data))
     
     #embed +  autocomplete stuff
     @staticmethod
@@ -1,17 +1,35 @@
 import discord
 import logging
+import aiohttp
 import asyncio
+import io
+import os
+import time
 from discord import Option
 from typing import Optional
-from discord.ext import commands, bridge
+from discord.ext import commands, bridge, tasks
 from discord.ui import View, Button
 from config import (
-    WF_API_BASE,
-    WF_MARKET_API,
-    WF_STREAMS_API,
-    CACHE_DURATION,
+    WF_STREAMS_REFRESH,
+    WF_WORLDSTATE_REFRESH,
+    WF_SUBSCRIPTIONS_FILE,
+    WF_DROPS_URL,
+    WF_DROPS_FILE,
+    WF_DROPS_REFRESH,
+    WF_WATCH_POLL_INTERVAL,
+    WF_WATCH_MAX_PER_USER,
     WF_COLOR
 )
+from utils.subscriptions import ChannelSubscriptions
+from utils.wf_cycles import CycleClock
+from utils.wf_drops import RELIC_STATES, DropTable, compile_drops_file
+from utils.wf_items import ItemCatalog
+from utils.wf_market import MarketClient
+from utils.wf_price_history import PriceHistory, render_sparkline
+from utils.wf_streams import StreamSchedule
+from utils.wf_watchlist import PriceWatchlist
+from utils.workers import run_in_process
+from utils.worldstate import EVENT_TYPES, WorldstateDiff, WorldstateStore
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +80,140 @@ class WarframeCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.cache = {}
+        self.worldstate = WorldstateStore(bot.session)
+        self.differ = WorldstateDiff()
+        self.cycles = CycleClock()
+        self.price_history = PriceHistory()
+        self.market = MarketClient(bot.session, history=self.price_history)
+        self.items = ItemCatalog(bot.session)
+        self.watchlist = PriceWatchlist()
+        self.drops = DropTable()
+        self.drops.open()
+        self.stream_schedule = StreamSchedule(bot.session)
+        self.subscriptions = ChannelSubscriptions(WF_SUBSCRIPTIONS_FILE)
+        bot.news.register("warframe", self.news_items, "Warframe", WF_COLOR)
+        self.refresh_worldstate.start()
+        self.refresh_items.start()
+        self.poll_watchlist.start()
+        self.refresh_drops.start()
+        self.refresh_streams.start()
         super().__init__()
+
+    def cog_unload(self) -> None:
+        self.refresh_worldstate.cancel()
+        self.refresh_items.cancel()
+        self.poll_watchlist.cancel()
+        self.refresh_drops.cancel()
+        self.refresh_streams.cancel()
+        self.price_history.close()
+        self.drops.close()
+
+    @tasks.loop(seconds=WF_WORLDSTATE_REFRESH)
+    async def refresh_worldstate(self):
+        if not await self.worldstate.refresh():
+            return
+        self.cycles.correct(self.worldstate.data)
+        # only sections whose content hash moved get diffed
+        for event in self.differ.diff(self.worldstate.data):
+            await self.announce(event)
+
+    @refresh_worldstate.before_loop
+    async def before_refresh_worldstate(self):
+        await self.bot.wait_until_ready()
+
+    @tasks.loop(hours=1)
+    async def refresh_items(self):
+        # the on-disk copy is reused across restarts until it's a day old
+        if self.items.stale:
+            await self.items.refresh()
+
+    @tasks.loop(seconds=WF_WATCH_POLL_INTERVAL)
+    async def poll_watchlist(self):
+        slugs = self.watchlist.slugs()
+        if not slugs:
+            return
+        # one summary per distinct item; the market client's token bucket paces the requests
+        summaries = await asyncio.gather(*(self.market.summary(slug) for slug in slugs))
+        for slug, summary in zip(slugs, summaries):
+            if not summary or summary.get("min") is None:
+                continue
+            for user_id, watch in self.watchlist.check(slug, summary["min"]):
+                await self.notify_watcher(user_id, slug, watch, summary)
+
+    @poll_watchlist.before_loop
+    async def before_poll_watchlist(self):
+        await self.bot.wait_until_ready()
+
+    async def notify_watcher(self, user_id: int, slug: str, watch: dict, summary: dict):
+        name = self.watchlist.items.get(slug, {}).get("name", slug)
+        embed = discord.Embed(
+            title=f"{name} is {watch['direction']} {watch['threshold']}p",
+            url=f"https://warframe.market/items/{slug}",
+            description=f"Lowest in-game seller: **{summary['min']}p** ({summary['top'][0]['seller']})",
+            color=WF_COLOR
+        )
+        try:
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            await user.send(embed=embed)
+        except discord.HTTPException as e:
+            logger.warning(f"Could not DM price alert to {user_id}: {e}")
+
+    @tasks.loop(hours=24)
+    async def refresh_drops(self):
+        if os.path.exists(WF_DROPS_FILE) and time.time() - os.path.getmtime(WF_DROPS_FILE) < WF_DROPS_REFRESH:
+            return
+        src = f"{WF_DROPS_FILE}.json"
+        try:
+            os.makedirs(os.path.dirname(WF_DROPS_FILE), exist_ok=True)
+            async with self.bot.session.get(WF_DROPS_URL, timeout=aiohttp.ClientTimeout(total=120)) as resp:
+                if resp.status != 200:
+                    logger.warning(f"Drop table download failed: {resp.status}")
+                    return
+                with open(src, "wb") as f:
+                    async for chunk in resp.content.iter_chunked(64 * 1024):
+                        f.write(chunk)
+            # parsing several MB of json stays off the event loop
+            count = await run_in_process(compile_drops_file, src, WF_DROPS_FILE)
+            logger.info(f"Compiled {count} drops")
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError) as e:
+            logger.error(f"Error refreshing drop table: {e}")
+            return
+        finally:
+            if os.path.exists(src):
+                os.remove(src)
+        self.drops.open()
+
+    async def drop_item_autocomplete(self, ctx: discord.AutocompleteContext):
+        return self.drops.search_items(ctx.value or "")
+
+    async def relic_autocomplete(self, ctx: discord.AutocompleteContext):
+        names = self.drops.search_items(ctx.value or "", 100)
+        return [name for name in names if name.endswith(" Relic")][:25]
+
+    async def item_autocomplete(self, ctx: discord.AutocompleteContext):
+        return [name for _, name in self.items.search(ctx.value or "")]
+
+    async def announce(self, event: dict):
+        channel_ids = self.subscriptions.channels_for(event["type"])
+        if not channel_ids:
+            return
+        embed = discord.Embed(
+            title=event["title"],
+            description=event.get("description"),
+            url=event.get("url"),
+            color=WF_COLOR
+        )
+        if event.get("image"):
+            embed.set_image(url=event["image"])
+        for channel_id in channel_ids:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            try:
+                await channel.send(embed=embed)
+            except discord.HTTPException as e:
+                logger.warning(f"Could not announce {event['type']} in {channel_id}: {e}")
+
     @bridge.bridge_group(name="wf", description="Warframe commands")
     async def wf(self, ctx: discord.ApplicationContext):
         if ctx.invoked_subcommand is None:
@@ -71,31 +222,15 @@ class WarframeCog(commands.Cog):
                 description="Use `/wf <command>` to get help on a specific command.",
                 color=WF_COLOR
             )
-            embed.add_field(name="Available Commands", value="`baro`, `news`, `nightwave`, `price`, `streams`", inline=False)
+            embed.add_field(name="Available Commands", value="`baro`, `news`, `nightwave`, `price`, `watch`, `unwatch`, `watchlist`, `pricehistory`, `drops`, `relic`, `streams`, `cycles`, `subscribe`, `unsubscribe`", inline=False)
             await ctx.respond(embed=embed)  
     
     @wf.command(name="baro", description="Check Baro Ki'Teer's status and inventory")
     async def baro(self, ctx: discord.ApplicationContext):
         await ctx.defer()
-        logger.info("[/wf baro] Deferred response")
-        data = await self.get_cached_data("voidTrader")
-        if not data:
-            await ctx.followup.send("Failed to fetch data.", ephemeral=True)
-            return
-        try:
-            data = await asyncio.wait_for(self.get_cached_data("voidTrader"), timeout=10)
-            logger.info(f"[/wf baro] Fetched data: {data}")
-        except asyncio.TimeoutError:
-            logger.error("[/wf baro] Data fetch timed out")
-            await ctx.followup.send("Timed out while fetching data.", ephemeral=True)
-            return
-        except Exception as e:
-            logger.exception("[/wf baro] Exception while fetching data")
-            await ctx.followup.send("An error occurred while fetching data.", ephemeral=True)
-            return
-
+        data = await self.get_section("voidTrader")
         if not data:
-            logger.warning("[/wf baro] No data returned")
+            logger.warning("[/wf baro] No data available")
             await ctx.followup.send("Failed to fetch data.", ephemeral=True)
             return
         if data.get("active"):
@@ -114,29 +249,25 @@ class WarframeCog(commands.Cog):
 
     @wf.command(name="news", description="Show latest Warframe news")
     async def wfnews(self, ctx: discord.ApplicationContext):
-        await ctx.defer()
-        try:
-            data = await self.get_cached_data("news")
-            if not data:
-                await ctx.followup.send("Failed to fetch news.", ephemeral=True)
-                return
-            embed = discord.Embed(title="Warframe News", color=WF_COLOR)
-            for news in data[:5]:
-                embed.add_field(
-                    name=news['message'],
-                    value=f"[Read More]({news['link']})",
-                    inline=False
-                )
-            await ctx.followup.send(embed=embed)
-        except Exception as e:
-            logger.error(f"Error in news command: {e}")
-            await ctx.followup.send("Error fetching news.", ephemeral=True)
+        # served from the news aggregator's buffer, never from the network
+        data = self.bot.news.latest("warframe", 5)
+        if not data:
+            await ctx.respond("Warframe news hasn't been fetched yet, try again shortly.", ephemeral=True)
+            return
+        embed = discord.Embed(title="Warframe News", color=WF_COLOR)
+        for news in data:
+            embed.add_field(
+                name=news['title'],
+                value=f"[Read More]({news['link']})",
+                inline=False
+            )
+        await ctx.respond(embed=embed)
 
     @wf.command(name="nightwave", description="Show current Nightwave challenges")
     async def nightwave(self, ctx: discord.ApplicationContext):
         await ctx.defer()
         try:
-            data = await self.get_cached_data("nightwave")
+            data = await self.get_section("nightwave")
             if not data:
                 await ctx.followup.send("Failed to fetch Nightwave data.", ephemeral=True)
                 return
@@ -156,95 +287,294 @@ class WarframeCog(commands.Cog):
     async def wfprice(
         self,
         ctx: discord.ApplicationContext,
-        item: str = Option(str, "Item name to check prices for")
+        item: str = Option(
+            str,
+            "Item name to check prices for",
+            autocomplete=lambda ctx: ctx.cog.item_autocomplete(ctx)
+        )
     ):
+        slug = item
+        # without a catalog yet (first start, market down) fall back to guessing the slug
+        if len(self.items):
+            match = self.items.resolve(item)
+            if match is None:
+                suggestions = self.items.search(item, 5)
+                hint = "\n".join(f"• {name}" for _, name in suggestions)
+                await ctx.respond(
+                    f"Unknown item `{item}`." + (f" Did you mean:\n{hint}" if hint else ""),
+                    ephemeral=True
+                )
+                return
+            slug, item = match
+
         await ctx.defer()
-        item_url = item.replace(" ", "_").lower()
-        url = f"{WF_MARKET_API}/items/{item_url}/orders"
+        summary = await self.market.summary(slug)
+        if summary is None:
+            await ctx.followup.send("Error fetching prices.", ephemeral=True)
+            return
+        if not summary:
+            await ctx.followup.send("Item not found.", ephemeral=True)
+            return
+        if not summary["count"]:
+            await ctx.followup.send("No active sellers found.")
+            return
 
-        try:
-            session = self.bot.http._HTTPClient__session
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    await ctx.followup.send("Item not found.", ephemeral=True)
-                    return
-                data = await resp.json()
-                sell_orders = [
-                    order for order in data.get("payload", {}).get("orders", [])
-                    if order.get("order_type") == "sell" and order.get("user", {}).get("status") == "ingame"
-                ]
-                if not sell_orders:
-                    await ctx.followup.send("No active sellers found.")
-                    return
+        embed = discord.Embed(title=f"Prices for {item}", color=WF_COLOR)
+        embed.description = (
+            f"Lowest: **{summary['min']}p** · Median: **{summary['median']:g}p** · "
+            f"{summary['count']} in-game sellers"
+        )
+        for order in summary["top"]:
+            embed.add_field(
+                name=f"{order['platinum']}p",
+                value=f"Seller: {order['seller']}",
+                inline=True
+            )
+        await ctx.followup.send(embed=embed)
 
-                cheapest = sorted(sell_orders, key=lambda x: x.get("platinum", 9999))[:5]
-                embed = discord.Embed(title=f"Prices for {item}", color=WF_COLOR)
-                for order in cheapest:
-                    embed.add_field(
-                           name=f"{order.get('platinum')}p",
-                        value=f"Seller: {order.get('user', {}).get('ingame_name', 'Unknown')}",
-                        inline=True
-                    )
-                await ctx.followup.send(embed=embed)
-        except Exception as e:
-            logger.error(f"Error fetching price for {item}: {e}")
-            await ctx.followup.send("Error fetching prices.", ephemeral=True)
+    @wf.command(name="watch", description="DM me when an item's price crosses a threshold")
+    async def watch(
+        self,
+        ctx: discord.ApplicationContext,
+        item: str = Option(str, "Item to watch", autocomplete=lambda ctx: ctx.cog.item_autocomplete(ctx)),
+        price: int = Option(int, "Threshold in platinum", min_value=1),
+        direction: str = Option(str, "Alert when the lowest price goes", choices=["below", "above"], default="below")
+    ):
+        match = self.items.resolve(item)
+        if match is None:
+            await ctx.respond(f"Unknown item `{item}`.", ephemeral=True)
+            return
+        slug, name = match
+        watches = self.watchlist.for_user(ctx.author.id)
+        if len(watches) >= WF_WATCH_MAX_PER_USER and slug not in (w[0] for w in watches):
+            await ctx.respond(f"You can watch at most {WF_WATCH_MAX_PER_USER} items.", ephemeral=True)
+            return
+        self.watchlist.add(ctx.author.id, slug, name, price, direction)
+        await ctx.respond(f"I'll DM you when **{name}** goes {direction} **{price}p**.", ephemeral=True)
 
-    @wf.command(name="streams", description="Show current and upcoming Warframe streams")
-    async def streams(self, ctx: discord.ApplicationContext):
-        await ctx.defer(thinking=True)
-        try:
-            session = self.bot.http._HTTPClient__session
-            async with session.get(f"{WF_STREAMS_API}/streams/upcoming") as resp:
-                upcoming = await resp.json() if resp.status == 200 else []
-
-            async with session.get(f"{WF_STREAMS_API}/streams/active") as resp:
-                active = await resp.json() if resp.status == 200 else []
-
-            embed = discord.Embed(title="Warframe Streams", color=WF_COLOR)
-            if upcoming:
-                value = ""
-                for stream in upcoming[:5]:
-                    drops = ", ".join(stream.get('drops', [])) or "No drops"
-                    value += f"**{stream['title']}**\n{drops}\nStarts: {stream['startTime']}\n\n"
-                embed.add_field(name="Upcoming Streams", value=value or "None", inline=False)
-
-            if active:
-                value = ""
-                for stream in active[:5]:
-                    drops = ", ".join(stream.get('drops', [])) or "No drops"
-                    value += f"[{stream['title']}]({stream['url']})\n{drops}\n\n"
-                embed.add_field(name="Active Streams", value=value or "None", inline=False)
-
-            if not upcoming and not active:
-                embed.description = "No streams found."
+    @wf.command(name="unwatch", description="Stop watching an item's price")
+    async def unwatch(
+        self,
+        ctx: discord.ApplicationContext,
+        item: str = Option(str, "Item to stop watching", autocomplete=lambda ctx: ctx.cog.item_autocomplete(ctx))
+    ):
+        match = self.items.resolve(item)
+        slug = match[0] if match else item
+        if not self.watchlist.remove(ctx.author.id, slug):
+            await ctx.respond(f"You aren't watching `{item}`.", ephemeral=True)
+            return
+        await ctx.respond(f"Stopped watching **{match[1] if match else item}**.", ephemeral=True)
 
-            await ctx.followup.send(embed=embed)
-        except Exception as e:
-            logger.error(f"Error fetching streams: {e}")
+    @wf.command(name="watchlist", description="List your price alerts")
+    async def watchlist_cmd(self, ctx: discord.ApplicationContext):
+        watches = self.watchlist.for_user(ctx.author.id)
+        if not watches:
+            await ctx.respond("You have no price alerts.", ephemeral=True)
+            return
+        embed = discord.Embed(title="Your Price Alerts", color=WF_COLOR)
+        for slug, name, watch in watches:
+            cached = self.market.summaries.get(slug, WF_WATCH_POLL_INTERVAL)
+            current = f"\nLast seen: {cached['min']}p" if cached and cached.get("min") is not None else ""
+            embed.add_field(name=name, value=f"{watch['direction'].title()} {watch['threshold']}p{current}", inline=True)
+        await ctx.respond(embed=embed, ephemeral=True)
+
+    @wf.command(name="pricehistory", description="Show recorded warframe.market prices for an item")
+    async def pricehistory(
+        self,
+        ctx: discord.ApplicationContext,
+        item: str = Option(str, "Item name", autocomplete=lambda ctx: ctx.cog.item_autocomplete(ctx)),
+        period: str = Option(str, "Time range", choices=["24h", "7d", "30d", "90d"], default="24h")
+    ):
+        match = self.items.resolve(item)
+        slug, name = match if match else (MarketClient.slugify(item), item)
+        stats = self.price_history.stats(slug)
+        if stats is None:
+            await ctx.respond(
+                f"No price history for **{name}** yet. It starts recording once the item is looked up with "
+                f"`/wf price` or watched with `/wf watch`.",
+                ephemeral=True
+            )
+            return
+
+        span = {"24h": 1, "7d": 7, "30d": 30, "90d": 90}[period] * 24 * 60 * 60
+        image = await run_in_process(render_sparkline, self.price_history.series(slug, span))
+
+        def fmt(value):
+            return "–" if value is None else f"{value:.0f}p"
+
+        embed = discord.Embed(title=f"Price history for {name} ({period})", color=WF_COLOR)
+        embed.add_field(name="Last lowest", value=f"{fmt(stats['last_min'])} (<t:{stats['last_ts']}:R>)", inline=True)
+        embed.add_field(name="Last median", value=fmt(stats["last_median"]), inline=True)
+        embed.add_field(name="24h average", value=fmt(stats["avg_24h"]), inline=True)
+        embed.add_field(name="24h low / high", value=f"{fmt(stats['low_24h'])} / {fmt(stats['high_24h'])}", inline=True)
+        embed.add_field(name="90d average", value=fmt(stats["avg_90d"]), inline=True)
+        embed.set_image(url="attachment://pricehistory.png")
+        embed.set_footer(text="Blue: lowest in-game sell price · Grey: median")
+        await ctx.respond(embed=embed, file=discord.File(io.BytesIO(image), filename="pricehistory.png"))
+
+    @wf.command(name="drops", description="Where an item drops and how often")
+    async def wfdrops(
+        self,
+        ctx: discord.ApplicationContext,
+        item: str = Option(str, "Item, mod or relic name", autocomplete=lambda ctx: ctx.cog.drop_item_autocomplete(ctx))
+    ):
+        if not self.drops.loaded:
+            await ctx.respond("The drop tables haven't been downloaded yet, try again in a minute.", ephemeral=True)
+            return
+        index = self.drops.find_item(item)
+        if index is None:
+            await ctx.respond(f"No drop sources found for `{item}`.", ephemeral=True)
+            return
+        name, sources = self.drops.drops_for(index)
+        embed = discord.Embed(title=f"Drop locations for {name}", color=WF_COLOR)
+        embed.description = "\n".join(
+            f"**{chance:.2f}%** ({rarity}) – {place}" for place, rarity, chance in sources[:20]
+        )
+        if len(sources) > 20:
+            embed.set_footer(text=f"Showing the best 20 of {len(sources)} sources")
+        await ctx.respond(embed=embed)
+
+    @wf.command(name="relic", description="Show the rewards of a Void Relic")
+    async def relic(
+        self,
+        ctx: discord.ApplicationContext,
+        name: str = Option(str, "Relic name, e.g. Axi A1", autocomplete=lambda ctx: ctx.cog.relic_autocomplete(ctx))
+    ):
+        if not self.drops.loaded:
+            await ctx.respond("The drop tables haven't been downloaded yet, try again in a minute.", ephemeral=True)
+            return
+        title, states = self.drops.relic(name)
+        if not title:
+            await ctx.respond(f"Unknown relic `{name}`.", ephemeral=True)
+            return
+        embed = discord.Embed(title=title, color=WF_COLOR)
+        for state in sorted(states, key=lambda s: RELIC_STATES.index(s) if s in RELIC_STATES else len(RELIC_STATES)):
+            embed.add_field(
+                name=state,
+                value="\n".join(f"{item} – {chance:.2f}%" for item, _, chance in states[state]),
+                inline=False
+            )
+        index = self.drops.find_item(title)
+        if index is not None:
+            _, sources = self.drops.drops_for(index)
+            embed.add_field(
+                name="Best places to farm",
+                value="\n".join(f"**{chance:.2f}%** – {place}" for place, _, chance in sources[:5]),
+                inline=False
+            )
+        else:
+            embed.set_footer(text="This relic is vaulted")
+        await ctx.respond(embed=embed)
+
+    @wf.command(name="streams", description="Show current and upcoming Warframe streams")
+    async def streams(
+        self,
+        ctx: discord.ApplicationContext,
+        view: str = Option(str, "Which streams to show", choices=["all", "live", "soon"], default="all")
+    ):
+        # only the first call after startup waits on the API, but that can take a while
+        await ctx.defer()
+        if not await self.stream_schedule.get():
             await ctx.followup.send("Error fetching stream data.", ephemeral=True)
+            return
 
-    async def get_cached_data(self, endpoint: str, max_age: int = CACHE_DURATION) -> Optional[dict]:
-        cache_key = f"wf_{endpoint}"
-        cached = self.cache.get(cache_key)
-        if cached:
-            data, timestamp = cached
-            if (discord.utils.utcnow() - timestamp).total_seconds() < max_age:
-                return data
+        def starts(stream):
+            return f"<t:{int(stream['start_ts'])}:R>" if stream.get("start_ts") else stream.get("startTime", "Unknown")
 
-        url = f"{WF_API_BASE}/{endpoint}"
-        try:
-            session = self.bot.http._HTTPClient__session
-            async with session.get(url) as resp:
-                if resp.status != 200:
-                    logger.error(f"API error for {endpoint}: {resp.status}")
-                    return None
-                data = await resp.json()
-                self.cache[cache_key] = (data, discord.utils.utcnow())
-                return data
-        except Exception as e:
-            logger.error(f"Error fetching {endpoint}: {e}")
+        def describe(stream, live):
+            drops = ", ".join(stream.get('drops', [])) or "No drops"
+            title = f"[{stream['title']}]({stream['url']})" if live and stream.get("url") else f"**{stream['title']}**"
+            return f"{title}\n{drops}" + ("" if live else f"\nStarts: {starts(stream)}")
+
+        now = time.time()
+        live = self.stream_schedule.live(now) if view in ("all", "live") else []
+        if view == "soon":
+            upcoming = self.stream_schedule.soon(now)
+        elif view == "all":
+            upcoming = self.stream_schedule.next(now)
+        else:
+            upcoming = []
+
+        embed = discord.Embed(title="Warframe Streams", color=WF_COLOR)
+        if live:
+            embed.add_field(name="Live Now", value="\n\n".join(describe(s, True) for s in live[:5]), inline=False)
+        if upcoming:
+            name = "Starting Soon" if view == "soon" else "Upcoming Streams"
+            embed.add_field(name=name, value="\n\n".join(describe(s, False) for s in upcoming[:5]), inline=False)
+        if not live and not upcoming:
+            embed.description = {"live": "Nothing live right now.", "soon": "Nothing starting in the next two hours."}.get(
+                view, "No streams found."
+            )
+        await ctx.followup.send(embed=embed)
+
+    @wf.command(name="cycles", description="Show the open world day/night cycles")
+    async def cycles(self, ctx: discord.ApplicationContext):
+        # computed locally, no worldstate fetch needed
+        now = time.time()
+        embed = discord.Embed(title="Open World Cycles", color=WF_COLOR)
+        for key, state, remaining, next_state in self.cycles.states(now):
+            embed.add_field(
+                name=self.cycles.table[key]["name"],
+                value=f"**{state.title()}**\n{next_state.title()} <t:{int(now + remaining)}:R>",
+                inline=True
+            )
+        await ctx.respond(embed=embed)
+
+    @wf.command(name="subscribe", description="Post Warframe events to a channel as they happen")
+    async def subscribe(
+        self,
+        ctx: discord.ApplicationContext,
+        channel: discord.TextChannel = Option(discord.TextChannel, "Channel to post events in"),
+        event: str = Option(str, "Event to subscribe to", choices=["all"] + EVENT_TYPES, default="all")
+    ):
+        if ctx.guild is None or not ctx.author.guild_permissions.manage_guild:
+            await ctx.respond("You need the Manage Server permission to do that.", ephemeral=True)
+            return
+        topics = EVENT_TYPES if event == "all" else [event]
+        self.subscriptions.subscribe(ctx.guild.id, topics, channel.id)
+        await ctx.respond(f"{', '.join(topics)} updates will be posted in {channel.mention}.")
+
+    @wf.command(name="unsubscribe", description="Stop posting Warframe events")
+    async def unsubscribe(
+        self,
+        ctx: discord.ApplicationContext,
+        event: str = Option(str, "Event to unsubscribe from", choices=["all"] + EVENT_TYPES, default="all")
+    ):
+        if ctx.guild is None or not ctx.author.guild_permissions.manage_guild:
+            await ctx.respond("You need the Manage Server permission to do that.", ephemeral=True)
+            return
+        removed = self.subscriptions.unsubscribe(ctx.guild.id, None if event == "all" else [event])
+        if not removed:
+            await ctx.respond("Nothing to unsubscribe from.", ephemeral=True)
+            return
+        await ctx.respond(f"Removed {removed} subscription(s).")
+
+    @tasks.loop(seconds=WF_STREAMS_REFRESH)
+    async def refresh_streams(self):
+        await self.stream_schedule.refresh()
+
+    async def news_items(self):
+        # news source for the aggregator, read from the worldstate snapshot
+        data = await self.get_section("news")
+        if data is None:
+            return None
+        items = sorted(data, key=lambda n: n.get("date", ""), reverse=True)
+        return [
+            {
+                "id": news.get("id"),
+                "title": news.get("message", "Warframe News"),
+                "summary": "",
+                "link": news.get("link"),
+                "published": news.get("date", "")[:10],
+                "image": news.get("imageLink"),
+            }
+            for news in items
+        ]
+
+    async def get_section(self, section: str):
+        if not await self.worldstate.ensure_loaded():
             return None
+        return self.worldstate.get(section)
 
 def setup(bot: commands.Bot):
     bot.add_cog(WarframeCog(bot))
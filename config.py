@@ -12,24 +12,110 @@ TIMEZONES = sorted(pytz.all_timezones)
 DATA_FOLDER = "data"
 ALERTS_FILE = f"{DATA_FOLDER}/alerts.json"
 SCORES_FILE = f"{DATA_FOLDER}/trivia_scores.json"
+CACHE_FOLDER = f"{DATA_FOLDER}/cache"
+ASSETS_FOLDER = f"{DATA_FOLDER}/assets"
 
 CACHE_DURATION = 300
 API_TIMEOUT = 10
 MAX_RETRIES = 3
 R6_VIEW_TIMEOUT = 60
+PROCESS_POOL_WORKERS = 2
 OWNER_IDS = [int(id_) for id_ in os.getenv("OWNER_IDS", "640289470763237376").split(",")]
 
 
 
 MINECRAFT_WIKI_BASE = "https://minecraft.wiki/w"
+MC_WIKI_CACHE_DIR = f"{CACHE_FOLDER}/mc_wiki"
+MC_WIKI_PAGE_MAX_AGE = 6 * 60 * 60
+MC_RECIPE_CACHE_TTL = 24 * 60 * 60
+MC_DATA_DIR = f"{DATA_FOLDER}/minecraft"
+MC_ALIASES_FILE = f"{DATA_FOLDER}/mc_aliases.json"
+MC_ITEM_TEXTURES_DIR = f"{DATA_FOLDER}/assets/mcitems"
+MC_RENDER_CACHE_DIR = f"{CACHE_FOLDER}/mc_recipes"
+MC_SERVER_HOST = "vdsmp.mc.gg"
+MC_SERVER_PORT = 25565
+MC_STATUS_POLL_INTERVAL = 60
+MC_STATUS_TIMEOUT = 5
+MC_STATUS_HISTORY_SIZE = 1440  # one day at the default poll interval
+MOJANG_BULK_URL = "https://api.minecraftservices.com/minecraft/profile/lookup/bulk/byname"
+MOJANG_PROFILE_FILE = f"{CACHE_FOLDER}/mojang_profiles.json"
+MOJANG_PROFILE_TTL = 24 * 60 * 60
+MOJANG_NEGATIVE_TTL = 60 * 60
+MOJANG_BATCH_DELAY = 0.05
+DYNMAP_URL = "http://vdsmp.mc.gg:8809/"
+DYNMAP_SCREENSHOT_TTL = 60
+DYNMAP_RELOAD_INTERVAL = 3600
+DYNMAP_MAX_SIZE = (1280, 720)
+DYNMAP_JPEG_QUALITY = 80
+DYNMAP_BACKEND = "tiles"  # "tiles" or "browser"
+DYNMAP_WORLD = "world"
+DYNMAP_MAP = "flat"
+DYNMAP_TILE_FORMAT = "png"
+DYNMAP_TILE_SCALE = 4  # pixels per block at zoom 0
+DYNMAP_TILE_MAX_AGE = 300
+DYNMAP_TILE_CONCURRENCY = 8
+DYNMAP_TILE_CACHE_DIR = f"{CACHE_FOLDER}/dynmap_tiles"
+DYNMAP_RENDER_SIZE = (1024, 768)
+DYNMAP_MAX_ZOOM = 5
 WARFRAME_API_BASE = "https://api.warframestat.us/pc"
 R6_API_BASE = "https://api.r6stats.com/api/v1"
-R6_STEAM_RSS = "https://steamcommunity.com/games/359550/rss/"
+R6_STEAM_APPID = 359550
+R6_STATS_TTL = 5 * 60
+R6_STATS_NEGATIVE_TTL = 60
+R6_STATS_CONCURRENCY = 3
+R6_COMPARE_MAX_PLAYERS = 5
+R6_COMPARE_TIMEOUT = 8
+R6_STATS_RATE = 0.5
+R6_STATS_BURST = 5
+R6_LINKS_FILE = f"{DATA_FOLDER}/r6_links.json"
+R6_REFRESH_INTERVAL = 6 * 60 * 60
+R6_REFRESH_TICK = 60
+R6_REFRESH_BATCH = 2
+R6_HISTORY_DIR = f"{CACHE_FOLDER}/r6_history"
+R6_HISTORY_MIN_GAP = 60 * 60
+R6_HISTORY_MAX_RECORDS = 2048
+R6_HISTORY_FULL_RES_DAYS = 30
+R6_CARD_SIZE = (900, 300)
+R6_CARD_FORMAT = "WEBP"  # falls back to JPEG when Pillow has no WebP support
+R6_CARD_QUALITY = 85
+R6_RANK_ICON_TTL = 24 * 60 * 60
+SEARCH_RESULT_LIMIT = 10
+R6_WEAPON_CLASSES_FILE = f"{DATA_FOLDER}/r6weapons.json"
+R6_OP_THUMBS_DIR = f"{CACHE_FOLDER}/r6_thumbs"
+R6_OP_THUMB_SIZE = 160
+R6_OP_URLS_FILE = f"{CACHE_FOLDER}/r6_op_urls.json"
+R6_CDN_URL_TTL = 20 * 60 * 60  # for links without an expiry of their own
+R6_CDN_URL_MARGIN = 60 * 60
 WF_API_BASE = "https://api.warframestat.us/pc"
 WF_MARKET_API = "https://api.warframe.market/v1"
 WF_STREAMS_API = "https://api.warframestreams.lol/v1"
 WF_COLOR = 0x00aff0
-UK_STEAM_RSS = "https://steamcommunity.com/games/1229490/rss/"
+WF_WORLDSTATE_REFRESH = 60
+WF_SUBSCRIPTIONS_FILE = f"{DATA_FOLDER}/wf_subscriptions.json"
+WF_MARKET_SUMMARY_TTL = 120
+WF_MARKET_TOP_N = 5
+WF_MARKET_RATE = 3
+WF_MARKET_BURST = 3
+WF_WATCHLIST_FILE = f"{DATA_FOLDER}/wf_watchlist.json"
+WF_WATCH_POLL_INTERVAL = 5 * 60
+WF_WATCH_MAX_PER_USER = 10
+WF_PRICE_HISTORY_FILE = f"{CACHE_FOLDER}/wf_price_history.bin"
+WF_PRICE_HISTORY_MAX_ITEMS = 512
+WF_DROPS_URL = "https://drops.warframestat.us/data/all.slim.json"
+WF_DROPS_FILE = f"{CACHE_FOLDER}/wf_drops.bin"
+WF_DROPS_REFRESH = 7 * 24 * 60 * 60
+WF_STREAMS_REFRESH = 5 * 60
+WF_STREAMS_SOON = 2 * 60 * 60
+WF_ITEMS_FILE = f"{CACHE_FOLDER}/wf_items.json.gz"
+WF_ITEMS_REFRESH = 24 * 60 * 60
+UK_STEAM_APPID = 1229490
+STEAM_NEWS_URL = "https://api.steampowered.com/ISteamNews/GetNewsForApp/v2/"
+STEAM_NEWS_COUNT = 3
+NEWS_POLL_INTERVAL = 10 * 60
+NEWS_BUFFER_SIZE = 10
+NEWS_SEEN_LIMIT = 200
+NEWS_SEEN_FILE = f"{DATA_FOLDER}/news_seen.json"
+NEWS_SUBSCRIPTIONS_FILE = f"{DATA_FOLDER}/news_subscriptions.json"
 
 INITIAL_EXTENSIONS = [
     'cogs.r6',
@@ -41,7 +127,9 @@ INITIAL_EXTENSIONS = [
     'cogs.core',
     'cogs.frost',
     'cogs.test',
-    'cogs.ultrakill'
+    'cogs.ultrakill',
+    'cogs.news',
+    'cogs.search'
 ]
 
 
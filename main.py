@@ -9,6 +9,10 @@ import discord
 from discord.ext import bridge
 from dotenv import load_dotenv
 import config
+from utils.news import NewsAggregator
+from utils.steam_news import SteamNews
+from utils.subscriptions import migrate_topic
+from utils.workers import shutdown_process_pool
 
 log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 logging.basicConfig(
@@ -55,6 +59,7 @@ async def on_shutdown():
     if hasattr(bot, "session"):
         await bot.session.close()
         logger.info("aiohttp session closed.")
+    shutdown_process_pool()
 async def main():
     load_dotenv()
     try:
@@ -65,6 +70,10 @@ async def main():
         bot.ukweapons = load_json("data/ukweapons.json")
         logger.info("Loaded json data.")
         bot.session = aiohttp.ClientSession()
+        bot.steam_news = SteamNews(bot.session)
+        bot.news = NewsAggregator()
+        # Warframe news used to be a /wf subscribe topic; it lives with /news subscribe now
+        migrate_topic(config.WF_SUBSCRIPTIONS_FILE, config.NEWS_SUBSCRIPTIONS_FILE, "news", "warframe")
     except Exception as e:
         logger.exception("Failed to load JSON data.")
         sys.exit(1)
@@ -0,0 +1,80 @@
+import asyncio
+import io
+
+import aiohttp
+from aiohttp import web
+from PIL import Image
+
+from utils.dynmap_tiles import TILE_SIZE, DynmapTileRenderer, TileCache
+
+RED = (200, 30, 30)
+
+
+def png(color) -> bytes:
+    out = io.BytesIO()
+    Image.new("RGBA", (TILE_SIZE, TILE_SIZE), color + (255,)).save(out, format="PNG")
+    return out.getvalue()
+
+
+async def tile_server(tile, etag='"v1"'):
+    # stands in for dynmap's tile folder; tile(path) -> bytes or None for 404
+    requests = []
+
+    async def handle(request):
+        requests.append(request.path)
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304)
+        data = tile(request.path)
+        if data is None:
+            return web.Response(status=404)
+        return web.Response(body=data, content_type="image/png", headers={"ETag": etag})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/", requests
+
+
+def render(tmp_path, tile, max_age=300, times=1):
+    async def run():
+        runner, url, requests = await tile_server(tile)
+        try:
+            async with aiohttp.ClientSession() as session:
+                renderer = DynmapTileRenderer(session, url, "world", "flat", TileCache(str(tmp_path), max_age))
+                images = [await renderer.render(0, 0, 0, (256, 256)) for _ in range(times)]
+        finally:
+            await runner.cleanup()
+        return images, requests
+
+    return asyncio.run(run())
+
+
+def test_render_composites_tiles(tmp_path):
+    (image,), requests = render(tmp_path, lambda path: png(RED))
+    assert requests and all(path.startswith("/tiles/world/flat/") for path in requests)
+    with Image.open(io.BytesIO(image)) as result:
+        assert result.size == (256, 256)
+        assert all(abs(a - b) < 10 for a, b in zip(result.getpixel((128, 128)), RED))
+
+
+def test_fresh_cache_skips_the_server(tmp_path):
+    (first, second), requests = render(tmp_path, lambda path: png(RED), times=2)
+    assert first == second
+    assert len(requests) == len(set(requests))
+
+
+def test_stale_cache_revalidates(tmp_path):
+    (first, second), requests = render(tmp_path, lambda path: png(RED), max_age=0, times=2)
+    # every tile was asked twice, the second time answered with 304 from the cache
+    assert first == second
+    assert len(requests) == 2 * len(set(requests))
+
+
+def test_unrendered_area_returns_none(tmp_path):
+    (image,), requests = render(tmp_path, lambda path: None)
+    assert image is None
+    assert requests
@@ -0,0 +1,46 @@
+import asyncio
+import json
+
+from utils.mc_status import ServerStatusPoller, pack_packet, pack_string, read_packet
+
+STATUS = {"version": {"name": "1.21", "protocol": 767}, "players": {"online": 3, "max": 20}, "description": "hi"}
+
+
+async def fake_server(pong):
+    # answers one status request, then replies to the ping with pong(payload)
+    async def handle(reader, writer):
+        try:
+            await read_packet(reader)  # handshake
+            await read_packet(reader)  # status request
+            writer.write(pack_packet(0x00, pack_string(json.dumps(STATUS))))
+            _, payload = await read_packet(reader)
+            writer.write(pong(payload))
+            await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+def poll(pong):
+    async def run():
+        server, port = await fake_server(pong)
+        async with server:
+            poller = ServerStatusPoller("127.0.0.1", port, capacity=4)
+            return await poller.poll(), poller.history
+
+    return asyncio.run(run())
+
+
+def test_good_handshake():
+    status, history = poll(lambda payload: pack_packet(0x01, payload))
+    assert status["players"]["online"] == 3
+    assert status["latency"] >= 0
+    assert history.latest()[1] == 3
+
+
+def test_truncated_pong_counts_as_offline():
+    status, history = poll(lambda payload: pack_packet(0x01, payload[:3]))
+    assert status is None
+    assert history.latest()[1] == -1
@@ -0,0 +1,33 @@
+import asyncio
+
+from utils.wf_market import iter_json_array
+
+
+def collect(chunks, key="orders"):
+    async def feed():
+        for chunk in chunks:
+            yield chunk
+
+    async def run():
+        return [value async for value in iter_json_array(feed(), key)]
+
+    return asyncio.run(run())
+
+
+def test_whole_body():
+    assert collect([b'{"payload": {"orders": [{"a": 1}, {"a": 2}]}}']) == [{"a": 1}, {"a": 2}]
+
+
+def test_marker_and_bracket_in_separate_chunks():
+    chunks = [b'{"payload": {"orders"', b': ', b'[{"a": 1}, {"a"', b': 2}]}}']
+    assert collect(chunks) == [{"a": 1}, {"a": 2}]
+
+
+def test_marker_split_across_chunks():
+    chunks = [b'{"payload": {"ord', b'ers": [{"a": 1}]}}']
+    assert collect(chunks) == [{"a": 1}]
+
+
+def test_one_byte_chunks():
+    body = '{"payload": {"orders": [{"name": "é"}, 3]}}'.encode("utf-8")
+    assert collect([body[i:i + 1] for i in range(len(body))]) == [{"name": "é"}, 3]
@@ -0,0 +1,25 @@
+from utils.wf_streams import StreamSchedule
+
+
+def schedule(upcoming, active):
+    streams = StreamSchedule(None)
+    streams.upcoming, streams.starts = upcoming, [s["start_ts"] for s in upcoming]
+    streams.active = active
+    return streams
+
+
+def test_live_dedupes_by_id():
+    scheduled = {"id": "a", "title": "Devstream", "start_ts": 100, "end_ts": 500, "drops": []}
+    active = {"id": "a", "title": "Devstream", "start_ts": 100, "end_ts": 500, "url": "https://twitch.tv/warframe"}
+    assert schedule([scheduled], [active]).live(200) == [active]
+
+
+def test_live_dedupes_by_title_and_start_without_id():
+    scheduled = {"title": "Devstream", "start_ts": 100, "end_ts": 500}
+    active = {"title": "Devstream", "start_ts": 100, "end_ts": None, "url": "https://twitch.tv/warframe"}
+    assert schedule([scheduled], [active]).live(200) == [active]
+
+
+def test_live_keeps_started_streams_not_yet_active():
+    scheduled = {"id": "b", "title": "Prime Time", "start_ts": 100, "end_ts": 500}
+    assert schedule([scheduled], []).live(200) == [scheduled]
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 import logging
@@ -96,6 +97,43 @@ class APICache(BaseCache):
             return None
 
 
+class SingleFlightCache(BaseCache):
+    # like APICache, but concurrent misses for one key share a single fetch
+    def __init__(self):
+        super().__init__()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch_func,
+        max_age: int = 300,
+        **kwargs
+    ) -> Optional[Any]:
+        cached = self.get(key, max_age)
+        if cached is not None:
+            return cached
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(key, fetch_func, **kwargs))
+            self._inflight[key] = future
+        # one caller giving up must not cancel the fetch for everyone else
+        return await asyncio.shield(future)
+
+    async def _fetch(self, key: str, fetch_func, **kwargs) -> Optional[Any]:
+        try:
+            data = await fetch_func(**kwargs)
+            if data is not None:
+                self.set(key, data)
+            return data
+        except Exception as e:
+            logger.error(f"Error fetching data for {key}: {e}")
+            return None
+        finally:
+            self._inflight.pop(key, None)
+
+
 class EmbedCache(BaseCache):
     def get_embed(
         self, 
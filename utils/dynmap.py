@@ -0,0 +1,118 @@
+import asyncio
+import base64
+import io
+import logging
+import time
+from typing import Optional, Tuple
+
+import undetected_chromedriver as uc
+from PIL import Image
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import (
+    DYNMAP_URL,
+    DYNMAP_SCREENSHOT_TTL,
+    DYNMAP_RELOAD_INTERVAL,
+    DYNMAP_MAX_SIZE,
+    DYNMAP_JPEG_QUALITY,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def compress_screenshot(png: bytes, max_size: Tuple[int, int] = DYNMAP_MAX_SIZE, quality: int = DYNMAP_JPEG_QUALITY) -> bytes:
+    image = Image.open(io.BytesIO(png)).convert("RGB")
+    image.thumbnail(max_size, Image.LANCZOS)
+    out = io.BytesIO()
+    image.save(out, format="JPEG", quality=quality, optimize=True)
+    return out.getvalue()
+
+
+class DynmapBrowser:
+    # one headless chrome parked on the dynmap page, screenshots go over devtools
+    def __init__(self, url: str = DYNMAP_URL, ttl: int = DYNMAP_SCREENSHOT_TTL):
+        self.url = url
+        self.ttl = ttl
+        self._driver = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._image: Optional[bytes] = None
+        self._captured_at = 0.0
+
+    def _start_driver(self):
+        options = uc.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+
+        driver = uc.Chrome(
+            browser_executable_path="/usr/bin/chromium-browser",
+            driver_executable_path="/usr/bin/chromedriver",
+            options=options,
+            use_subprocess=True
+        )
+        logger.info("Started dynmap browser")
+        return driver
+
+    def _load_page(self):
+        self._driver.get(self.url)
+        try:
+            WebDriverWait(self._driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".leaflet-tile-loaded"))
+            )
+        except TimeoutException:
+            logger.warning("Dynmap tiles did not finish loading, capturing anyway")
+        self._loaded_at = time.monotonic()
+
+    def _quit_driver(self):
+        if self._driver is None:
+            return
+        try:
+            self._driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing dynmap browser: {e}")
+        self._driver = None
+
+    def _capture(self) -> bytes:
+        for attempt in range(2):
+            try:
+                if self._driver is None:
+                    self._driver = self._start_driver()
+                    self._load_page()
+                elif time.monotonic() - self._loaded_at > DYNMAP_RELOAD_INTERVAL:
+                    # the dynmap page leaks memory if left open forever
+                    self._load_page()
+                result = self._driver.execute_cdp_cmd(
+                    "Page.captureScreenshot",
+                    {"format": "png", "captureBeyondViewport": False}
+                )
+                return compress_screenshot(base64.b64decode(result["data"]))
+            except WebDriverException as e:
+                logger.warning(f"Dynmap browser failed (attempt {attempt + 1}): {e}")
+                self._quit_driver()
+        raise RuntimeError("Dynmap browser could not capture a screenshot")
+
+    def _is_fresh(self) -> bool:
+        return self._image is not None and time.monotonic() - self._captured_at < self.ttl
+
+    async def get_screenshot(self) -> bytes:
+        if self._is_fresh():
+            return self._image
+        async with self._lock:
+            # whoever held the lock before us may have just refreshed it
+            if self._is_fresh():
+                return self._image
+            loop = asyncio.get_running_loop()
+            self._image = await loop.run_in_executor(None, self._capture)
+            self._captured_at = time.monotonic()
+            return self._image
+
+    async def close(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._quit_driver)
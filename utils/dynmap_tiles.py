@@ -0,0 +1,197 @@
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import math
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import aiohttp
+from PIL import Image
+
+from config import (
+    API_TIMEOUT,
+    DYNMAP_URL,
+    DYNMAP_WORLD,
+    DYNMAP_MAP,
+    DYNMAP_TILE_FORMAT,
+    DYNMAP_TILE_SCALE,
+    DYNMAP_TILE_MAX_AGE,
+    DYNMAP_TILE_CONCURRENCY,
+    DYNMAP_TILE_CACHE_DIR,
+    DYNMAP_RENDER_SIZE,
+    DYNMAP_JPEG_QUALITY,
+)
+from utils.workers import run_in_process
+
+logger = logging.getLogger(__name__)
+
+TILE_SIZE = 128
+BACKGROUND = (12, 12, 16)
+
+Placement = Tuple[int, int, Optional[bytes]]
+
+
+def tile_path(world: str, map_prefix: str, zoom: int, tx: int, ty: int, fmt: str = DYNMAP_TILE_FORMAT) -> str:
+    # same layout dynmap's hdmap.js requests: zoomed-out tiles get a "zz.._" prefix
+    zoom_prefix = f"{'z' * zoom}_" if zoom else ""
+    return f"tiles/{world}/{map_prefix}/{tx >> 5}_{ty >> 5}/{zoom_prefix}{tx}_{ty}.{fmt}"
+
+
+def plan_tiles(x: float, z: float, zoom: int, size: Tuple[int, int], scale: int = DYNMAP_TILE_SCALE) -> List[Tuple[int, int, int, int]]:
+    # returns (tx, ty, offset_x, offset_y) for every tile touching the output image
+    width, height = size
+    blocks_per_tile = TILE_SIZE / scale
+    step = 1 << zoom
+    px_per_unit = TILE_SIZE / step
+
+    # u grows east, v grows north (tile y is -z), image rows grow south
+    cu, cv = x / blocks_per_tile, -z / blocks_per_tile
+    left = cu - width / 2 / px_per_unit
+    right = cu + width / 2 / px_per_unit
+    top = -cv - height / 2 / px_per_unit
+    bottom = -cv + height / 2 / px_per_unit
+
+    plan = []
+    tx = math.floor(left / step) * step
+    while tx < right:
+        ty = math.floor(-bottom / step) * step
+        while ty < -top:
+            offset_x = round((tx - left) * px_per_unit)
+            offset_y = round((-(ty + step) - top) * px_per_unit)
+            plan.append((tx, ty, offset_x, offset_y))
+            ty += step
+        tx += step
+    return plan
+
+
+def composite_tiles(size: Tuple[int, int], placements: List[Placement], quality: int = DYNMAP_JPEG_QUALITY) -> bytes:
+    # runs in a worker process
+    canvas = Image.new("RGB", size, BACKGROUND)
+    for offset_x, offset_y, data in placements:
+        if not data:
+            continue
+        try:
+            tile = Image.open(io.BytesIO(data)).convert("RGBA")
+        except Exception:
+            continue
+        if tile.size != (TILE_SIZE, TILE_SIZE):
+            tile = tile.resize((TILE_SIZE, TILE_SIZE))
+        canvas.paste(tile, (offset_x, offset_y), tile)
+    out = io.BytesIO()
+    canvas.save(out, format="JPEG", quality=quality, optimize=True)
+    return out.getvalue()
+
+
+class TileCache:
+    def __init__(self, root: str = DYNMAP_TILE_CACHE_DIR, max_age: int = DYNMAP_TILE_MAX_AGE):
+        self.root = Path(root)
+        self.max_age = max_age
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        folder = self.root / key[:2]
+        return folder / f"{key}.tile", folder / f"{key}.json"
+
+    @staticmethod
+    def _read_meta(path: Path) -> dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    @staticmethod
+    def _write_meta(path: Path, meta: dict) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def _load(self, data_path: Path, meta_path: Path) -> Tuple[dict, Optional[bytes]]:
+        try:
+            cached = data_path.read_bytes()
+        except FileNotFoundError:
+            cached = None
+        return self._read_meta(meta_path), cached
+
+    def _store(self, data_path: Path, meta_path: Path, data: Optional[bytes], meta: dict) -> None:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        if data is None:
+            data_path.unlink(missing_ok=True)
+        else:
+            data_path.write_bytes(data)
+        self._write_meta(meta_path, meta)
+
+    async def fetch(self, session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+        # a render touches dozens of tiles, so the disk side runs in threads
+        data_path, meta_path = self._paths(url)
+        meta, cached = await asyncio.to_thread(self._load, data_path, meta_path)
+
+        if meta and time.time() - meta.get("checked", 0) < self.max_age:
+            return cached
+
+        headers = {}
+        if cached is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+            async with session.get(url, headers=headers, timeout=timeout) as resp:
+                if resp.status == 304 and cached is not None:
+                    meta["checked"] = time.time()
+                    await asyncio.to_thread(self._write_meta, meta_path, meta)
+                    return cached
+                if resp.status == 404:
+                    # unrendered area, remember that so we don't ask again until max_age
+                    data = None
+                elif resp.status == 200:
+                    data = await resp.read()
+                else:
+                    logger.warning(f"Dynmap tile {url} returned {resp.status}")
+                    return cached
+
+                await asyncio.to_thread(self._store, data_path, meta_path, data, {
+                    "checked": time.time(),
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                })
+                return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching dynmap tile {url}: {e}")
+            return cached
+
+
+class DynmapTileRenderer:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str = DYNMAP_URL,
+        world: str = DYNMAP_WORLD,
+        map_prefix: str = DYNMAP_MAP,
+        cache: Optional[TileCache] = None
+    ):
+        self.session = session
+        self.base_url = base_url.rstrip("/")
+        self.world = world
+        self.map_prefix = map_prefix
+        self.cache = cache or TileCache()
+        self._semaphore = asyncio.Semaphore(DYNMAP_TILE_CONCURRENCY)
+
+    def tile_url(self, zoom: int, tx: int, ty: int) -> str:
+        return f"{self.base_url}/{tile_path(self.world, self.map_prefix, zoom, tx, ty)}"
+
+    async def _fetch_tile(self, zoom: int, tx: int, ty: int) -> Optional[bytes]:
+        async with self._semaphore:
+            return await self.cache.fetch(self.session, self.tile_url(zoom, tx, ty))
+
+    async def render(self, x: float = 0, z: float = 0, zoom: int = 0, size: Tuple[int, int] = DYNMAP_RENDER_SIZE) -> Optional[bytes]:
+        plan = plan_tiles(x, z, zoom, size)
+        tiles = await asyncio.gather(*(self._fetch_tile(zoom, tx, ty) for tx, ty, _, _ in plan))
+        if not any(tiles):
+            return None
+        placements = [(ox, oy, data) for (_, _, ox, oy), data in zip(plan, tiles)]
+        return await run_in_process(composite_tiles, size, placements)
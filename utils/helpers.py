@@ -190,6 +190,16 @@ class DataHelper:
                     return item
         return None
 
+    @staticmethod
+    def resolve_asset(path: str) -> Optional[str]:
+        # data files point at "/assets/..." meaning the assets folder, not the filesystem root
+        if not path or path.startswith(("http://", "https://")):
+            return None
+        path = path.replace("\\", "/")
+        if path.startswith("/assets/"):
+            path = os.path.join(config.ASSETS_FOLDER, path[len("/assets/"):])
+        return path if os.path.isfile(path) else None
+
     @staticmethod
     async def fetch_json(url: str, session: Optional[aiohttp.ClientSession], timeout: int = 5) -> Optional[Dict[str, Any]]:
         try:
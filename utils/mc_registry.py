@@ -0,0 +1,294 @@
+import json
+import logging
+import os
+import sys
+import zipfile
+from collections import defaultdict
+from difflib import get_close_matches
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from PIL import Image, ImageDraw, ImageFont
+
+from config import (
+    MC_DATA_DIR,
+    MC_ALIASES_FILE,
+    MC_ITEM_TEXTURES_DIR,
+    MC_RENDER_CACHE_DIR,
+)
+from utils.helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+# registry category -> folder inside data/minecraft (1.21+ singular names)
+CATEGORIES = {
+    "recipe": "recipe",
+    "enchantment": "enchantment",
+    "biome": "worldgen/biome",
+    "structure": "worldgen/structure",
+    "advancement": "advancement",
+}
+# pre-1.21 jars use plural folder names
+LEGACY_FOLDERS = {
+    "recipes": "recipe",
+    "advancements": "advancement",
+}
+
+CELL = 48
+PADDING = 8
+FONT_PATH = "impact.ttf"
+
+
+def strip_namespace(value: str) -> str:
+    return value.split(":", 1)[1] if ":" in value else value
+
+
+def normalize_key(value: str) -> str:
+    return strip_namespace(value.strip().lower()).replace(" ", "_").replace("'", "")
+
+
+def prettify(identifier: str) -> str:
+    return strip_namespace(identifier).split("/")[-1].replace("_", " ").title()
+
+
+def ingredient_ids(ingredient: Any) -> List[str]:
+    # handles "minecraft:x", "#minecraft:tag", {"item": ..}, {"tag": ..} and lists of those
+    if ingredient is None:
+        return []
+    if isinstance(ingredient, str):
+        return [ingredient]
+    if isinstance(ingredient, list):
+        return [i for part in ingredient for i in ingredient_ids(part)]
+    if isinstance(ingredient, dict):
+        if "item" in ingredient:
+            return [ingredient["item"]]
+        if "tag" in ingredient:
+            return [f"#{ingredient['tag']}"]
+        if "id" in ingredient:
+            return [ingredient["id"]]
+    return []
+
+
+def recipe_result(recipe: dict) -> Optional[str]:
+    result = recipe.get("result")
+    if isinstance(result, str):
+        return result
+    if isinstance(result, dict):
+        return result.get("id") or result.get("item")
+    return None
+
+
+def _pad_grid(rows: List[List[str]]) -> List[List[str]]:
+    rows = [row + [""] * (3 - len(row)) for row in rows[:3]]
+    return rows + [[""] * 3 for _ in range(3 - len(rows))]
+
+
+def recipe_grid(recipe: dict) -> List[List[str]]:
+    # 3x3 grid of ingredient ids ("" for empty) for crafting, a single row otherwise
+    recipe_type = strip_namespace(recipe.get("type", ""))
+    if recipe_type == "crafting_shaped":
+        key = recipe.get("key", {})
+        return _pad_grid([
+            [(ingredient_ids(key.get(symbol)) or [""])[0] if symbol != " " else "" for symbol in row]
+            for row in recipe.get("pattern", [])
+        ])
+    if recipe_type == "crafting_shapeless":
+        items = [(ingredient_ids(i) or [""])[0] for i in recipe.get("ingredients", [])]
+        return _pad_grid([items[i:i + 3] for i in range(0, len(items), 3)])
+    if recipe_type.startswith("smithing"):
+        return [[(ingredient_ids(recipe.get(slot)) or [""])[0] for slot in ("template", "base", "addition")]]
+    return [[(ingredient_ids(recipe.get("ingredient")) or [""])[0]]]
+
+
+def _item_icon(item_id: str, textures_dir: str) -> Optional[Image.Image]:
+    if not item_id or item_id.startswith("#"):
+        return None
+    path = Path(textures_dir) / f"{strip_namespace(item_id)}.png"
+    if not path.exists():
+        return None
+    icon = Image.open(path).convert("RGBA")
+    return icon.resize((CELL - 8, CELL - 8), Image.NEAREST)
+
+
+def _draw_cell(canvas: Image.Image, draw: ImageDraw.ImageDraw, font, x: int, y: int, item_id: str, textures_dir: str) -> None:
+    draw.rectangle((x, y, x + CELL - 1, y + CELL - 1), fill=(139, 139, 139), outline=(55, 55, 55), width=2)
+    if not item_id:
+        return
+    icon = _item_icon(item_id, textures_dir)
+    if icon:
+        canvas.paste(icon, (x + 4, y + 4), icon)
+        return
+    # no texture shipped, label the slot instead
+    for i, word in enumerate(prettify(item_id.lstrip("#")).split()[:3]):
+        draw.text((x + 3, y + 3 + i * 14), word[:7], font=font, fill=(255, 255, 255))
+
+
+def render_recipe(recipe: dict, out_path: str, textures_dir: str = MC_ITEM_TEXTURES_DIR) -> str:
+    grid = recipe_grid(recipe)
+    rows = max(len(grid), 1)
+    cols = max((len(row) for row in grid), default=1)
+    width = PADDING * 4 + CELL * (cols + 2)
+    height = PADDING * 2 + CELL * rows
+
+    canvas = Image.new("RGBA", (width, height), (198, 198, 198, 255))
+    draw = ImageDraw.Draw(canvas)
+    try:
+        font = ImageFont.truetype(FONT_PATH, 12)
+    except OSError:
+        font = ImageFont.load_default()
+
+    for r, row in enumerate(grid):
+        for c, item_id in enumerate(row):
+            _draw_cell(canvas, draw, font, PADDING + c * CELL, PADDING + r * CELL, item_id, textures_dir)
+
+    arrow_x = PADDING * 2 + cols * CELL
+    mid_y = height // 2
+    draw.polygon(
+        [(arrow_x, mid_y - 6), (arrow_x + CELL - 16, mid_y - 6), (arrow_x + CELL - 16, mid_y - 14),
+         (arrow_x + CELL - 4, mid_y), (arrow_x + CELL - 16, mid_y + 14), (arrow_x + CELL - 16, mid_y + 6),
+         (arrow_x, mid_y + 6)],
+        fill=(85, 85, 85)
+    )
+
+    result_x = arrow_x + CELL + PADDING
+    _draw_cell(canvas, draw, font, result_x, mid_y - CELL // 2, recipe_result(recipe) or "", textures_dir)
+    result = recipe.get("result")
+    count = result.get("count", 1) if isinstance(result, dict) else 1
+    if count > 1:
+        draw.text((result_x + CELL - 14, mid_y + CELL // 2 - 16), str(count), font=font, fill=(255, 255, 255))
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    canvas.convert("RGB").save(out_path, format="PNG", optimize=True)
+    return out_path
+
+
+class MinecraftRegistry:
+    def __init__(self, root: str = MC_DATA_DIR, aliases_file: str = MC_ALIASES_FILE):
+        self.root = Path(root)
+        self.aliases_file = aliases_file
+        self.entries: Dict[str, Dict[str, dict]] = {category: {} for category in CATEGORIES}
+        self._lookup: Dict[str, Dict[str, str]] = {category: {} for category in CATEGORIES}
+        self._recipes_by_result: Dict[str, List[str]] = defaultdict(list)
+        self.lang: Dict[str, str] = {}
+
+    def load(self) -> "MinecraftRegistry":
+        self.lang = FileHelper.load_json_file(str(self.root / "lang" / "en_us.json"))
+        for category, folder in CATEGORIES.items():
+            base = self.root / folder
+            if not base.exists():
+                continue
+            for path in base.rglob("*.json"):
+                entry_id = path.relative_to(base).with_suffix("").as_posix()
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.error(f"Error loading {path}: {e}")
+                    continue
+                self._add(category, entry_id, data)
+
+        aliases = FileHelper.load_json_file(self.aliases_file)
+        for category, mapping in aliases.items():
+            for alias, target in mapping.items():
+                if target in self.entries.get(category, {}):
+                    self._lookup[category].setdefault(normalize_key(alias), target)
+
+        counts = ", ".join(f"{len(v)} {k}s" for k, v in self.entries.items())
+        logger.info(f"Loaded Minecraft registry: {counts}")
+        return self
+
+    def _add(self, category: str, entry_id: str, data: dict) -> None:
+        name = self.display_name(category, entry_id, data)
+        self.entries[category][entry_id] = {"id": entry_id, "name": name, "data": data}
+        lookup = self._lookup[category]
+        lookup[normalize_key(entry_id)] = entry_id
+        lookup.setdefault(normalize_key(entry_id.split("/")[-1]), entry_id)
+        lookup.setdefault(normalize_key(name), entry_id)
+        if category == "recipe":
+            result = recipe_result(data)
+            if result:
+                self._recipes_by_result[normalize_key(result)].append(entry_id)
+
+    def translate(self, key: Optional[str]) -> Optional[str]:
+        return self.lang.get(key) if key else None
+
+    def display_name(self, category: str, entry_id: str, data: dict) -> str:
+        name = None
+        if category == "enchantment":
+            name = self.translate((data.get("description") or {}).get("translate"))
+        elif category == "advancement":
+            name = self.translate(((data.get("display") or {}).get("title") or {}).get("translate"))
+        elif category == "biome":
+            name = self.translate(f"biome.minecraft.{entry_id}")
+        elif category == "recipe":
+            result = recipe_result(data)
+            if result:
+                return self.item_name(result)
+        return name or prettify(entry_id)
+
+    def item_name(self, item_id: str) -> str:
+        if item_id.startswith("#"):
+            return f"any {prettify(item_id[1:])}"
+        short = strip_namespace(item_id)
+        return (
+            self.translate(f"item.minecraft.{short}")
+            or self.translate(f"block.minecraft.{short}")
+            or prettify(short)
+        )
+
+    def find(self, category: str, query: str) -> Optional[dict]:
+        lookup = self._lookup.get(category, {})
+        key = normalize_key(query)
+        entry_id = lookup.get(key)
+        if entry_id is None:
+            close = get_close_matches(key, lookup.keys(), n=1, cutoff=0.7)
+            if close:
+                entry_id = lookup[close[0]]
+        return self.entries[category].get(entry_id) if entry_id else None
+
+    def find_recipes(self, query: str) -> List[dict]:
+        key = normalize_key(query)
+        recipe_ids = self._recipes_by_result.get(key)
+        if not recipe_ids:
+            close = get_close_matches(key, self._recipes_by_result.keys(), n=1, cutoff=0.7)
+            recipe_ids = self._recipes_by_result[close[0]] if close else []
+        if not recipe_ids:
+            entry = self.find("recipe", query)
+            return [entry] if entry else []
+        return [self.entries["recipe"][recipe_id] for recipe_id in recipe_ids]
+
+    @staticmethod
+    def render_path(recipe_id: str) -> str:
+        return os.path.join(MC_RENDER_CACHE_DIR, f"{recipe_id.replace('/', '__')}.png")
+
+
+def import_client_jar(jar_path: str, root: str = MC_DATA_DIR, textures_dir: str = MC_ITEM_TEXTURES_DIR) -> int:
+    # copies vanilla data-pack files, en_us.json and item textures out of a client jar
+    copied = 0
+    with zipfile.ZipFile(jar_path) as jar:
+        for name in jar.namelist():
+            target = None
+            if name.startswith("data/minecraft/") and name.endswith(".json"):
+                rel = name[len("data/minecraft/"):]
+                folder, _, rest = rel.partition("/")
+                folder = LEGACY_FOLDERS.get(folder, folder)
+                rel = f"{folder}/{rest}"
+                if any(rel.startswith(f"{f}/") for f in CATEGORIES.values()):
+                    target = Path(root) / rel
+            elif name == "assets/minecraft/lang/en_us.json":
+                target = Path(root) / "lang" / "en_us.json"
+            elif name.startswith("assets/minecraft/textures/item/") and name.endswith(".png"):
+                target = Path(textures_dir) / Path(name).name
+            if target is None:
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(jar.read(name))
+            copied += 1
+    return copied
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python -m utils.mc_registry <minecraft client .jar>")
+        sys.exit(1)
+    print(f"Imported {import_client_jar(sys.argv[1])} files")
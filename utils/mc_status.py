@@ -0,0 +1,222 @@
+import asyncio
+import io
+import json
+import logging
+import random
+import struct
+import time
+from array import array
+from contextlib import suppress
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+from config import (
+    MC_SERVER_HOST,
+    MC_SERVER_PORT,
+    MC_STATUS_TIMEOUT,
+    MC_STATUS_HISTORY_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# any version works for a status ping, servers answer with their own
+PROTOCOL_VERSION = 767
+MAX_PACKET_SIZE = 2 ** 21
+
+
+def pack_varint(value: int) -> bytes:
+    value &= 0xFFFFFFFF
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def unpack_varint(data: bytes, offset: int = 0) -> Tuple[int, int]:
+    result = 0
+    for i in range(5):
+        if offset + i >= len(data):
+            raise ValueError("Truncated VarInt")
+        byte = data[offset + i]
+        result |= (byte & 0x7F) << (7 * i)
+        if not byte & 0x80:
+            if result & 0x80000000:
+                result -= 1 << 32
+            return result, offset + i + 1
+    raise ValueError("VarInt too long")
+
+
+def pack_string(value: str) -> bytes:
+    encoded = value.encode("utf-8")
+    return pack_varint(len(encoded)) + encoded
+
+
+def pack_packet(packet_id: int, payload: bytes = b"") -> bytes:
+    body = pack_varint(packet_id) + payload
+    return pack_varint(len(body)) + body
+
+
+async def read_varint(reader: asyncio.StreamReader) -> int:
+    result = 0
+    for i in range(5):
+        byte = (await reader.readexactly(1))[0]
+        result |= (byte & 0x7F) << (7 * i)
+        if not byte & 0x80:
+            return result
+    raise ValueError("VarInt too long")
+
+
+async def read_packet(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    length = await read_varint(reader)
+    if length <= 0 or length > MAX_PACKET_SIZE:
+        raise ValueError(f"Bad packet length {length}")
+    data = await reader.readexactly(length)
+    packet_id, offset = unpack_varint(data)
+    return packet_id, data[offset:]
+
+
+def flatten_motd(description: Any) -> str:
+    # the description is either a plain string or a chat component tree
+    if isinstance(description, str):
+        return description
+    if isinstance(description, list):
+        return "".join(flatten_motd(part) for part in description)
+    if isinstance(description, dict):
+        return description.get("text", "") + "".join(flatten_motd(part) for part in description.get("extra", []))
+    return ""
+
+
+async def ping_server(host: str, port: int = 25565, timeout: float = MC_STATUS_TIMEOUT) -> Dict[str, Any]:
+    # Server List Ping: handshake -> status request -> status response -> ping -> pong
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        handshake = pack_varint(PROTOCOL_VERSION) + pack_string(host) + struct.pack(">H", port) + pack_varint(1)
+        writer.write(pack_packet(0x00, handshake) + pack_packet(0x00))
+        await writer.drain()
+
+        packet_id, payload = await asyncio.wait_for(read_packet(reader), timeout)
+        if packet_id != 0x00:
+            raise ValueError(f"Unexpected status packet {packet_id:#x}")
+        length, offset = unpack_varint(payload)
+        if length < 0 or offset + length > len(payload):
+            raise ValueError("Truncated status response")
+        status = json.loads(payload[offset:offset + length].decode("utf-8"))
+
+        token = random.getrandbits(63)
+        sent = time.perf_counter()
+        writer.write(pack_packet(0x01, struct.pack(">q", token)))
+        await writer.drain()
+        packet_id, payload = await asyncio.wait_for(read_packet(reader), timeout)
+        latency = (time.perf_counter() - sent) * 1000
+        if packet_id != 0x01 or len(payload) < 8 or struct.unpack(">q", payload[:8])[0] != token:
+            raise ValueError("Bad pong")
+
+        status["latency"] = latency
+        return status
+    finally:
+        writer.close()
+        with suppress(Exception):
+            await writer.wait_closed()
+
+
+class StatusHistory:
+    # fixed-size ring of (timestamp, players, latency); players == -1 marks offline
+    def __init__(self, capacity: int = MC_STATUS_HISTORY_SIZE):
+        self.capacity = capacity
+        self.timestamps = array("d", [0.0] * capacity)
+        self.players = array("h", [0] * capacity)
+        self.latency = array("f", [0.0] * capacity)
+        self.head = 0
+        self.size = 0
+        self.last_status: Optional[Dict[str, Any]] = None
+        self.last_online: Optional[float] = None
+
+    def append(self, timestamp: float, status: Optional[Dict[str, Any]]) -> None:
+        i = self.head
+        self.timestamps[i] = timestamp
+        if status is None:
+            self.players[i] = -1
+            self.latency[i] = 0.0
+        else:
+            self.players[i] = min(status.get("players", {}).get("online", 0), 32767)
+            self.latency[i] = status.get("latency", 0.0)
+            self.last_status = status
+            self.last_online = timestamp
+        self.head = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def _indices(self):
+        start = (self.head - self.size) % self.capacity
+        return ((start + i) % self.capacity for i in range(self.size))
+
+    def latest(self) -> Optional[Tuple[float, int, float]]:
+        if not self.size:
+            return None
+        i = (self.head - 1) % self.capacity
+        return self.timestamps[i], self.players[i], self.latency[i]
+
+    def samples(self) -> List[Tuple[float, int, float]]:
+        return [(self.timestamps[i], self.players[i], self.latency[i]) for i in self._indices()]
+
+    def uptime(self) -> float:
+        if not self.size:
+            return 0.0
+        online = sum(1 for i in self._indices() if self.players[i] >= 0)
+        return online / self.size
+
+
+def render_status_graph(samples: List[Tuple[float, int, float]], size: Tuple[int, int] = (800, 300)) -> bytes:
+    width, height = size
+    bar_height = 16
+    margin = 24
+    plot_bottom = height - margin - bar_height - 8
+    plot_height = plot_bottom - margin
+
+    image = Image.new("RGB", size, (32, 34, 37))
+    draw = ImageDraw.Draw(image)
+    if len(samples) < 2:
+        draw.text((margin, margin), "Not enough samples yet", fill=(220, 220, 220))
+    else:
+        start, end = samples[0][0], samples[-1][0]
+        span = max(end - start, 1)
+        peak = max(max(p for _, p, _ in samples), 1)
+
+        def x_at(ts):
+            return margin + (ts - start) / span * (width - 2 * margin)
+
+        draw.line([(margin, plot_bottom), (width - margin, plot_bottom)], fill=(90, 90, 90))
+        points = [(x_at(ts), plot_bottom - max(p, 0) / peak * plot_height) for ts, p, _ in samples]
+        draw.line(points, fill=(0, 204, 102), width=2)
+        draw.text((margin, margin - 16), f"Players (peak {peak})", fill=(220, 220, 220))
+
+        # uptime strip, one segment per sample
+        bar_top = height - margin - bar_height
+        for (ts, players, _), (next_ts, _, _) in zip(samples, samples[1:] + [samples[-1]]):
+            color = (0, 204, 102) if players >= 0 else (204, 51, 51)
+            draw.rectangle((x_at(ts), bar_top, max(x_at(next_ts), x_at(ts) + 1), bar_top + bar_height), fill=color)
+
+    out = io.BytesIO()
+    image.save(out, format="PNG", optimize=True)
+    return out.getvalue()
+
+
+class ServerStatusPoller:
+    def __init__(self, host: str = MC_SERVER_HOST, port: int = MC_SERVER_PORT, capacity: int = MC_STATUS_HISTORY_SIZE):
+        self.host = host
+        self.port = port
+        self.history = StatusHistory(capacity)
+
+    async def poll(self) -> Optional[Dict[str, Any]]:
+        try:
+            status = await ping_server(self.host, self.port)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.info(f"Server {self.host}:{self.port} did not answer status ping: {e}")
+            status = None
+        self.history.append(time.time(), status)
+        return status
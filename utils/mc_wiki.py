@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote, urljoin
+
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import (
+    API_TIMEOUT,
+    MINECRAFT_WIKI_BASE,
+    MC_WIKI_CACHE_DIR,
+    MC_WIKI_PAGE_MAX_AGE,
+    MC_RECIPE_CACHE_TTL,
+)
+from utils.cache import BaseCache
+
+logger = logging.getLogger(__name__)
+
+# markers for the crafting grid, newest wiki markup first
+RECIPE_MARKERS = ("mcui-Crafting_Table", "crafting-table", 'class="crafting')
+RECIPE_FRAGMENT_SIZE = 16_000
+
+
+def extract_recipe_image(html: str, base_url: str) -> Optional[str]:
+    # only the crafting grid fragment gets parsed, and only its <img> tags
+    for marker in RECIPE_MARKERS:
+        index = html.find(marker)
+        if index != -1:
+            break
+    else:
+        return None
+
+    start = html.rfind("<", 0, index)
+    fragment = html[start:start + RECIPE_FRAGMENT_SIZE]
+    soup = BeautifulSoup(fragment, "html.parser", parse_only=SoupStrainer("img"))
+    img = soup.find("img", src=True)
+    if not img:
+        return None
+    return urljoin(base_url, img["src"])
+
+
+class WikiClient:
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str = MINECRAFT_WIKI_BASE,
+        cache_dir: str = MC_WIKI_CACHE_DIR,
+        max_age: int = MC_WIKI_PAGE_MAX_AGE
+    ):
+        self.session = session
+        self.base_url = base_url
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age
+        # page -> recipe image url, "" when the page has no crafting grid
+        self.recipe_images = BaseCache()
+
+    def page_url(self, page: str) -> str:
+        return f"{self.base_url}/{page}"
+
+    def _paths(self, page: str) -> Tuple[Path, Path]:
+        name = quote(page, safe="")
+        return self.cache_dir / f"{name}.html.gz", self.cache_dir / f"{name}.json"
+
+    @staticmethod
+    def _read_cached(data_path: Path, meta_path: Path) -> Tuple[Optional[str], dict]:
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with gzip.open(data_path, "rt", encoding="utf-8") as f:
+                return f.read(), meta
+        except (OSError, json.JSONDecodeError):
+            return None, {}
+
+    @staticmethod
+    def _write_cached(data_path: Path, meta_path: Path, html: Optional[str], meta: dict) -> None:
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        if html is not None:
+            with gzip.open(data_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(html)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    async def get_page(self, page: str) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        data_path, meta_path = self._paths(page)
+        html, meta = await loop.run_in_executor(None, self._read_cached, data_path, meta_path)
+
+        if html is not None and time.time() - meta.get("checked", 0) < self.max_age:
+            return html
+
+        headers = {}
+        if html is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+            async with self.session.get(self.page_url(page), headers=headers, timeout=timeout) as resp:
+                if resp.status == 304 and html is not None:
+                    meta["checked"] = time.time()
+                    await loop.run_in_executor(None, self._write_cached, data_path, meta_path, None, meta)
+                    return html
+                if resp.status != 200:
+                    logger.info(f"Wiki page {page} returned {resp.status}")
+                    return None
+                body = await resp.text()
+                meta = {
+                    "checked": time.time(),
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching wiki page {page}: {e}")
+            return html
+
+        await loop.run_in_executor(None, self._write_cached, data_path, meta_path, body, meta)
+        return body
+
+    async def get_recipe_image(self, page: str) -> Tuple[bool, Optional[str]]:
+        # returns (page found, recipe image url)
+        cached = self.recipe_images.get(page, MC_RECIPE_CACHE_TTL)
+        if cached is not None:
+            return True, cached or None
+
+        html = await self.get_page(page)
+        if html is None:
+            return False, None
+
+        loop = asyncio.get_running_loop()
+        image_url = await loop.run_in_executor(None, extract_recipe_image, html, self.base_url)
+        self.recipe_images.set(page, image_url or "")
+        return True, image_url
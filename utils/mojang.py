@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+import aiohttp
+
+from config import (
+    API_TIMEOUT,
+    MOJANG_BULK_URL,
+    MOJANG_PROFILE_FILE,
+    MOJANG_PROFILE_TTL,
+    MOJANG_NEGATIVE_TTL,
+    MOJANG_BATCH_DELAY,
+)
+from utils.helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+USERNAME_RE = re.compile(r"^[A-Za-z0-9_]{1,16}$")
+BULK_LIMIT = 10
+
+
+class ProfileCache:
+    # username -> {"id": uuid or None, "name": current name, "ts": fetched at}
+    def __init__(self, session: aiohttp.ClientSession, path: str = MOJANG_PROFILE_FILE):
+        self.session = session
+        self.path = path
+        self.names: Dict[str, dict] = FileHelper.load_json_file(path)
+        self._by_uuid: Dict[str, str] = {
+            entry["id"]: key for key, entry in self.names.items() if entry.get("id")
+        }
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._queue: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(username: str) -> str:
+        return username.strip().lower()
+
+    def _cached(self, key: str) -> Optional[dict]:
+        entry = self.names.get(key)
+        if entry is None:
+            return None
+        ttl = MOJANG_PROFILE_TTL if entry.get("id") else MOJANG_NEGATIVE_TTL
+        if time.time() - entry.get("ts", 0) > ttl:
+            return None
+        return entry
+
+    def _store(self, key: str, uuid: Optional[str], name: Optional[str]) -> None:
+        now = time.time()
+        if uuid:
+            # a uuid owns exactly one name, so a rename frees whatever name we had for it
+            old_key = self._by_uuid.get(uuid)
+            if old_key and old_key != key:
+                self.names.pop(old_key, None)
+            self._by_uuid[uuid] = key
+        else:
+            old = self.names.get(key)
+            if old and old.get("id"):
+                self._by_uuid.pop(old["id"], None)
+        self.names[key] = {"id": uuid, "name": name, "ts": now}
+
+    async def resolve(self, username: str) -> Optional[dict]:
+        return (await self.resolve_many([username])).get(self._key(username))
+
+    async def resolve_many(self, usernames: Iterable[str]) -> Dict[str, Optional[dict]]:
+        results: Dict[str, Optional[dict]] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        loop = asyncio.get_running_loop()
+
+        for username in usernames:
+            key = self._key(username)
+            if key in results or key in waiting:
+                continue
+            if not USERNAME_RE.match(key):
+                results[key] = None
+                continue
+            entry = self._cached(key)
+            if entry is not None:
+                results[key] = entry if entry.get("id") else None
+                continue
+            future = self._pending.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._pending[key] = future
+                self._queue.append(key)
+            waiting[key] = future
+
+        if waiting:
+            # let concurrent lookups pile up so they share a bulk request
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush())
+            for key, future in waiting.items():
+                results[key] = await future
+        return results
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(MOJANG_BATCH_DELAY)
+        try:
+            await self._drain_queue()
+        finally:
+            for key in self._queue:
+                future = self._pending.pop(key, None)
+                if future and not future.done():
+                    future.set_result(None)
+            self._queue = []
+        FileHelper.save_json_file(self.path, self.names)
+
+    async def _drain_queue(self) -> None:
+        while self._queue:
+            batch, self._queue = self._queue[:BULK_LIMIT], self._queue[BULK_LIMIT:]
+            found = await self._fetch_bulk(batch)
+            for key in batch:
+                future = self._pending.pop(key, None)
+                if found is None:
+                    # request failed: serve a stale entry if we have one, but don't cache the miss
+                    stale = self.names.get(key)
+                    result = stale if stale and stale.get("id") else None
+                else:
+                    profile = found.get(key)
+                    if profile:
+                        self._store(key, profile["id"], profile["name"])
+                    else:
+                        self._store(key, None, None)
+                    result = self.names[key] if profile else None
+                if future and not future.done():
+                    future.set_result(result)
+
+    async def _fetch_bulk(self, names: List[str]) -> Optional[Dict[str, dict]]:
+        try:
+            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+            async with self.session.post(MOJANG_BULK_URL, json=names, timeout=timeout) as resp:
+                if resp.status != 200:
+                    logger.warning(f"Mojang bulk lookup returned {resp.status}")
+                    return None
+                data = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Mojang bulk lookup failed: {e}")
+            return None
+        return {profile["name"].lower(): profile for profile in data if "id" in profile and "name" in profile}
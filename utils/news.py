@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from config import NEWS_SEEN_FILE, NEWS_BUFFER_SIZE, NEWS_SEEN_LIMIT
+from utils.helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+# a source returns its newest items first as
+# {"id", "title", "summary", "link", "published", "timestamp", "image"}, or None when it failed
+NewsFetch = Callable[[], Awaitable[Optional[List[dict]]]]
+
+
+class NewsAggregator:
+    def __init__(self, path: str = NEWS_SEEN_FILE, buffer_size: int = NEWS_BUFFER_SIZE, seen_limit: int = NEWS_SEEN_LIMIT):
+        self.path = path
+        self.buffer_size = buffer_size
+        # the seen-set has to outlast what a source returns, or old items would come back as new
+        self.seen_limit = max(seen_limit, buffer_size * 4)
+        self.sources: Dict[str, dict] = {}
+        self.buffers: Dict[str, Deque[dict]] = {}
+        # per source: ids in arrival order (for trimming) plus a set for lookups
+        self._seen_order: Dict[str, Deque[str]] = {
+            name: deque(ids, maxlen=self.seen_limit) for name, ids in FileHelper.load_json_file(path).items()
+        }
+        self._seen: Dict[str, set] = {name: set(ids) for name, ids in self._seen_order.items()}
+
+    def register(self, name: str, fetch: NewsFetch, label: str, color: int) -> None:
+        self.sources[name] = {"fetch": fetch, "label": label, "color": color}
+        self.buffers.setdefault(name, deque(maxlen=self.buffer_size))
+
+    def latest(self, name: str, count: int = 3) -> List[dict]:
+        return list(self.buffers.get(name, ()))[:count]
+
+    def _mark_seen(self, name: str, item_id: str) -> None:
+        order = self._seen_order.setdefault(name, deque(maxlen=self.seen_limit))
+        seen = self._seen.setdefault(name, set())
+        if len(order) == order.maxlen:
+            seen.discard(order[0])
+        order.append(item_id)
+        seen.add(item_id)
+
+    async def poll(self) -> List[Tuple[str, dict]]:
+        # -> [(source, item)] never seen before, oldest first
+        names = list(self.sources)
+        results = await asyncio.gather(
+            *(self.sources[name]["fetch"]() for name in names), return_exceptions=True
+        )
+        fresh: List[Tuple[str, dict]] = []
+        changed = False
+        for name, items in zip(names, results):
+            if isinstance(items, Exception):
+                logger.error(f"News source {name} failed: {items}")
+                continue
+            if not items:
+                continue
+            items = items[:self.buffer_size]
+            self.buffers[name] = deque(items, maxlen=self.buffer_size)
+            # a source with no history yet only records a baseline instead of flooding channels
+            baseline = name not in self._seen_order
+            for item in reversed(items):
+                item_id = str(item.get("id") or item.get("link"))
+                if item_id in self._seen.get(name, ()):
+                    continue
+                self._mark_seen(name, item_id)
+                changed = True
+                if not baseline:
+                    fresh.append((name, item))
+        if changed:
+            FileHelper.save_json_file(self.path, {name: list(ids) for name, ids in self._seen_order.items()})
+        return fresh
@@ -0,0 +1,121 @@
+import io
+import logging
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont, features
+
+from config import R6_CARD_SIZE, R6_CARD_FORMAT, R6_CARD_QUALITY
+
+logger = logging.getLogger(__name__)
+
+# everything below runs inside the process pool; the lru_caches live per worker,
+# so after the first card a worker only draws text on a copy of a ready template
+FONT_PATH = "impact.ttf"
+ACCENT = (139, 0, 0)
+STAT_LABELS = (
+    ("rp", "RANKED POINTS"),
+    ("kd", "K/D"),
+    ("wl", "WIN %"),
+    ("avg_kills", "KILLS / MATCH"),
+    ("headshot_pct", "HEADSHOT %"),
+)
+ICON_SIZE = 96
+
+
+@lru_cache(maxsize=8)
+def _font(size: int) -> ImageFont.ImageFont:
+    try:
+        return ImageFont.truetype(FONT_PATH, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+@lru_cache(maxsize=1)
+def _frame(size: Tuple[int, int]) -> Image.Image:
+    width, height = size
+    frame = Image.new("RGB", size, (24, 25, 28))
+    draw = ImageDraw.Draw(frame)
+    # vertical shading, one line per row beats per-pixel work and only runs once
+    for y in range(height):
+        shade = int(24 + 14 * y / height)
+        draw.line([(0, y), (width, y)], fill=(shade, shade, shade + 4))
+    draw.rectangle((0, 0, width, 5), fill=ACCENT)
+    draw.rectangle((0, height - 3, width, height), fill=ACCENT)
+    return frame
+
+
+@lru_cache(maxsize=1)
+def _fade_mask(size: Tuple[int, int]) -> Image.Image:
+    # operator art fades out towards the stats side
+    gradient = Image.linear_gradient("L").rotate(90).resize(size)
+    return Image.eval(gradient, lambda v: min(255, v * 2))
+
+
+@lru_cache(maxsize=32)
+def _template(background: Optional[str], size: Tuple[int, int]) -> Image.Image:
+    template = _frame(size).copy()
+    if background:
+        try:
+            with Image.open(background) as art:
+                art = art.convert("RGBA")
+                # the renders are full-body portraits; the upper part is what's worth showing
+                crop = art.crop((0, 0, art.width, min(art.height, art.width)))
+                side = size[1]
+                crop = crop.resize((side, side), Image.LANCZOS)
+                mask = Image.composite(crop.getchannel("A"), Image.new("L", crop.size), _fade_mask(crop.size))
+                template.paste(crop.convert("RGB"), (size[0] - side - 10, 0), mask)
+        except OSError as e:
+            logger.warning(f"Could not load card background {background}: {e}")
+    return template
+
+
+@lru_cache(maxsize=64)
+def _rank_icon(data: bytes) -> Optional[Image.Image]:
+    try:
+        with Image.open(io.BytesIO(data)) as icon:
+            icon = icon.convert("RGBA")
+            icon.thumbnail((ICON_SIZE, ICON_SIZE), Image.LANCZOS)
+            return icon
+    except OSError:
+        return None
+
+
+def card_format() -> Tuple[str, str]:
+    # -> (Pillow format, file extension)
+    if R6_CARD_FORMAT.upper() == "WEBP" and features.check("webp"):
+        return "WEBP", "webp"
+    return "JPEG", "jpg"
+
+
+def render_stats_card(
+    username: str,
+    platform: str,
+    display: Dict[str, str],
+    background: Optional[str] = None,
+    icon: Optional[bytes] = None,
+    size: Tuple[int, int] = R6_CARD_SIZE,
+) -> bytes:
+    card = _template(background, size).copy()
+    draw = ImageDraw.Draw(card)
+    x = 28
+    rank_icon = _rank_icon(icon) if icon else None
+    if rank_icon is not None:
+        card.paste(rank_icon, (x, 26), rank_icon)
+        x += ICON_SIZE + 18
+
+    draw.text((x, 30), username, font=_font(44), fill=(240, 240, 240))
+    draw.text((x, 84), platform.upper(), font=_font(20), fill=(170, 170, 170))
+
+    # five stats in a 3 + 2 grid below the header
+    for i, (key, label) in enumerate(STAT_LABELS):
+        col, row = i % 3, i // 3
+        sx, sy = 28 + col * 180, 150 + row * 72
+        draw.text((sx, sy), label, font=_font(16), fill=(170, 170, 170))
+        draw.text((sx, sy + 20), str(display.get(key) or "—"), font=_font(32), fill=(240, 240, 240))
+
+    fmt, _ = card_format()
+    out = io.BytesIO()
+    # method 0 is the fastest WebP encoder setting; the card is small either way
+    card.save(out, format=fmt, quality=R6_CARD_QUALITY, method=0)
+    return out.getvalue()
@@ -0,0 +1,82 @@
+import logging
+import random
+import re
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FACETS = ("role", "squad", "health", "speed", "gadget", "weapon")
+
+
+def facet_value(value: str) -> str:
+    # "Soft breach Charges" / "Soft Breach Charges" / "Claymore" / "Claymores" -> one key each
+    value = re.sub(r"[^a-z0-9]", "", value.lower())
+    return value[:-1] if len(value) > 3 and value.endswith("s") and not value.endswith("ss") else value
+
+
+class OperatorFacets:
+    # one int bitset per facet value, bit i = i-th operator in name order
+    def __init__(self, operators: dict, weapon_classes: Dict[str, str]):
+        self.keys = sorted(operators, key=lambda key: operators[key].get("name", key).lower())
+        self.names = [operators[key].get("name", key) for key in self.keys]
+        self.all = (1 << len(self.keys)) - 1
+        self.bits: Dict[str, Dict[str, int]] = {facet: {} for facet in FACETS}
+        classes = {facet_value(name): weapon_class for name, weapon_class in weapon_classes.items()}
+
+        unclassified = set()
+        for i, key in enumerate(self.keys):
+            op = operators[key]
+            values = {
+                # the odd "Attacker or Defender" entry counts as both
+                "role": op.get("role", "").lower().split(" or "),
+                "squad": [op.get("squad", "")],
+                "health": [op.get("health", "")],
+                "speed": [op.get("speed", "")],
+                "gadget": op.get("secondary_gadgets", []),
+                "weapon": [],
+            }
+            for weapon in op.get("primary_weapons", []) + op.get("secondary_weapons", []):
+                weapon_class = classes.get(facet_value(weapon))
+                if weapon_class:
+                    values["weapon"].append(weapon_class)
+                elif weapon != "None":
+                    unclassified.add(weapon)
+            for facet, facet_values in values.items():
+                for value in facet_values:
+                    if value:
+                        index = self.bits[facet]
+                        value = facet_value(value)
+                        index[value] = index.get(value, 0) | (1 << i)
+        if unclassified:
+            logger.warning(f"Weapons without a class: {', '.join(sorted(unclassified))}")
+
+    def select(self, **filters: Optional[str]) -> int:
+        # AND of every given filter; an unknown value matches nobody
+        selected = self.all
+        for facet, value in filters.items():
+            if value:
+                selected &= self.bits[facet].get(facet_value(value), 0)
+        return selected
+
+    @staticmethod
+    def _indices(selected: int):
+        while selected:
+            low = selected & -selected
+            yield low.bit_length() - 1
+            selected ^= low
+
+    def keys_for(self, selected: int) -> List[str]:
+        return [self.keys[i] for i in self._indices(selected)]
+
+    def names_for(self, selected: int) -> List[str]:
+        # bits are already in name order, no sorting per call
+        return [self.names[i] for i in self._indices(selected)]
+
+    def random_key(self, selected: int) -> Optional[str]:
+        count = selected.bit_count()
+        if not count:
+            return None
+        # skip to the n-th set bit instead of materialising the whole list
+        for _ in range(random.randrange(count)):
+            selected &= selected - 1
+        return self.keys[(selected & -selected).bit_length() - 1]
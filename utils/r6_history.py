@@ -0,0 +1,162 @@
+import hashlib
+import io
+import logging
+import math
+import os
+import struct
+import time
+from typing import List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+from config import (
+    R6_HISTORY_DIR,
+    R6_HISTORY_MIN_GAP,
+    R6_HISTORY_MAX_RECORDS,
+    R6_HISTORY_FULL_RES_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+# ts, rp, kd, win %, headshot % (NaN when Tracker didn't report it)
+RECORD = struct.Struct("<Iffff")
+FIELDS = ("rp", "kd", "wl", "headshot_pct")
+Record = Tuple[int, float, float, float, float]
+
+
+def _value(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def downsample(records: List[Record], now: float, full_res_days: int = R6_HISTORY_FULL_RES_DAYS) -> List[Record]:
+    # keep everything recent, only the last sample of each day before that
+    cutoff = now - full_res_days * 86400
+    kept: List[Record] = []
+    for record in records:
+        if record[0] < cutoff and kept and kept[-1][0] // 86400 == record[0] // 86400:
+            kept[-1] = record
+        else:
+            kept.append(record)
+    return kept
+
+
+class StatsHistory:
+    # one append-only file of fixed-size records per player, sorted by time
+    def __init__(self, root: str = R6_HISTORY_DIR):
+        self.root = root
+
+    def path(self, platform: str, username: str) -> str:
+        digest = hashlib.sha1(username.strip().lower().encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.root, f"{platform}_{digest}.bin")
+
+    def _count(self, f) -> int:
+        f.seek(0, os.SEEK_END)
+        return f.tell() // RECORD.size
+
+    def _read_at(self, f, index: int) -> Record:
+        f.seek(index * RECORD.size)
+        return RECORD.unpack(f.read(RECORD.size))
+
+    def record(self, profile: dict, ts: Optional[float] = None) -> None:
+        ts = int(ts or time.time())
+        values = profile.get("values", {})
+        record = RECORD.pack(ts, *(_value(values.get(field)) for field in FIELDS))
+        path = self.path(profile["platform"], profile["username"])
+        os.makedirs(self.root, exist_ok=True)
+        with open(path, "a+b") as f:
+            count = self._count(f)
+            if count and ts - self._read_at(f, count - 1)[0] < R6_HISTORY_MIN_GAP:
+                # too close to the previous snapshot: replace it instead of growing the file
+                f.truncate((count - 1) * RECORD.size)
+                count -= 1
+            f.seek(0, os.SEEK_END)
+            f.write(record)
+            count += 1
+        if count > R6_HISTORY_MAX_RECORDS:
+            self._compact(path, ts)
+
+    def _compact(self, path: str, now: float) -> None:
+        records = self._read_all(path)
+        kept = downsample(records, now)
+        # still too many: the oldest ones go
+        kept = kept[-R6_HISTORY_MAX_RECORDS:]
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(b"".join(RECORD.pack(*record) for record in kept))
+        os.replace(tmp, path)
+        logger.debug(f"Compacted {path}: {len(records)} -> {len(kept)} records")
+
+    def _read_all(self, path: str) -> List[Record]:
+        with open(path, "rb") as f:
+            data = f.read()
+        return list(RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size]))
+
+    def series(self, platform: str, username: str, since: float = 0) -> List[Record]:
+        # bisect on the file for the first record >= since, then one read for the rest
+        path = self.path(platform, username)
+        if not os.path.exists(path):
+            return []
+        with open(path, "rb") as f:
+            lo, hi = 0, self._count(f)
+            try:
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if self._read_at(f, mid)[0] < since:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+            except struct.error:
+                # record() replaced the last snapshot while we were reading (this runs in a thread)
+                return [record for record in self._read_all(path) if record[0] >= since]
+            f.seek(lo * RECORD.size)
+            data = f.read()
+        # an append racing this read can leave a partial record at the end
+        return list(RECORD.iter_unpack(data[:len(data) - len(data) % RECORD.size]))
+
+
+def render_trend(records: List[Record], stat: str, label: str, size: Tuple[int, int] = (700, 300)) -> bytes:
+    # runs in the process pool
+    width, height = size
+    margin, top = 48, 28
+    column = 1 + FIELDS.index(stat)
+    points = [(r[0], r[column]) for r in records if not math.isnan(r[column])]
+
+    image = Image.new("RGB", size, (32, 34, 37))
+    draw = ImageDraw.Draw(image)
+    draw.text((margin, 8), label, fill=(220, 220, 220))
+    if len(points) < 2:
+        draw.text((margin, top + 10), "Not enough snapshots yet", fill=(220, 220, 220))
+    else:
+        start, end = points[0][0], points[-1][0]
+        span = max(end - start, 1)
+        lo = min(v for _, v in points)
+        hi = max(v for _, v in points)
+        pad = (hi - lo) * 0.1 or max(abs(hi) * 0.05, 1)
+        lo, hi = lo - pad, hi + pad
+
+        def xy(ts, value):
+            return (
+                margin + (ts - start) / span * (width - margin - 16),
+                height - 24 - (value - lo) / (hi - lo) * (height - 24 - top),
+            )
+
+        for i in range(5):
+            value = lo + (hi - lo) * i / 4
+            y = xy(start, value)[1]
+            draw.line([(margin, y), (width - 16, y)], fill=(60, 62, 66))
+            draw.text((4, y - 6), f"{value:.2f}" if hi - lo < 10 else f"{value:.0f}", fill=(160, 160, 160))
+        draw.line([xy(ts, v) for ts, v in points], fill=(139, 0, 0), width=3)
+        for ts, v in points[-1:]:
+            x, y = xy(ts, v)
+            draw.ellipse((x - 4, y - 4, x + 4, y + 4), fill=(220, 60, 60))
+        first = time.strftime("%d %b %Y", time.gmtime(start))
+        last = time.strftime("%d %b %Y", time.gmtime(end))
+        draw.text((margin, height - 18), first, fill=(160, 160, 160))
+        draw.text((width - 16 - draw.textlength(last), height - 18), last, fill=(160, 160, 160))
+
+    out = io.BytesIO()
+    image.save(out, format="PNG", optimize=True)
+    return out.getvalue()
@@ -0,0 +1,123 @@
+import heapq
+import logging
+import time
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from config import R6_LINKS_FILE
+from utils.helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_STATS = ("rp", "kd", "wl")
+
+
+class LinkedAccounts:
+    # {user_id: {"platform", "username", "guilds": [..], "values": {..}, "display": {..}, "updated": ts}}
+    # plus, per guild and stat, a list of (-value, user_id) kept sorted so a leaderboard is a slice
+    def __init__(self, path: str = R6_LINKS_FILE):
+        self.path = path
+        self.accounts: Dict[str, dict] = FileHelper.load_json_file(path)
+        self.boards: Dict[str, Dict[str, List[Tuple[float, str]]]] = {}
+        for user_id, account in self.accounts.items():
+            self._index(user_id, account)
+
+    def save(self) -> None:
+        FileHelper.save_json_file(self.path, self.accounts)
+
+    def _entries(self, user_id: str, account: dict):
+        for stat in LEADERBOARD_STATS:
+            value = (account.get("values") or {}).get(stat)
+            if value is not None:
+                yield stat, (-float(value), user_id)
+
+    def _index(self, user_id: str, account: dict) -> None:
+        for guild_id in account.get("guilds", []):
+            board = self.boards.setdefault(str(guild_id), {})
+            for stat, entry in self._entries(user_id, account):
+                insort(board.setdefault(stat, []), entry)
+
+    def _unindex(self, user_id: str, account: dict) -> None:
+        for guild_id in account.get("guilds", []):
+            board = self.boards.get(str(guild_id), {})
+            for stat, entry in self._entries(user_id, account):
+                entries = board.get(stat, [])
+                i = bisect_left(entries, entry)
+                if i < len(entries) and entries[i] == entry:
+                    del entries[i]
+
+    def get(self, user_id: int) -> Optional[dict]:
+        return self.accounts.get(str(user_id))
+
+    def link(self, user_id: int, guild_id: int, profile: dict) -> None:
+        user = str(user_id)
+        old = self.accounts.get(user)
+        guilds = old.get("guilds", []) if old else []
+        if old:
+            self._unindex(user, old)
+        account = {
+            "platform": profile["platform"],
+            "username": profile["username"],
+            "guilds": sorted(set(guilds) | {guild_id}),
+            "values": profile["values"],
+            "display": profile["display"],
+            "updated": time.time(),
+        }
+        self.accounts[user] = account
+        self._index(user, account)
+        self.save()
+
+    def unlink(self, user_id: int) -> bool:
+        account = self.accounts.pop(str(user_id), None)
+        if account is None:
+            return False
+        self._unindex(str(user_id), account)
+        self.save()
+        return True
+
+    def join_guild(self, user_id: int, guild_id: int) -> None:
+        # linked in one server, show up in the others once they use the leaderboard there
+        user = str(user_id)
+        account = self.accounts.get(user)
+        if account is None or guild_id in account["guilds"]:
+            return
+        self._unindex(user, account)
+        account["guilds"].append(guild_id)
+        self._index(user, account)
+        self.save()
+
+    def update(self, user_id: str, platform: str, username: str, profile: Optional[dict]) -> None:
+        # platform/username are what was looked up; an unlink + relink in the meantime means the result is stale
+        account = self.accounts.get(user_id)
+        if account is None or account["platform"] != platform or account["username"].lower() != username.lower():
+            return
+        self._unindex(user_id, account)
+        if profile is not None:
+            account["values"] = profile["values"]
+            account["display"] = profile["display"]
+            account["username"] = profile["username"]
+        # failed refreshes also count, so a broken account doesn't hog the refresher
+        account["updated"] = time.time()
+        self._index(user_id, account)
+
+    def due(self, max_age: float, limit: int) -> List[str]:
+        # oldest first, so refreshes spread evenly over the interval
+        cutoff = time.time() - max_age
+        stale = ((a.get("updated", 0), user_id) for user_id, a in self.accounts.items() if a.get("updated", 0) < cutoff)
+        return [user_id for _, user_id in heapq.nsmallest(limit, stale)]
+
+    def top(self, guild_id: int, stat: str, limit: int = 10) -> List[Tuple[str, dict]]:
+        entries = self.boards.get(str(guild_id), {}).get(stat, [])[:limit]
+        return [(user_id, self.accounts[user_id]) for _, user_id in entries]
+
+    def rank(self, guild_id: int, stat: str, user_id: int) -> Optional[int]:
+        account = self.accounts.get(str(user_id))
+        value = (account or {}).get("values", {}).get(stat)
+        if value is None:
+            return None
+        entries = self.boards.get(str(guild_id), {}).get(stat, [])
+        i = bisect_left(entries, (-float(value), str(user_id)))
+        return i + 1 if i < len(entries) and entries[i][1] == str(user_id) else None
+
+    def size(self, guild_id: int, stat: str) -> int:
+        return len(self.boards.get(str(guild_id), {}).get(stat, []))
@@ -0,0 +1,99 @@
+import logging
+import os
+import re
+import time
+import unicodedata
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from PIL import Image
+
+from config import (
+    R6_OP_THUMBS_DIR,
+    R6_OP_THUMB_SIZE,
+    R6_OP_URLS_FILE,
+    R6_CDN_URL_TTL,
+    R6_CDN_URL_MARGIN,
+)
+from utils.helpers import FileHelper
+from utils.workers import run_in_process
+
+logger = logging.getLogger(__name__)
+
+
+def image_key(name: str) -> str:
+    # attachment filenames and cache keys: "Capitão" -> "capitao"
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii").lower()
+    return re.sub(r"[^a-z0-9]+", "_", name).strip("_") or "op"
+
+
+def make_thumbnail(src: str, dst: str, size: int = R6_OP_THUMB_SIZE) -> str:
+    # runs in the process pool; the 1500px source icons are a few MB each
+    with Image.open(src) as image:
+        image = image.convert("RGBA")
+        image.thumbnail((size, size), Image.LANCZOS)
+        tmp = f"{dst}.tmp"
+        image.save(tmp, format="WEBP", quality=80)
+    os.replace(tmp, dst)
+    return dst
+
+
+def cdn_url_expiry(url: str, stored_at: float) -> float:
+    # attachment links are signed; "ex" is the hex unix time they stop working
+    ex = parse_qs(urlparse(url).query).get("ex")
+    if ex:
+        try:
+            return int(ex[0], 16)
+        except ValueError:
+            pass
+    return stored_at + R6_CDN_URL_TTL
+
+
+class OpImageCache:
+    # small local thumbnails plus the CDN urls of anything already uploaded once
+    def __init__(self, path: str = R6_OP_URLS_FILE, thumbs_dir: str = R6_OP_THUMBS_DIR):
+        self.path = path
+        self.thumbs_dir = thumbs_dir
+        # {op_key: {kind: {"url": str, "ts": float}}}
+        self.urls: Dict[str, Dict[str, dict]] = FileHelper.load_json_file(path)
+
+    def url(self, key: str, kind: str) -> Optional[str]:
+        entry = self.urls.get(key, {}).get(kind)
+        if not entry:
+            return None
+        if cdn_url_expiry(entry["url"], entry["ts"]) - time.time() < R6_CDN_URL_MARGIN:
+            return None
+        return entry["url"]
+
+    def remember(self, key: str, kind: str, url: str) -> None:
+        self.urls.setdefault(key, {})[kind] = {"url": url, "ts": time.time()}
+        FileHelper.save_json_file(self.path, self.urls)
+
+    def thumbnail_path(self, key: str) -> str:
+        return os.path.join(self.thumbs_dir, f"{key}.webp")
+
+    def _fresh(self, key: str, src: str) -> bool:
+        dst = self.thumbnail_path(key)
+        return os.path.exists(dst) and os.path.getmtime(dst) >= os.path.getmtime(src)
+
+    async def thumbnail(self, key: str, src: Optional[str]) -> Optional[str]:
+        if not src:
+            return None
+        if self._fresh(key, src):
+            return self.thumbnail_path(key)
+        os.makedirs(self.thumbs_dir, exist_ok=True)
+        try:
+            return await run_in_process(make_thumbnail, src, self.thumbnail_path(key))
+        except OSError as e:
+            logger.warning(f"Could not build thumbnail for {key}: {e}")
+            return None
+
+    async def warm(self, sources: Iterable[Tuple[str, Optional[str]]]) -> int:
+        # build whatever is missing up front so no command pays for it
+        built = 0
+        for key, src in sources:
+            if src and not self._fresh(key, src) and await self.thumbnail(key, src):
+                built += 1
+        if built:
+            logger.info(f"Built {built} operator thumbnails")
+        return built
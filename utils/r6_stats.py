@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
+
+import aiohttp
+
+from config import (
+    API_TIMEOUT,
+    R6_API_BASE,
+    TRACKER_API_KEY,
+    R6_STATS_TTL,
+    R6_STATS_NEGATIVE_TTL,
+    R6_STATS_CONCURRENCY,
+    R6_STATS_RATE,
+    R6_STATS_BURST,
+    R6_RANK_ICON_TTL,
+)
+from utils.cache import BaseCache, SingleFlightCache
+from utils.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+PLATFORM_ALIASES = {
+    "uplay": "uplay", "pc": "uplay", "ubi": "uplay", "ubisoft": "uplay",
+    "psn": "psn", "ps": "psn", "ps4": "psn", "ps5": "psn", "playstation": "psn",
+    "xbl": "xbl", "xbox": "xbl", "xb": "xbl",
+}
+# stat name in the response -> our key; the first one present wins
+STAT_KEYS = {
+    "rp": ("rankedPoints",),
+    "kd": ("kd",),
+    "wl": ("wlPercentage",),
+    "avg_kills": ("killsPerMatch", "averageKills"),
+    "headshot_pct": ("headshotPct", "headshotPercentage"),
+}
+
+OK = "ok"
+NOT_FOUND = "not_found"
+ERROR = "error"
+
+
+def normalize_platform(platform: str) -> Optional[str]:
+    return PLATFORM_ALIASES.get(platform.strip().lower())
+
+
+def stats_key(platform: str, username: str) -> str:
+    # Ubisoft/PSN/Xbox names are case-insensitive
+    return f"{platform}:{username.strip().lower()}"
+
+
+def parse_profile(data: dict, platform: str, username: str) -> Optional[dict]:
+    segments = data.get("data", {}).get("segments") or []
+    if not segments:
+        return None
+    stats = segments[0].get("stats", {})
+    metadata = segments[0].get("metadata", {})
+    display, values = {}, {}
+    for key, names in STAT_KEYS.items():
+        stat = next((stats[name] for name in names if name in stats), {})
+        display[key] = stat.get("displayValue") or "—"
+        values[key] = stat.get("value")
+    platform_info = data.get("data", {}).get("platformInfo", {})
+    return {
+        "platform": platform,
+        "username": platform_info.get("platformUserHandle") or username,
+        "display": display,
+        "values": values,
+        "rank_icon": metadata.get("rankImageUrl") or metadata.get("iconUrl"),
+    }
+
+
+class R6StatsClient:
+    # Tracker Network profiles, cached per player; not-found players are remembered briefly too
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        base_url: str = R6_API_BASE,
+        api_key: Optional[str] = TRACKER_API_KEY,
+        history=None,
+    ):
+        self.session = session
+        self.base_url = base_url
+        self.api_key = api_key
+        self.profiles = SingleFlightCache()
+        self.missing = BaseCache()
+        self.icons = SingleFlightCache()
+        # one Tracker host; cap how many requests we have in flight against it
+        self._semaphore = asyncio.Semaphore(R6_STATS_CONCURRENCY)
+        # commands and the linked-account refresher share one API key quota
+        self.bucket = TokenBucket(R6_STATS_RATE, R6_STATS_BURST)
+        # optional StatsHistory; every fresh profile becomes a snapshot
+        self.history = history
+
+    async def get(self, platform: str, username: str, timeout: float = API_TIMEOUT) -> Tuple[str, Optional[dict]]:
+        # -> (OK, profile) / (NOT_FOUND, None) / (ERROR, None)
+        platform = normalize_platform(platform)
+        username = username.strip()
+        if platform is None or not username:
+            return NOT_FOUND, None
+        key = stats_key(platform, username)
+        if self.missing.get(key, R6_STATS_NEGATIVE_TTL):
+            return NOT_FOUND, None
+        profile = await self.profiles.get_or_fetch(
+            key, self._fetch, R6_STATS_TTL, cache_key=key, platform=platform, username=username, timeout=timeout
+        )
+        if profile is not None:
+            return OK, profile
+        return (NOT_FOUND if self.missing.get(key, R6_STATS_NEGATIVE_TTL) else ERROR), None
+
+    def cached(self, platform: str, username: str) -> Optional[dict]:
+        platform = normalize_platform(platform)
+        return self.profiles.get(stats_key(platform, username), R6_STATS_TTL) if platform else None
+
+    async def rank_icon(self, url: Optional[str]) -> Optional[bytes]:
+        # a few dozen rank images shared by every player, so they're kept for a day
+        if not url:
+            return None
+        return await self.icons.get_or_fetch(url, self._fetch_icon, R6_RANK_ICON_TTL, url=url)
+
+    async def _fetch_icon(self, url: str) -> Optional[bytes]:
+        try:
+            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)) as resp:
+                if resp.status != 200:
+                    return None
+                return await resp.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching rank icon {url}: {e}")
+            return None
+
+    async def _fetch(self, cache_key: str, platform: str, username: str, timeout: float) -> Optional[dict]:
+        url = f"{self.base_url}/profile/{platform}/{quote(username)}"
+        headers = {"TRN-Api-Key": self.api_key or "", "Accept": "application/json"}
+        await self.bucket.acquire()
+        try:
+            async with self._semaphore, self.session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                if resp.status in (400, 404):
+                    self.missing.set(cache_key, True)
+                    return None
+                if resp.status != 200:
+                    logger.warning(f"Tracker returned {resp.status} for {cache_key}")
+                    return None
+                data = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching R6 stats for {cache_key}: {e}")
+            return None
+        profile = parse_profile(data, platform, username)
+        if profile is None:
+            self.missing.set(cache_key, True)
+        elif self.history is not None:
+            try:
+                self.history.record(profile)
+            except OSError as e:
+                logger.error(f"Error recording R6 history for {cache_key}: {e}")
+        return profile
@@ -0,0 +1,195 @@
+import bisect
+import heapq
+import logging
+import math
+import re
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# question words that would otherwise turn "who uses claymores" into an empty AND
+STOPWORDS = {
+    "a", "an", "the", "of", "in", "on", "to", "is", "are", "who", "which", "what",
+    "use", "uses", "carry", "carries", "has", "have", "with", "for", "by",
+}
+NATION_ADJECTIVES = {
+    "Austria-Hungary": "austro-hungarian austrian hungarian",
+    "France": "french",
+    "Germany": "german",
+    "Italy": "italian",
+    "Russia": "russian",
+    "United Kingdom": "british uk english",
+    "United States": "american us usa",
+}
+# name hits count for more than a hit somewhere in a bio
+NAME_WEIGHT = 3
+K1 = 1.2
+B = 0.75
+
+
+def _stem(token: str) -> str:
+    # just enough to make "claymore" find "Claymores"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return [_stem(token) for token in TOKEN_RE.findall(text) if token not in STOPWORDS]
+
+
+def _flatten(value) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (int, float)):
+        yield str(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _flatten(item)
+
+
+def operator_doc(op: dict) -> Tuple[str, str]:
+    body = [
+        op.get("role", ""), op.get("squad", ""), op.get("bio", ""),
+        *op.get("primary_weapons", []), *op.get("secondary_weapons", []),
+        op.get("primary_gadget", ""), *op.get("secondary_gadgets", []),
+    ]
+    return op.get("name", ""), " ".join(filter(None, body))
+
+
+def map_doc(map_data: dict) -> Tuple[str, str]:
+    return map_data.get("name", ""), " ".join(floor.get("name", "") for floor in map_data.get("floors", []))
+
+
+def weapon_doc(weapon: dict) -> Tuple[str, str]:
+    body = [weapon.get("type", ""), weapon.get("description", ""), *_flatten(weapon.get("tech", []))]
+    return weapon.get("name", ""), " ".join(filter(None, body))
+
+
+def plane_doc(plane: dict) -> Tuple[str, str]:
+    nation = plane.get("nation", "")
+    body = [nation, NATION_ADJECTIVES.get(nation, ""), str(plane.get("year", "")), *_flatten(plane.get("specs", {}))]
+    return plane.get("name", ""), " ".join(filter(None, body))
+
+
+def _intersect(a: array, b: array) -> array:
+    # walk the shorter list, bisect into the longer one from where the last hit was
+    if len(a) > len(b):
+        a, b = b, a
+    out = array("I")
+    lo = 0
+    for doc in a:
+        lo = bisect.bisect_left(b, doc, lo)
+        if lo == len(b):
+            break
+        if b[lo] == doc:
+            out.append(doc)
+    return out
+
+
+def _union(lists: List[array]) -> array:
+    out = array("I")
+    for doc in heapq.merge(*lists):
+        if not out or out[-1] != doc:
+            out.append(doc)
+    return out
+
+
+class SearchIndex:
+    # postings are sorted doc-id arrays with a parallel term-frequency array
+    def __init__(self):
+        self.docs: List[Tuple[str, str, str]] = []  # (kind, key, display name)
+        self.kinds: Dict[str, array] = {}
+        self.postings: Dict[str, array] = {}
+        self.freqs: Dict[str, array] = {}
+        self.lengths = array("I")
+        self.avg_length = 0.0
+
+    def add(self, kind: str, key: str, name: str, body: str, aliases: Iterable[str] = ()) -> None:
+        # name is what gets displayed; aliases only add name-weighted terms
+        doc = len(self.docs)
+        self.docs.append((kind, key, name))
+        self.kinds.setdefault(kind, array("I")).append(doc)
+        # the kind is a term too, so "french planes" narrows to planes
+        terms = Counter(tokenize(f"{kind} {body}"))
+        for token in tokenize(" ".join([name, *aliases])):
+            terms[token] += NAME_WEIGHT
+        # doc ids only grow, so appending keeps every posting list sorted
+        for term, count in terms.items():
+            self.postings.setdefault(term, array("I")).append(doc)
+            self.freqs.setdefault(term, array("H")).append(min(count, 65535))
+        self.lengths.append(sum(terms.values()))
+
+    def finish(self) -> "SearchIndex":
+        self.avg_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        logger.info(f"Search index: {len(self.docs)} documents, {len(self.postings)} terms")
+        return self
+
+    @classmethod
+    def build(cls, operators: dict, maps: dict, weapons: dict, planes: list) -> "SearchIndex":
+        index = cls()
+        for key, op in (operators or {}).items():
+            index.add("operator", key, *operator_doc(op), aliases=op.get("aliases", []))
+        for key, map_data in (maps or {}).items():
+            index.add("map", key, *map_doc(map_data))
+        for key, weapon in (weapons or {}).items():
+            index.add("weapon", key, *weapon_doc(weapon))
+        for i, plane in enumerate(planes or []):
+            index.add("plane", str(i), *plane_doc(plane))
+        return index.finish()
+
+    def _idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.docs) - df + 0.5) / (df + 0.5))
+
+    def _match(self, query: str) -> Tuple[array, List[str]]:
+        # "a b OR c d" -> (a AND b) OR (c AND d)
+        groups, terms = [], []
+        for clause in re.split(r"\s+(?:OR|or|\|)\s+|\|", query):
+            tokens = list(dict.fromkeys(tokenize(clause)))
+            if not tokens:
+                continue
+            terms.extend(tokens)
+            lists = sorted((self.postings.get(token, array("I")) for token in tokens), key=len)
+            matched = lists[0]
+            for postings in lists[1:]:
+                if not matched:
+                    break
+                matched = _intersect(matched, postings)
+            groups.append(matched)
+        return _union(groups) if len(groups) > 1 else (groups[0] if groups else array("I")), list(dict.fromkeys(terms))
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 10) -> Tuple[int, List[Tuple[float, Tuple[str, str, str]]]]:
+        # -> (number of matches, top hits as (score, (kind, key, name)))
+        matched, terms = self._match(query)
+        if kind is not None:
+            matched = _intersect(matched, self.kinds.get(kind, array("I")))
+        if not matched:
+            return 0, []
+
+        scores = dict.fromkeys(matched, 0.0)
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self._idf(term)
+            freqs = self.freqs[term]
+            if len(matched) < len(postings):
+                hits = ((bisect.bisect_left(postings, doc), doc) for doc in matched)
+                hits = ((i, doc) for i, doc in hits if i < len(postings) and postings[i] == doc)
+            else:
+                hits = ((i, doc) for i, doc in enumerate(postings) if doc in scores)
+            for i, doc in hits:
+                tf = freqs[i]
+                norm = K1 * (1 - B + B * self.lengths[doc] / self.avg_length)
+                scores[doc] += idf * tf * (K1 + 1) / (tf + norm)
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return len(matched), [(score, self.docs[doc]) for doc, score in top]
@@ -0,0 +1,97 @@
+import asyncio
+import html
+import logging
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import aiohttp
+
+from config import API_TIMEOUT, CACHE_DURATION, STEAM_NEWS_URL, STEAM_NEWS_COUNT
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_LENGTH = 200
+_MARKUP = re.compile(r"<[^>]+>|\[/?[a-z0-9*]+(?:=[^\]]*)?\]|\{STEAM_CLAN_IMAGE\}\S*", re.IGNORECASE)
+
+
+def clean_contents(contents: str, length: int = SUMMARY_LENGTH) -> str:
+    # Steam posts mix html, bbcode and clan image placeholders
+    text = " ".join(html.unescape(_MARKUP.sub(" ", contents or "")).split())
+    return text[:length] + "..." if len(text) > length else text
+
+
+def parse_news_items(data: dict, count: int = STEAM_NEWS_COUNT) -> List[dict]:
+    # same shape the news embeds have always used
+    items = []
+    for item in data.get("appnews", {}).get("newsitems", [])[:count]:
+        published = datetime.fromtimestamp(item.get("date", 0), timezone.utc)
+        items.append({
+            "gid": item.get("gid"),
+            "title": item.get("title", "Untitled"),
+            "published": published.strftime("%a, %d %b %Y"),
+            "timestamp": item.get("date", 0),
+            "summary": clean_contents(item.get("contents", "")),
+            "link": item.get("url"),
+        })
+    return items
+
+
+class SteamNews:
+    # one cache entry per app id, shared by every cog that shows Steam news
+    def __init__(self, session: aiohttp.ClientSession, url: str = STEAM_NEWS_URL, max_age: int = CACHE_DURATION):
+        self.session = session
+        self.url = url
+        self.max_age = max_age
+        self._entries: Dict[int, dict] = {}
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    async def get(self, appid: int, count: int = STEAM_NEWS_COUNT) -> Optional[List[dict]]:
+        entry = self._entries.get(appid)
+        if entry and time.time() - entry["checked"] < self.max_age:
+            return entry["items"][:count]
+        async with self._locks.setdefault(appid, asyncio.Lock()):
+            # someone else may have refreshed while we waited
+            entry = self._entries.get(appid)
+            if entry and time.time() - entry["checked"] < self.max_age:
+                return entry["items"][:count]
+            entry = await self._fetch(appid, entry)
+        return entry["items"][:count] if entry else None
+
+    async def _fetch(self, appid: int, entry: Optional[dict]) -> Optional[dict]:
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        # official announcements only, the rest of the feed is third-party press
+        params = {
+            "appid": appid,
+            "count": STEAM_NEWS_COUNT,
+            "maxlength": SUMMARY_LENGTH * 2,
+            "feeds": "steam_community_announcements",
+            "format": "json",
+        }
+        try:
+            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+            async with self.session.get(self.url, params=params, headers=headers, timeout=timeout) as resp:
+                if resp.status == 304 and entry:
+                    entry["checked"] = time.time()
+                    return entry
+                if resp.status != 200:
+                    logger.warning(f"Steam news for {appid} returned {resp.status}")
+                    return entry
+                data = await resp.json(content_type=None)
+                entry = {
+                    "items": parse_news_items(data, STEAM_NEWS_COUNT),
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                    "checked": time.time(),
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.error(f"Error fetching Steam news for {appid}: {e}")
+            # keep serving whatever we had
+            return entry
+        self._entries[appid] = entry
+        return entry
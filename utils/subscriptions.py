@@ -0,0 +1,57 @@
+import logging
+from typing import Dict, List, Optional
+
+from utils.helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelSubscriptions:
+    # {guild_id: {topic: channel_id}} persisted as json
+    def __init__(self, path: str):
+        self.path = path
+        self.guilds: Dict[str, Dict[str, int]] = FileHelper.load_json_file(path)
+
+    def save(self) -> None:
+        FileHelper.save_json_file(self.path, self.guilds)
+
+    def subscribe(self, guild_id: int, topics: List[str], channel_id: int) -> None:
+        guild = self.guilds.setdefault(str(guild_id), {})
+        for topic in topics:
+            guild[topic] = channel_id
+        self.save()
+
+    def unsubscribe(self, guild_id: int, topics: Optional[List[str]] = None) -> int:
+        guild = self.guilds.get(str(guild_id), {})
+        removed = 0
+        for topic in list(guild):
+            if topics is None or topic in topics:
+                del guild[topic]
+                removed += 1
+        if not guild:
+            self.guilds.pop(str(guild_id), None)
+        self.save()
+        return removed
+
+    def topics_for(self, guild_id: int) -> Dict[str, int]:
+        return dict(self.guilds.get(str(guild_id), {}))
+
+    def channels_for(self, topic: str) -> List[int]:
+        return [topics[topic] for topics in self.guilds.values() if topic in topics]
+
+
+def migrate_topic(src_path: str, dst_path: str, topic: str, new_topic: Optional[str] = None) -> int:
+    # moves every guild's <topic> channel from one subscription file into another
+    src = ChannelSubscriptions(src_path)
+    moved = {guild_id: topics.pop(topic) for guild_id, topics in src.guilds.items() if topic in topics}
+    if not moved:
+        return 0
+    dst = ChannelSubscriptions(dst_path)
+    for guild_id, channel_id in moved.items():
+        # a subscription already made in the new place wins
+        dst.guilds.setdefault(guild_id, {}).setdefault(new_topic or topic, channel_id)
+    dst.save()
+    src.guilds = {guild_id: topics for guild_id, topics in src.guilds.items() if topics}
+    src.save()
+    logger.info(f"Moved {len(moved)} '{topic}' subscription(s) from {src_path} to {dst_path}")
+    return len(moved)
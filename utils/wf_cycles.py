@@ -0,0 +1,101 @@
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# epoch = unix time at which the first phase began; phases are (state, seconds) in order.
+# the epochs only need to be close, correct() snaps them to the worldstate expiries
+CYCLES: Dict[str, dict] = {
+    "earth": {
+        "name": "Earth",
+        "section": "earthCycle",
+        "epoch": 0,
+        "phases": [("day", 4 * 3600), ("night", 4 * 3600)],
+    },
+    "cetus": {
+        "name": "Cetus (Plains of Eidolon)",
+        "section": "cetusCycle",
+        "epoch": 1510444800,
+        "phases": [("day", 100 * 60), ("night", 50 * 60)],
+    },
+    "vallis": {
+        "name": "Orb Vallis",
+        "section": "vallisCycle",
+        "epoch": 1541837628,
+        "phases": [("warm", 400), ("cold", 1200)],
+    },
+    "cambion": {
+        "name": "Cambion Drift",
+        "section": "cambionCycle",
+        # runs on the Cetus clock
+        "epoch": 1510444800,
+        "phases": [("fass", 100 * 60), ("vome", 50 * 60)],
+    },
+}
+
+
+def _parse_expiry(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class CycleClock:
+    def __init__(self, table: Dict[str, dict] = CYCLES):
+        self.table = table
+        self.epochs = {key: cycle["epoch"] for key, cycle in table.items()}
+        self.corrected_at: Optional[float] = None
+
+    @staticmethod
+    def period(cycle: dict) -> int:
+        return sum(duration for _, duration in cycle["phases"])
+
+    def state(self, key: str, now: Optional[float] = None) -> Tuple[str, float, str]:
+        # -> (current phase, seconds until it ends, next phase)
+        cycle = self.table[key]
+        phases = cycle["phases"]
+        offset = ((now or time.time()) - self.epochs[key]) % self.period(cycle)
+        for i, (phase, duration) in enumerate(phases):
+            if offset < duration:
+                return phase, duration - offset, phases[(i + 1) % len(phases)][0]
+            offset -= duration
+        # float rounding at the very end of the period
+        return phases[0][0], 0.0, phases[1 % len(phases)][0]
+
+    def states(self, now: Optional[float] = None) -> List[Tuple[str, str, float, str]]:
+        now = now or time.time()
+        return [(key, *self.state(key, now)) for key in self.table]
+
+    def correct(self, worldstate: Optional[dict]) -> int:
+        # re-anchors each epoch on the reported end of the current phase
+        if not worldstate:
+            return 0
+        corrected = 0
+        for key, cycle in self.table.items():
+            section = worldstate.get(cycle["section"]) or {}
+            expiry = _parse_expiry(section.get("expiry"))
+            phase_end = 0
+            for phase, duration in cycle["phases"]:
+                phase_end += duration
+                if phase == section.get("state"):
+                    break
+            else:
+                continue
+            if expiry is None:
+                continue
+            period = self.period(cycle)
+            epoch = (expiry - phase_end) % period
+            shift = (epoch - self.epochs[key]) % period
+            drift = min(shift, period - shift)
+            if drift > 1:
+                logger.info(f"Re-anchored {key} cycle by {drift:.0f}s")
+            self.epochs[key] = epoch
+            corrected += 1
+        if corrected:
+            self.corrected_at = time.time()
+        return corrected
@@ -0,0 +1,256 @@
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from config import WF_DROPS_FILE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"WFDT"
+VERSION = 1
+# magic, version, strings, string bytes, rows, items, places
+HEADER = struct.Struct("<4sIIIIII")
+HEADER_SIZE = 32
+RELIC_STATES = ("Intact", "Exceptional", "Flawless", "Radiant")
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
+
+
+def compile_drops(rows: Iterable[dict], out_path: str) -> int:
+    # rows are drops.warframestat.us "slim" records: {"item", "place", "rarity", "chance"}
+    strings: List[str] = []
+    interned: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        sid = interned.get(value)
+        if sid is None:
+            sid = interned[value] = len(strings)
+            strings.append(value)
+        return sid
+
+    records = []
+    for row in rows:
+        item, place = row.get("item"), row.get("place")
+        if not item or not place:
+            continue
+        records.append((intern(item), intern(place), intern(row.get("rarity") or ""), float(row.get("chance") or 0)))
+
+    # rows grouped by item (case-insensitive name order), best chance first
+    records.sort(key=lambda r: (strings[r[0]].lower(), strings[r[0]], -r[3]))
+    item_ids, place_ids, rarity_ids, chances = array("I"), array("I"), array("I"), array("f")
+    for item_id, place_id, rarity_id, chance in records:
+        item_ids.append(item_id)
+        place_ids.append(place_id)
+        rarity_ids.append(rarity_id)
+        chances.append(chance)
+
+    def index(column: array, order: List[int]) -> Tuple[array, array, array, array]:
+        # (sorted key string ids, start, count) over a permutation of row numbers
+        keys, starts, counts, perm = array("I"), array("I"), array("I"), array("I")
+        for row in order:
+            if not keys or keys[-1] != column[row]:
+                keys.append(column[row])
+                starts.append(len(perm))
+                counts.append(0)
+            counts[-1] += 1
+            perm.append(row)
+        return keys, starts, counts, perm
+
+    item_keys, item_starts, item_counts, _ = index(item_ids, list(range(len(records))))
+    place_order = sorted(
+        range(len(records)),
+        key=lambda r: (strings[place_ids[r]].lower(), strings[place_ids[r]], -chances[r])
+    )
+    place_keys, place_starts, place_counts, place_perm = index(place_ids, place_order)
+
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = array("I", [0])
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    blob = b"".join(encoded)
+
+    tmp = f"{out_path}.tmp"
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(strings), len(blob), len(records), len(item_keys), len(place_keys))
+                .ljust(HEADER_SIZE, b"\0"))
+        f.write(offsets.tobytes())
+        f.write(_pad(blob))
+        for column in (item_ids, place_ids, rarity_ids, chances,
+                       item_keys, item_starts, item_counts,
+                       place_keys, place_starts, place_counts, place_perm):
+            f.write(column.tobytes())
+    os.replace(tmp, out_path)
+    return len(records)
+
+
+def compile_drops_file(src_path: str, out_path: str = WF_DROPS_FILE) -> int:
+    with open(src_path, "r", encoding="utf-8") as f:
+        return compile_drops(json.load(f), out_path)
+
+
+class _Keys:
+    # lazily decoded, lowercased view of an index's key column for bisect
+    def __init__(self, table: "DropTable", keys: memoryview):
+        self.table = table
+        self.keys = keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, i: int) -> str:
+        return self.table.string(self.keys[i]).lower()
+
+
+class DropTable:
+    # read-only view over a compiled drop table; nothing is parsed or copied up front
+    def __init__(self, path: str = WF_DROPS_FILE):
+        self.path = path
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._views: List[memoryview] = []
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def loaded(self) -> bool:
+        return self._mm is not None
+
+    def open(self) -> bool:
+        self.close()
+        if not os.path.exists(self.path):
+            return False
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_strings, n_bytes, n_rows, n_items, n_places = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            logger.error(f"{self.path} is not a version {VERSION} drop table")
+            self.close()
+            return False
+
+        buffer = memoryview(self._mm)
+        self._views.append(buffer)
+        pos = HEADER_SIZE
+
+        def take(count: int, fmt: str) -> memoryview:
+            nonlocal pos
+            view = buffer[pos:pos + count * 4].cast(fmt)
+            self._views.append(view)
+            pos += count * 4
+            return view
+
+        self.offsets = take(n_strings + 1, "I")
+        self.blob = buffer[pos:pos + n_bytes]
+        self._views.append(self.blob)
+        pos += n_bytes + (-n_bytes % 4)
+        self.item_ids = take(n_rows, "I")
+        self.place_ids = take(n_rows, "I")
+        self.rarity_ids = take(n_rows, "I")
+        self.chances = take(n_rows, "f")
+        self.item_keys, self.item_starts, self.item_counts = (take(n_items, "I") for _ in range(3))
+        self.place_keys, self.place_starts, self.place_counts = (take(n_places, "I") for _ in range(3))
+        self.place_perm = take(n_rows, "I")
+        self.items = _Keys(self, self.item_keys)
+        self.places = _Keys(self, self.place_keys)
+        self.rows = n_rows
+        logger.info(f"Opened drop table: {n_rows} drops, {n_items} items, {n_places} sources")
+        return True
+
+    def close(self) -> None:
+        # views must be released before the map can close
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.rows = 0
+
+    def string(self, sid: int) -> str:
+        return bytes(self.blob[self.offsets[sid]:self.offsets[sid + 1]]).decode("utf-8")
+
+    @staticmethod
+    def _prefix_range(keys: _Keys, prefix: str) -> Tuple[int, int]:
+        prefix = prefix.strip().lower()
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + "￿", lo=start)
+        return start, end
+
+    def search_items(self, prefix: str, limit: int = 25) -> List[str]:
+        if not self.loaded:
+            return []
+        start, end = self._prefix_range(self.items, prefix)
+        return [self.string(self.item_keys[i]) for i in range(start, min(end, start + limit))]
+
+    def search_places(self, prefix: str, limit: int = 25) -> List[str]:
+        if not self.loaded:
+            return []
+        start, end = self._prefix_range(self.places, prefix)
+        return [self.string(self.place_keys[i]) for i in range(start, min(end, start + limit))]
+
+    def find_item(self, name: str) -> Optional[int]:
+        # exact (case-insensitive) match, else the first name starting with it
+        if not self.loaded:
+            return None
+        start, end = self._prefix_range(self.items, name)
+        if start == end:
+            return None
+        return start
+
+    def drops_for(self, index: int) -> Tuple[str, List[Tuple[str, str, float]]]:
+        # -> (item name, [(place, rarity, chance)]) best chance first
+        start = self.item_starts[index]
+        rows = range(start, start + self.item_counts[index])
+        return self.string(self.item_keys[index]), [
+            (self.string(self.place_ids[r]), self.string(self.rarity_ids[r]), self.chances[r]) for r in rows
+        ]
+
+    def rewards_for_prefix(self, prefix: str) -> Dict[str, List[Tuple[str, str, float]]]:
+        # every source starting with prefix -> [(item, rarity, chance)]
+        result: Dict[str, List[Tuple[str, str, float]]] = defaultdict(list)
+        if not self.loaded:
+            return result
+        start, end = self._prefix_range(self.places, prefix)
+        for i in range(start, end):
+            place = self.string(self.place_keys[i])
+            first = self.place_starts[i]
+            for r in self.place_perm[first:first + self.place_counts[i]]:
+                result[place].append((self.string(self.item_ids[r]), self.string(self.rarity_ids[r]), self.chances[r]))
+        return result
+
+    def relic(self, name: str) -> Tuple[Optional[str], Dict[str, List[Tuple[str, str, float]]]]:
+        # "axi a1" / "Axi A1 Relic" -> ("Axi A1 Relic", {"Intact": [...], ...})
+        base = name.strip()
+        if not base.lower().endswith(" relic"):
+            base = f"{base} relic"
+        by_place = self.rewards_for_prefix(base)
+        if not by_place:
+            return None, {}
+        states: Dict[str, List[Tuple[str, str, float]]] = {}
+        title = None
+        for place, rewards in by_place.items():
+            title, _, state = place.partition(" (")
+            states[state.rstrip(")") or "Intact"] = rewards
+        return title, states
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("usage: python -m utils.wf_drops <all.slim.json> [output .bin]")
+        sys.exit(1)
+    count = compile_drops_file(*sys.argv[1:])
+    print(f"Compiled {count} drops into {sys.argv[2] if len(sys.argv) == 3 else WF_DROPS_FILE}")
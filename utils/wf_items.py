@@ -0,0 +1,156 @@
+import asyncio
+import gzip
+import heapq
+import json
+import logging
+import os
+import re
+import time
+from bisect import bisect_left
+from difflib import get_close_matches
+from typing import Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+from config import API_TIMEOUT, WF_MARKET_API, WF_ITEMS_FILE, WF_ITEMS_REFRESH
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize_name(value: str) -> str:
+    return " ".join(TOKEN_RE.findall(value.lower()))
+
+
+class ItemCatalog:
+    # warframe.market tradable items, kept on disk as gzipped [[slug, name], ...]
+    def __init__(self, session: aiohttp.ClientSession, path: str = WF_ITEMS_FILE, base_url: str = WF_MARKET_API):
+        self.session = session
+        self.path = path
+        self.base_url = base_url
+        self.fetched_at: Optional[float] = None
+        self.slugs: List[str] = []
+        self.names: List[str] = []
+        self.normalized: List[str] = []
+        self.by_slug: Dict[str, int] = {}
+        self.by_name: Dict[str, int] = {}
+        self.tokens: Dict[str, List[int]] = {}
+        self.sorted_tokens: List[str] = []
+        self._lock = asyncio.Lock()
+        self.load()
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    @property
+    def stale(self) -> bool:
+        return self.fetched_at is None or time.time() - self.fetched_at > WF_ITEMS_REFRESH
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error loading item catalog {self.path}: {e}")
+            return
+        self._build(data.get("items", []))
+        self.fetched_at = data.get("fetched")
+
+    def _save(self, items: List[List[str]]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump({"fetched": self.fetched_at, "items": items}, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+    def _build(self, items: List[List[str]]) -> None:
+        slugs, names, normalized, by_slug, by_name = [], [], [], {}, {}
+        tokens: Dict[str, List[int]] = {}
+        for slug, name in sorted(items, key=lambda item: item[1].lower()):
+            i = len(slugs)
+            slugs.append(slug)
+            names.append(name)
+            normalized.append(normalize_name(name))
+            by_slug[slug] = i
+            by_name.setdefault(normalized[i], i)
+            for token in set(TOKEN_RE.findall(name.lower())):
+                tokens.setdefault(token, []).append(i)
+        # swap in whole so lookups never see a half-built index
+        self.slugs, self.names, self.normalized = slugs, names, normalized
+        self.by_slug, self.by_name = by_slug, by_name
+        self.tokens, self.sorted_tokens = tokens, sorted(tokens)
+
+    async def refresh(self) -> bool:
+        async with self._lock:
+            try:
+                timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+                async with self.session.get(f"{self.base_url}/items", timeout=timeout) as resp:
+                    if resp.status != 200:
+                        logger.warning(f"Item catalog refresh failed: {resp.status}")
+                        return False
+                    data = await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error refreshing item catalog: {e}")
+                return False
+            items = [
+                [item["url_name"], item["item_name"]]
+                for item in data.get("payload", {}).get("items", [])
+                if item.get("url_name") and item.get("item_name")
+            ]
+            if not items:
+                return False
+            self.fetched_at = time.time()
+            self._build(items)
+            await asyncio.get_running_loop().run_in_executor(None, self._save, items)
+            logger.info(f"Item catalog refreshed: {len(items)} items")
+            return True
+
+    def resolve(self, query: str) -> Optional[Tuple[str, str]]:
+        # exact slug or exact name only; anything else is for search()
+        query = query.strip()
+        i = self.by_slug.get(query.lower())
+        if i is None:
+            i = self.by_name.get(normalize_name(query))
+        return (self.slugs[i], self.names[i]) if i is not None else None
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        matches: Set[int] = set()
+        start = bisect_left(self.sorted_tokens, prefix)
+        for token in self.sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            matches.update(self.tokens[token])
+        return matches
+
+    def search(self, query: str, limit: int = 25) -> List[Tuple[str, str]]:
+        words = TOKEN_RE.findall(query.lower())
+        if not words:
+            return []
+        normalized = " ".join(words)
+        candidates: Optional[Set[int]] = None
+        # longest word first keeps the intersection small
+        for word in sorted(words, key=len, reverse=True):
+            found = self._prefix_matches(word)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                # typo: fall back to the slower fuzzy match over whole names
+                close = get_close_matches(normalized, self.by_name.keys(), n=limit, cutoff=0.6)
+                return [(self.slugs[self.by_name[name]], self.names[self.by_name[name]]) for name in close]
+
+        def rank(i: int):
+            name = self.normalized[i]
+            if name == normalized:
+                tier = 0
+            elif name.startswith(normalized):
+                tier = 1
+            elif name.startswith(words[0]):
+                tier = 2
+            else:
+                tier = 3
+            return tier, len(name), i
+
+        best = heapq.nsmallest(limit, candidates, key=rank)
+        return [(self.slugs[i], self.names[i]) for i in best]
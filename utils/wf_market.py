@@ -0,0 +1,148 @@
+import asyncio
+import codecs
+import heapq
+import json
+import logging
+import statistics
+from array import array
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+import aiohttp
+
+from config import (
+    API_TIMEOUT,
+    WF_MARKET_API,
+    WF_MARKET_SUMMARY_TTL,
+    WF_MARKET_TOP_N,
+    WF_MARKET_RATE,
+    WF_MARKET_BURST,
+)
+from utils.cache import SingleFlightCache
+from utils.ratelimit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 16 * 1024
+_WHITESPACE = " \t\r\n,"
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes], key: str) -> AsyncIterator[Any]:
+    # yields the elements of the first "<key>": [...] array without holding the whole body
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    marker = f'"{key}"'
+    buffer = ""
+    in_array = False
+    async for chunk in chunks:
+        buffer += utf8.decode(chunk)
+        if not in_array:
+            start = buffer.find(marker)
+            bracket = buffer.find("[", start + len(marker)) if start != -1 else -1
+            if bracket == -1:
+                # marker not seen yet: keep enough of the tail to match one split across chunks;
+                # marker seen but no "[" yet: keep it whole for the next chunk
+                buffer = buffer[-len(marker):] if start == -1 else buffer[start:]
+                continue
+            buffer = buffer[bracket + 1:]
+            in_array = True
+
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                value, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # element continues in the next chunk
+                break
+            yield value
+        buffer = buffer[pos:]
+
+
+class OrderSummary:
+    # in-game sellers only; a bounded heap for the cheapest top_n plus a flat array of prices for the median
+    def __init__(self, top_n: int = WF_MARKET_TOP_N):
+        self.top_n = top_n
+        self.heap = []
+        self.prices = array("i")
+
+    def add(self, order: dict) -> None:
+        if order.get("order_type") != "sell" or order.get("user", {}).get("status") != "ingame":
+            return
+        platinum = order.get("platinum")
+        if platinum is None:
+            return
+        platinum = int(platinum)
+        seq = len(self.prices)
+        self.prices.append(platinum)
+        entry = (-platinum, -seq, {
+            "platinum": platinum,
+            "quantity": order.get("quantity", 1),
+            "seller": order.get("user", {}).get("ingame_name", "Unknown"),
+        })
+        if len(self.heap) < self.top_n:
+            heapq.heappush(self.heap, entry)
+        elif entry > self.heap[0]:
+            heapq.heapreplace(self.heap, entry)
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "count": len(self.prices),
+            "min": min(self.prices) if self.prices else None,
+            "median": statistics.median(self.prices) if self.prices else None,
+            "top": [order for _, _, order in sorted(self.heap, reverse=True)],
+        }
+
+
+def summarize_orders(orders: Iterable[dict], top_n: int = WF_MARKET_TOP_N) -> Dict[str, Any]:
+    summary = OrderSummary(top_n)
+    for order in orders:
+        summary.add(order)
+    return summary.result()
+
+
+class MarketClient:
+    def __init__(self, session: aiohttp.ClientSession, base_url: str = WF_MARKET_API, history=None):
+        self.session = session
+        self.base_url = base_url
+        # optional PriceHistory, fed with every summary actually fetched
+        self.history = history
+        self.summaries = SingleFlightCache()
+        # warframe.market allows ~3 requests/s per client, commands and pollers alike
+        self.bucket = TokenBucket(WF_MARKET_RATE, WF_MARKET_BURST)
+
+    @staticmethod
+    def slugify(item: str) -> str:
+        return item.strip().lower().replace(" ", "_")
+
+    async def summary(self, item: str) -> Optional[Dict[str, Any]]:
+        # None on a failed request, {} when the item doesn't exist
+        slug = self.slugify(item)
+        return await self.summaries.get_or_fetch(slug, self._fetch_summary, WF_MARKET_SUMMARY_TTL, slug=slug)
+
+    async def _fetch_summary(self, slug: str) -> Optional[Dict[str, Any]]:
+        url = f"{self.base_url}/items/{slug}/orders"
+        await self.bucket.acquire()
+        try:
+            timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+            async with self.session.get(url, timeout=timeout) as resp:
+                if resp.status == 404:
+                    return {}
+                if resp.status != 200:
+                    logger.warning(f"warframe.market returned {resp.status} for {slug}")
+                    return None
+                summary = OrderSummary()
+                async for order in iter_json_array(resp.content.iter_chunked(CHUNK_SIZE), "orders"):
+                    summary.add(order)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching orders for {slug}: {e}")
+            return None
+        result = summary.result()
+        result["slug"] = slug
+        if self.history is not None and result["count"]:
+            self.history.record(slug, result["min"], result["median"])
+        return result
@@ -0,0 +1,275 @@
+import io
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw
+
+from config import WF_PRICE_HISTORY_FILE, WF_PRICE_HISTORY_MAX_ITEMS
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"WFPH"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sII")  # magic, version, slot count
+FILE_HEADER_SIZE = 64
+
+MINUTE_SLOTS = 24 * 60  # one day at minute resolution
+HOUR_SLOTS = 90 * 24  # 90 days at hour resolution
+MINUTE_SPAN = MINUTE_SLOTS * 60
+HOUR_SPAN = HOUR_SLOTS * 3600
+
+# slug, minute head/count, hour head/count,
+# current hour accumulator (hour, sum min, sum median, n, low, high),
+# rolling sums (24h of minute mins, 90d of hourly mins), last sample (ts, min, median)
+SLOT_HEADER = struct.Struct("<64sIIIIqddIffdIdIIff")
+SLOT_HEADER_SIZE = 192
+MINUTE_REC = struct.Struct("<Iff")  # ts, min, median
+HOUR_REC = struct.Struct("<Iffff")  # hour start, avg min, avg median, low, high
+MINUTE_OFFSET = SLOT_HEADER_SIZE
+HOUR_OFFSET = MINUTE_OFFSET + MINUTE_SLOTS * MINUTE_REC.size
+SLOT_SIZE = HOUR_OFFSET + HOUR_SLOTS * HOUR_REC.size
+
+FIELDS = (
+    "slug", "minute_head", "minute_count", "hour_head", "hour_count",
+    "acc_hour", "acc_sum_min", "acc_sum_median", "acc_n", "acc_low", "acc_high",
+    "day_sum", "day_n", "long_sum", "long_n", "last_ts", "last_min", "last_median",
+)
+
+
+class PriceHistory:
+    # fixed-width slot per item in one memory-mapped file: a minute ring for the last day,
+    # an hour ring for the last 90 days, and running sums so stats never walk the rings
+    def __init__(self, path: str = WF_PRICE_HISTORY_FILE, max_items: int = WF_PRICE_HISTORY_MAX_ITEMS):
+        self.path = path
+        self.max_items = max_items
+        self.slots: Dict[str, int] = {}
+        self._file = None
+        self._mm: Optional[mmap.mmap] = None
+        self._open()
+
+    def _open(self) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) < FILE_HEADER_SIZE
+        self._file = open(self.path, "w+b" if new else "r+b")
+        if new:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION, 0).ljust(FILE_HEADER_SIZE, b"\0"))
+            self._file.flush()
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, version, count = FILE_HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} price history file")
+        for slot in range(count):
+            slug = self._header(slot)["slug"]
+            self.slots[slug] = slot
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _base(self, slot: int) -> int:
+        return FILE_HEADER_SIZE + slot * SLOT_SIZE
+
+    def _header(self, slot: int) -> dict:
+        values = SLOT_HEADER.unpack_from(self._mm, self._base(slot))
+        header = dict(zip(FIELDS, values))
+        header["slug"] = header["slug"].rstrip(b"\0").decode("utf-8")
+        return header
+
+    def _write_header(self, slot: int, header: dict) -> None:
+        values = [header[field] for field in FIELDS]
+        values[0] = header["slug"].encode("utf-8")[:64]
+        SLOT_HEADER.pack_into(self._mm, self._base(slot), *values)
+
+    def _allocate(self, slug: str) -> Optional[int]:
+        if len(self.slots) >= self.max_items:
+            return None
+        slot = len(self.slots)
+        self._mm.flush()
+        self._mm.close()
+        self._file.truncate(self._base(slot + 1))
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        header = dict.fromkeys(FIELDS, 0)
+        header.update(slug=slug, acc_hour=-1)
+        self._write_header(slot, header)
+        FILE_HEADER.pack_into(self._mm, 0, MAGIC, VERSION, slot + 1)
+        self.slots[slug] = slot
+        return slot
+
+    def _minute_at(self, slot: int, index: int) -> Tuple[int, float, float]:
+        return MINUTE_REC.unpack_from(self._mm, self._base(slot) + MINUTE_OFFSET + index * MINUTE_REC.size)
+
+    def _hour_at(self, slot: int, index: int) -> Tuple[int, float, float, float, float]:
+        return HOUR_REC.unpack_from(self._mm, self._base(slot) + HOUR_OFFSET + index * HOUR_REC.size)
+
+    def _flush_hour(self, slot: int, h: dict) -> None:
+        # fold the finished hour into the hour ring, dropping what falls out of the 90 day window
+        if h["acc_n"]:
+            if h["hour_count"] == HOUR_SLOTS:
+                h["long_sum"] -= self._hour_at(slot, h["hour_head"])[1]
+                h["long_n"] -= 1
+                h["hour_count"] -= 1
+            avg_min = h["acc_sum_min"] / h["acc_n"]
+            HOUR_REC.pack_into(
+                self._mm, self._base(slot) + HOUR_OFFSET + h["hour_head"] * HOUR_REC.size,
+                h["acc_hour"] * 3600, avg_min, h["acc_sum_median"] / h["acc_n"], h["acc_low"], h["acc_high"]
+            )
+            h["hour_head"] = (h["hour_head"] + 1) % HOUR_SLOTS
+            h["hour_count"] += 1
+            h["long_sum"] += avg_min
+            h["long_n"] += 1
+        h.update(acc_sum_min=0.0, acc_sum_median=0.0, acc_n=0, acc_low=0.0, acc_high=0.0)
+
+    def _expire(self, slot: int, h: dict, now: int) -> None:
+        while h["minute_count"]:
+            oldest = (h["minute_head"] - h["minute_count"]) % MINUTE_SLOTS
+            ts, low, _ = self._minute_at(slot, oldest)
+            if ts > now - MINUTE_SPAN:
+                break
+            h["day_sum"] -= low
+            h["day_n"] -= 1
+            h["minute_count"] -= 1
+        while h["hour_count"]:
+            oldest = (h["hour_head"] - h["hour_count"]) % HOUR_SLOTS
+            ts, avg_min = self._hour_at(slot, oldest)[:2]
+            if ts > now - HOUR_SPAN:
+                break
+            h["long_sum"] -= avg_min
+            h["long_n"] -= 1
+            h["hour_count"] -= 1
+
+    def record(self, slug: str, low: float, median: float, ts: Optional[float] = None) -> bool:
+        if low is None or median is None:
+            return False
+        slot = self.slots.get(slug)
+        if slot is None:
+            slot = self._allocate(slug)
+            if slot is None:
+                logger.debug(f"Price history full, not tracking {slug}")
+                return False
+        ts = int(ts or time.time())
+        h = self._header(slot)
+
+        hour = ts // 3600
+        if hour != h["acc_hour"]:
+            self._flush_hour(slot, h)
+            h["acc_hour"] = hour
+        h["acc_low"] = low if not h["acc_n"] else min(h["acc_low"], low)
+        h["acc_high"] = low if not h["acc_n"] else max(h["acc_high"], low)
+        h["acc_sum_min"] += low
+        h["acc_sum_median"] += median
+        h["acc_n"] += 1
+
+        # a second sample in the same minute replaces the first
+        last = (h["minute_head"] - 1) % MINUTE_SLOTS
+        if h["minute_count"] and self._minute_at(slot, last)[0] // 60 == ts // 60:
+            h["day_sum"] -= self._minute_at(slot, last)[1]
+            h["day_n"] -= 1
+            index = last
+        else:
+            if h["minute_count"] == MINUTE_SLOTS:
+                h["day_sum"] -= self._minute_at(slot, h["minute_head"])[1]
+                h["day_n"] -= 1
+                h["minute_count"] -= 1
+            index = h["minute_head"]
+            h["minute_head"] = (index + 1) % MINUTE_SLOTS
+            h["minute_count"] += 1
+        MINUTE_REC.pack_into(self._mm, self._base(slot) + MINUTE_OFFSET + index * MINUTE_REC.size, ts, low, median)
+        h["day_sum"] += low
+        h["day_n"] += 1
+        h.update(last_ts=ts, last_min=low, last_median=median)
+
+        self._expire(slot, h, ts)
+        self._write_header(slot, h)
+        return True
+
+    def stats(self, slug: str, now: Optional[float] = None) -> Optional[dict]:
+        slot = self.slots.get(slug)
+        if slot is None:
+            return None
+        h = self._header(slot)
+        if not h["last_ts"]:
+            return None
+        now = int(now or time.time())
+        # age out the windows on a copy of the header, nothing is written back
+        self._expire(slot, h, now)
+        # 24h low/high from the last 24 hourly aggregates plus the open hour
+        lows, highs = [], []
+        if h["acc_n"]:
+            lows.append(h["acc_low"])
+            highs.append(h["acc_high"])
+        cutoff = now - MINUTE_SPAN
+        for i in range(min(h["hour_count"], 24)):
+            ts, _, _, low, high = self._hour_at(slot, (h["hour_head"] - 1 - i) % HOUR_SLOTS)
+            if ts < cutoff:
+                break
+            lows.append(low)
+            highs.append(high)
+        long_n = h["long_n"] + (1 if h["acc_n"] else 0)
+        long_sum = h["long_sum"] + (h["acc_sum_min"] / h["acc_n"] if h["acc_n"] else 0)
+        return {
+            "last_ts": h["last_ts"],
+            "last_min": h["last_min"],
+            "last_median": h["last_median"],
+            "avg_24h": h["day_sum"] / h["day_n"] if h["day_n"] else None,
+            "low_24h": min(lows) if lows else None,
+            "high_24h": max(highs) if highs else None,
+            "avg_90d": long_sum / long_n if long_n else None,
+            "samples_24h": h["day_n"],
+        }
+
+    def series(self, slug: str, span: int) -> List[Tuple[int, float, float]]:
+        # minute samples for spans up to a day, hourly averages beyond that
+        slot = self.slots.get(slug)
+        if slot is None:
+            return []
+        h = self._header(slot)
+        cutoff = h["last_ts"] - span
+        if span <= MINUTE_SPAN:
+            records = (self._minute_at(slot, (h["minute_head"] - h["minute_count"] + i) % MINUTE_SLOTS)
+                       for i in range(h["minute_count"]))
+            return [rec for rec in records if rec[0] >= cutoff]
+        records = (self._hour_at(slot, (h["hour_head"] - h["hour_count"] + i) % HOUR_SLOTS)
+                   for i in range(h["hour_count"]))
+        series = [(ts, low, median) for ts, low, median, _, _ in records if ts >= cutoff]
+        if h["acc_n"]:
+            series.append((h["acc_hour"] * 3600, h["acc_sum_min"] / h["acc_n"], h["acc_sum_median"] / h["acc_n"]))
+        return series
+
+
+def render_sparkline(series: List[Tuple[int, float, float]], size: Tuple[int, int] = (600, 160)) -> bytes:
+    # runs in the process pool
+    width, height = size
+    margin = 12
+    image = Image.new("RGB", size, (32, 34, 37))
+    draw = ImageDraw.Draw(image)
+    if len(series) < 2:
+        draw.text((margin, margin), "Not enough samples yet", fill=(220, 220, 220))
+    else:
+        start, end = series[0][0], series[-1][0]
+        span = max(end - start, 1)
+        values = [v for _, low, median in series for v in (low, median)]
+        lo, hi = min(values), max(values)
+        scale = max(hi - lo, 1)
+
+        def point(ts, value):
+            return (
+                margin + (ts - start) / span * (width - 2 * margin),
+                height - margin - (value - lo) / scale * (height - 2 * margin - 14),
+            )
+
+        draw.line([point(ts, median) for ts, _, median in series], fill=(120, 120, 120), width=1)
+        draw.line([point(ts, low) for ts, low, _ in series], fill=(0, 175, 240), width=2)
+        draw.text((margin, 2), f"{hi:.0f}p", fill=(220, 220, 220))
+        draw.text((margin, height - margin), f"{lo:.0f}p", fill=(220, 220, 220))
+    out = io.BytesIO()
+    image.save(out, format="PNG", optimize=True)
+    return out.getvalue()
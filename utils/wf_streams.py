@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+import aiohttp
+
+from config import API_TIMEOUT, WF_STREAMS_API, WF_STREAMS_REFRESH, WF_STREAMS_SOON
+
+logger = logging.getLogger(__name__)
+
+
+def parse_time(value: Any) -> Optional[float]:
+    # the API has used both ISO strings and epoch (s or ms) numbers
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if value > 1e12 else float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def stream_key(stream: dict) -> tuple:
+    # the same stream comes back with different fields from /upcoming and /active
+    if stream.get("id"):
+        return ("id", stream["id"])
+    return (stream.get("title"), stream.get("start_ts"))
+
+
+class StreamSchedule:
+    # upcoming + active streams as one snapshot; upcoming kept sorted by start time
+    def __init__(self, session: aiohttp.ClientSession, base_url: str = WF_STREAMS_API):
+        self.session = session
+        self.base_url = base_url
+        self.upcoming: List[dict] = []
+        self.starts: List[float] = []
+        self.active: List[dict] = []
+        self.fetched_at: Optional[float] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def stale(self) -> bool:
+        return self.fetched_at is None or time.time() - self.fetched_at > WF_STREAMS_REFRESH
+
+    async def _fetch(self, path: str) -> Optional[list]:
+        timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+        async with self.session.get(f"{self.base_url}/streams/{path}", timeout=timeout) as resp:
+            if resp.status != 200:
+                logger.warning(f"Streams {path} returned {resp.status}")
+                return None
+            data = await resp.json()
+            return data if isinstance(data, list) else []
+
+    async def _refresh(self) -> bool:
+        try:
+            upcoming, active = await asyncio.gather(self._fetch("upcoming"), self._fetch("active"))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error refreshing stream schedule: {e}")
+            return False
+        if upcoming is None or active is None:
+            return False
+        for stream in upcoming + active:
+            stream["start_ts"] = parse_time(stream.get("startTime"))
+            stream["end_ts"] = parse_time(stream.get("endTime"))
+        upcoming = sorted((s for s in upcoming if s["start_ts"] is not None), key=lambda s: s["start_ts"])
+        self.upcoming, self.starts = upcoming, [s["start_ts"] for s in upcoming]
+        self.active = active
+        self.fetched_at = time.time()
+        return True
+
+    async def refresh(self) -> bool:
+        # concurrent callers share whichever refresh is already running
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return await asyncio.shield(self._refresh_task)
+
+    async def get(self) -> bool:
+        # stale-while-revalidate: only the very first call waits on the network
+        if self.fetched_at is None:
+            return await self.refresh()
+        if self.stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return True
+
+    def live(self, now: Optional[float] = None) -> List[dict]:
+        now = now or time.time()
+        # scheduled streams whose start has passed but haven't shown up as active yet
+        started = [
+            s for s in self.upcoming[:bisect_right(self.starts, now)]
+            if s["end_ts"] is not None and s["end_ts"] > now
+        ]
+        seen = {stream_key(s) for s in self.active}
+        return self.active + [s for s in started if stream_key(s) not in seen]
+
+    def soon(self, now: Optional[float] = None, within: float = WF_STREAMS_SOON) -> List[dict]:
+        now = now or time.time()
+        return self.upcoming[bisect_left(self.starts, now):bisect_right(self.starts, now + within)]
+
+    def next(self, now: Optional[float] = None, limit: int = 5) -> List[dict]:
+        now = now or time.time()
+        start = bisect_left(self.starts, now)
+        return self.upcoming[start:start + limit]
@@ -0,0 +1,66 @@
+import logging
+from typing import Dict, List, Tuple
+
+from config import WF_WATCHLIST_FILE
+from utils.helpers import FileHelper
+
+logger = logging.getLogger(__name__)
+
+
+def condition_met(direction: str, threshold: int, price: int) -> bool:
+    return price < threshold if direction == "below" else price > threshold
+
+
+class PriceWatchlist:
+    # {slug: {"name": str, "watchers": {user_id: {"threshold", "direction", "triggered"}}}}
+    # keyed by item so a poll costs one lookup per distinct item, however many people watch it
+    def __init__(self, path: str = WF_WATCHLIST_FILE):
+        self.path = path
+        self.items: Dict[str, dict] = FileHelper.load_json_file(path)
+
+    def save(self) -> None:
+        FileHelper.save_json_file(self.path, self.items)
+
+    def add(self, user_id: int, slug: str, name: str, threshold: int, direction: str) -> None:
+        item = self.items.setdefault(slug, {"name": name, "watchers": {}})
+        item["watchers"][str(user_id)] = {"threshold": threshold, "direction": direction, "triggered": False}
+        self.save()
+
+    def remove(self, user_id: int, slug: str) -> bool:
+        item = self.items.get(slug)
+        if not item or item["watchers"].pop(str(user_id), None) is None:
+            return False
+        if not item["watchers"]:
+            del self.items[slug]
+        self.save()
+        return True
+
+    def for_user(self, user_id: int) -> List[Tuple[str, str, dict]]:
+        user = str(user_id)
+        return [
+            (slug, item["name"], item["watchers"][user])
+            for slug, item in self.items.items()
+            if user in item["watchers"]
+        ]
+
+    def slugs(self) -> List[str]:
+        return list(self.items)
+
+    def check(self, slug: str, price: int) -> List[Tuple[int, dict]]:
+        # edge-triggered: a watch fires once when its condition becomes true and
+        # re-arms only after the price has moved back across the threshold
+        item = self.items.get(slug)
+        if not item:
+            return []
+        crossed = []
+        changed = False
+        for user_id, watch in item["watchers"].items():
+            met = condition_met(watch["direction"], watch["threshold"], price)
+            if met != watch["triggered"]:
+                watch["triggered"] = met
+                changed = True
+                if met:
+                    crossed.append((int(user_id), watch))
+        if changed:
+            self.save()
+        return crossed
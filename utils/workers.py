@@ -0,0 +1,32 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Optional
+
+from config import PROCESS_POOL_WORKERS
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PROCESS_POOL_WORKERS)
+        logger.info(f"Started process pool with {PROCESS_POOL_WORKERS} workers")
+    return _pool
+
+
+async def run_in_process(func, *args, **kwargs):
+    # func and its arguments must be picklable (module-level functions, bytes, tuples)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_process_pool(), partial(func, *args, **kwargs))
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,162 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+from config import API_TIMEOUT, WF_API_BASE
+
+logger = logging.getLogger(__name__)
+
+
+class WorldstateStore:
+    # one /pc document, refreshed in the background; every /wf command reads a section of it
+    def __init__(self, session: aiohttp.ClientSession, url: str = WF_API_BASE):
+        self.session = session
+        self.url = url
+        self.data: Optional[dict] = None
+        self.fetched_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def age(self) -> Optional[float]:
+        return None if self.fetched_at is None else time.time() - self.fetched_at
+
+    async def refresh(self) -> bool:
+        async with self._lock:
+            try:
+                timeout = aiohttp.ClientTimeout(total=API_TIMEOUT)
+                async with self.session.get(self.url, params={"language": "en"}, timeout=timeout) as resp:
+                    if resp.status != 200:
+                        logger.error(f"Worldstate refresh failed: {resp.status}")
+                        return False
+                    data = await resp.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Error refreshing worldstate: {e}")
+                return False
+            self.data = data
+            self.fetched_at = time.time()
+            return True
+
+    async def ensure_loaded(self) -> bool:
+        # only hits the network before the first background refresh has landed
+        if self.data is None:
+            async with self._lock:
+                pass
+            if self.data is None:
+                await self.refresh()
+        return self.data is not None
+
+    def get(self, section: str, default: Any = None) -> Any:
+        if self.data is None:
+            return default
+        return self.data.get(section, default)
+
+
+# relative-time strings and flags that change on every fetch without anything happening
+VOLATILE_KEYS = {"eta", "expired", "asString", "startString", "endString", "expiry"}
+
+
+def _stable(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _stable(v) for k, v in value.items() if k not in VOLATILE_KEYS and not k.endswith("String")}
+    if isinstance(value, list):
+        return [_stable(v) for v in value]
+    return value
+
+
+def section_hash(value: Any) -> str:
+    encoded = json.dumps(_stable(value), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _ids(items: Optional[list]) -> Dict[str, dict]:
+    return {item.get("id"): item for item in items or [] if isinstance(item, dict) and item.get("id")}
+
+
+def diff_void_trader(old: Optional[dict], new: Optional[dict]) -> List[dict]:
+    old, new = old or {}, new or {}
+    if not old.get("active") and new.get("active"):
+        return [{
+            "type": "baro",
+            "title": "Baro Ki'Teer has arrived",
+            "description": f"At **{new.get('location', 'Unknown')}** with {len(new.get('inventory', []))} items. "
+                           f"Leaving in {new.get('endString', 'unknown')}.",
+        }]
+    if old.get("active") and not new.get("active"):
+        return [{
+            "type": "baro",
+            "title": "Baro Ki'Teer has left",
+            "description": f"Next visit in {new.get('startString', 'unknown')} at {new.get('location', 'Unknown')}.",
+        }]
+    return []
+
+
+def diff_nightwave(old: Optional[dict], new: Optional[dict]) -> List[dict]:
+    old_acts = _ids((old or {}).get("activeChallenges"))
+    added = [act for act_id, act in _ids((new or {}).get("activeChallenges")).items() if act_id not in old_acts]
+    if not added:
+        return []
+    return [{
+        "type": "nightwave",
+        "title": "New Nightwave acts",
+        "description": "\n".join(f"**{act.get('title')}** ({act.get('reputation')} Rep) – {act.get('desc', '')}" for act in added),
+    }]
+
+
+def diff_fissures(old: Optional[list], new: Optional[list]) -> List[dict]:
+    old_items = _ids(old)
+    added = [item for item_id, item in _ids(new).items() if item_id not in old_items]
+    if not added:
+        return []
+    lines = [
+        f"**{f.get('tier')}** {f.get('missionType')} – {f.get('node')}{' (Steel Path)' if f.get('isHard') else ''}"
+        for f in added[:15]
+    ]
+    if len(added) > 15:
+        lines.append(f"…and {len(added) - 15} more")
+    return [{"type": "fissures", "title": "New Void Fissures", "description": "\n".join(lines)}]
+
+
+def diff_sortie(old: Optional[dict], new: Optional[dict]) -> List[dict]:
+    if not new or (old or {}).get("id") == new.get("id"):
+        return []
+    lines = [f"**{v.get('missionType')}** – {v.get('node')} ({v.get('modifier')})" for v in new.get("variants", [])]
+    return [{
+        "type": "sortie",
+        "title": f"New Sortie: {new.get('boss', 'Unknown')} ({new.get('faction', 'Unknown')})",
+        "description": "\n".join(lines),
+    }]
+
+
+SECTION_DIFFS: Dict[str, Callable[[Any, Any], List[dict]]] = {
+    "voidTrader": diff_void_trader,
+    "nightwave": diff_nightwave,
+    "fissures": diff_fissures,
+    "sortie": diff_sortie,
+}
+# news is pushed by the news aggregator (/news subscribe)
+EVENT_TYPES = ["baro", "nightwave", "fissures", "sortie"]
+
+
+class WorldstateDiff:
+    def __init__(self):
+        self.hashes: Dict[str, str] = {}
+        self.previous: Dict[str, Any] = {}
+
+    def diff(self, data: dict) -> List[dict]:
+        events = []
+        for section, differ in SECTION_DIFFS.items():
+            value = data.get(section)
+            digest = section_hash(value)
+            if self.hashes.get(section) == digest:
+                continue
+            # the first snapshot after startup is only a baseline
+            if section in self.hashes:
+                events.extend(differ(self.previous.get(section), value))
+            self.hashes[section] = digest
+            self.previous[section] = value
+        return events